@@ -18,23 +18,98 @@
 # Copyright (c) 2020 DecisionScients                                           #
 # ============================================================================ #
 # %%
+import os
+
+import numpy as np
 import pandas as pd
 from pytest import fixture
 
+from .src.data.cache import CACHE_ENV, ColumnarCache
 from .src.data.listings import DataSet, DataGroup
 
+SNAPSHOTS = ['2019-10-14', '2019-11-01', '2019-12-04']
+
+def make_listings(n=500, seed=0):
+    """Creates a listings DataFrame formatted as in Inside Airbnb files."""
+    rng = np.random.RandomState(seed)
+    price = rng.lognormal(5, 0.6, n).round()
+    df = pd.DataFrame()
+    df['id'] = np.arange(1000, 1000 + n)
+    df['listing_url'] = ["https://www.airbnb.com/rooms/%d" % i for i in df['id']]
+    df['name'] = rng.choice(['Cozy loft', 'Sunny room', 'Victorian flat', 
+                             'Studio near park'], n)
+    df['description'] = rng.choice(['Walk to the Mission.', 'Quiet street.',
+                                    None, 'Great views!'], n)
+    df['host_id'] = rng.randint(1, n // 3, n)
+    df['host_since'] = pd.to_datetime('2010-01-01') + \
+        pd.to_timedelta(rng.randint(0, 3000, n), unit='D')
+    df['host_since'] = df['host_since'].dt.strftime('%Y-%m-%d')
+    df['host_response_rate'] = [None if r > 90 else "%d%%" % r 
+                                for r in rng.randint(50, 101, n)]
+    df['host_is_superhost'] = rng.choice(['t', 'f'], n)
+    df['neighbourhood_cleansed'] = rng.choice(['Mission', 'Castro', 'Nob Hill',
+                                               'Presidio', 'SoMa'], n)
+    df['city'] = 'San Francisco'
+    df['latitude'] = 37.7 + rng.rand(n) / 10
+    df['longitude'] = -122.4 - rng.rand(n) / 10
+    df['room_type'] = rng.choice(['Entire home/apt', 'Private room',
+                                  'Shared room'], n, p=[0.6, 0.35, 0.05])
+    df['accommodates'] = rng.randint(1, 9, n)
+    df['bedrooms'] = np.where(rng.rand(n) < 0.05, np.nan, rng.randint(0, 5, n))
+    df['price'] = ["${:,.2f}".format(p) for p in price]
+    df['weekly_price'] = [None if rng.rand() < 0.8 else "${:,.2f}".format(p * 6) 
+                          for p in price]
+    df['cleaning_fee'] = [None if rng.rand() < 0.2 else "${:,.2f}".format(p / 4)
+                          for p in price]
+    df['minimum_nights'] = rng.randint(1, 31, n)
+    df['number_of_reviews'] = rng.poisson(20, n)
+    df['review_scores_rating'] = np.where(rng.rand(n) < 0.2, np.nan, 
+                                          rng.randint(60, 101, n))
+    df['instant_bookable'] = rng.choice(['t', 'f'], n)
+    df['reviews_per_month'] = np.where(df['number_of_reviews'] == 0, np.nan,
+                                       rng.rand(n) * 5)
+    return df
+
+@fixture(scope="session", autouse=True)
+def isolate_cache(tmp_path_factory):
+    """Keeps the default columnar cache of the tests out of the user cache."""
+    previous = os.environ.get(CACHE_ENV)
+    os.environ[CACHE_ENV] = str(tmp_path_factory.mktemp("cache"))
+    yield
+    if previous is None:
+        del os.environ[CACHE_ENV]
+    else:
+        os.environ[CACHE_ENV] = previous
+
+@fixture(scope="session")
+def get_listings_dir(tmp_path_factory):
+    """Writes synthetic snapshots in the Inside Airbnb raw data layout."""
+    directory = os.path.join(str(tmp_path_factory.mktemp("raw")), "test-city", "2019")
+    os.makedirs(directory)
+    for i, snapshot in enumerate(SNAPSHOTS):
+        df = make_listings(seed=i)
+        filename = "ca_test-city_{date}_data_listings.csv.gz".format(date=snapshot)
+        df.to_csv(os.path.join(directory, filename), index=False)
+    return directory
+
+@fixture(scope="session")
+def get_listings_file(get_listings_dir):
+    filename = "ca_test-city_{date}_data_listings.csv.gz".format(date=SNAPSHOTS[-1])
+    return os.path.join(get_listings_dir, filename)
+
 @fixture(scope="session")
-def get_dataset():
+def get_dataset(tmp_path_factory):
     sf = "./data/raw/san-francisco/2019/ca_san-francisco_2019-12-04_data_listings.csv.gz"
-    ds = DataSet(sf)
+    ds = DataSet(sf, cache=ColumnarCache(str(tmp_path_factory.mktemp("cache"))))
     ds.load()
     return ds
 
 @fixture(scope="session")
-def get_datagroup():
+def get_datagroup(tmp_path_factory):
     path = "./data/raw/san-francisco/2019/"
     name = 'san-francisco_2019'        
-    dg = DataGroup(name=name) 
+    dg = DataGroup(name=name, 
+                   cache=ColumnarCache(str(tmp_path_factory.mktemp("cache"))))
     dg.add_dataset_from_path(path)    
     return dg
 
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : missing.py                                                        #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 9:58:40 pm                     #
+# Last Modified : Saturday, October 17th 2026, 9:58:40 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""This module contains the missing value profiler.
+
+A MissingnessProfile is computed from the isna() bitmap of each chunk of
+data in a single vectorized pass. It accumulates the missing count of
+each column, a histogram of the missing count of each row, the frequency
+of each missing-value pattern, with rows bit-packed into bytes, and the
+co-missingness matrix of column pairs. Each of these is additive, so
+profiles of chunks, files or DataGroup members merge exactly.
+"""
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+COLUMN_BUCKETS = [(0.000, 0.000), (0.0001, 0.250), (0.251, 0.500), (0.501, 1.000)]
+ROW_BUCKETS = [(0.000, 0.000), (0.0001, 0.100), (0.101, 0.250), (0.251, 1)]
+
+# --------------------------------------------------------------------------- #
+#                           MissingnessProfile                                #
+# --------------------------------------------------------------------------- #
+class MissingnessProfile:
+    """Mergeable profile of missing values.
+
+    Parameters
+    ----------
+    columns : list (Optional)
+        The columns profiled. Defaults to the columns of the first chunk.
+        Columns absent from a chunk count as missing in its rows, as when
+        the chunks are stacked.
+    patterns : bool
+        If True, the frequencies of missing-value patterns are counted.
+    comissing : bool
+        If True, the co-missingness matrix is accumulated.
+
+    """
+
+    def __init__(self, columns=None, patterns=True, comissing=True):
+        self._columns = []
+        self._rows = 0
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._row_hist = np.zeros(1, dtype=np.int64)
+        self._patterns = Counter() if patterns else None
+        self._comissing = np.zeros((0, 0), dtype=np.int64) if comissing else None
+        if columns is not None:
+            self._expand(list(columns))
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def _expand(self, columns):
+        """Adds columns, which are missing in all rows profiled so far."""
+        new = [c for c in columns if c not in self._columns]
+        if not new:
+            return
+        n, k = len(self._columns), len(new)
+        self._columns = self._columns + new
+        self._counts = np.concatenate([self._counts,
+                                       np.full(k, self._rows, dtype=np.int64)])
+        # Every row profiled so far gains k missing values.
+        self._row_hist = np.concatenate([np.zeros(k, dtype=np.int64),
+                                         self._row_hist])
+        if self._comissing is not None:
+            comissing = np.zeros((n + k, n + k), dtype=np.int64)
+            comissing[:n, :n] = self._comissing
+            comissing[n:, :n] = self._counts[:n]
+            comissing[:n, n:] = self._counts[:n, None]
+            comissing[n:, n:] = self._rows
+            self._comissing = comissing
+        if self._patterns:
+            patterns = Counter()
+            for pattern, count in self._patterns.items():
+                bits = np.unpackbits(np.frombuffer(pattern, dtype=np.uint8),
+                                     count=n)
+                bits = np.concatenate([bits, np.ones(k, dtype=np.uint8)])
+                patterns[np.packbits(bits).tobytes()] += count
+            self._patterns = patterns
+
+    def update(self, df):
+        """Profiles a chunk of data."""
+        self._expand(list(df.columns))
+        isna = df.isna()
+        present = [c for c in self._columns if c in isna.columns]
+        if len(present) == len(self._columns):
+            mask = isna[self._columns].to_numpy(dtype=bool)
+        else:
+            mask = np.ones((df.shape[0], len(self._columns)), dtype=bool)
+            positions = [self._columns.index(c) for c in present]
+            mask[:, positions] = isna[present].to_numpy(dtype=bool)
+        self._update_mask(mask)
+        return self
+
+    def _update_mask(self, mask):
+        self._rows += mask.shape[0]
+        self._counts += mask.sum(axis=0)
+        by_row = mask.sum(axis=1)
+        self._row_hist += np.bincount(by_row, minlength=self._row_hist.shape[0])
+        if self._comissing is not None and mask.shape[0]:
+            # Products of 0/1 values summed over fewer than 2**24 rows are
+            # exact in float32, which uses BLAS rather than integer loops.
+            for start in range(0, mask.shape[0], 1 << 23):
+                block = mask[start:start + (1 << 23)].astype(np.float32)
+                self._comissing += np.rint(block.T @ block).astype(np.int64)
+        if self._patterns is not None and mask.shape[0]:
+            packed = np.ascontiguousarray(np.packbits(mask, axis=1))
+            keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+            unique, counts = np.unique(keys, return_counts=True)
+            for pattern, count in zip(unique, counts):
+                self._patterns[pattern.tobytes()] += int(count)
+
+    def merge(self, other):
+        """Adds the profile of other data, e.g. another DataGroup member."""
+        merged = MissingnessProfile(patterns=self._patterns is not None and
+                                    other._patterns is not None,
+                                    comissing=self._comissing is not None and
+                                    other._comissing is not None)
+        for profile in (self, other):
+            profile = profile._aligned(self._columns + [
+                c for c in other._columns if c not in self._columns])
+            if merged._rows == 0 and not merged._columns:
+                merged._expand(profile._columns)
+            merged._rows += profile._rows
+            merged._counts += profile._counts
+            merged._row_hist += profile._row_hist
+            if merged._comissing is not None:
+                merged._comissing += profile._comissing
+            if merged._patterns is not None:
+                merged._patterns.update(profile._patterns)
+        return merged
+
+    def _aligned(self, columns):
+        """Returns a copy of the profile over columns, in that order."""
+        profile = MissingnessProfile(patterns=self._patterns is not None,
+                                     comissing=self._comissing is not None)
+        profile._columns = list(self._columns)
+        profile._rows = self._rows
+        profile._counts = self._counts.copy()
+        profile._row_hist = self._row_hist.copy()
+        profile._comissing = None if self._comissing is None \
+            else self._comissing.copy()
+        profile._patterns = None if self._patterns is None \
+            else Counter(self._patterns)
+        profile._expand(columns)
+        if profile._columns == list(columns):
+            return profile
+        order = np.array([profile._columns.index(c) for c in columns])
+        profile._columns = list(columns)
+        profile._counts = profile._counts[order]
+        if profile._comissing is not None:
+            profile._comissing = profile._comissing[np.ix_(order, order)]
+        if profile._patterns is not None:
+            patterns = Counter()
+            n = len(columns)
+            for pattern, count in profile._patterns.items():
+                bits = np.unpackbits(np.frombuffer(pattern, dtype=np.uint8),
+                                     count=n)[order]
+                patterns[np.packbits(bits).tobytes()] += count
+            profile._patterns = patterns
+        return profile
+
+    # ------------------------------------------------------------------------ #
+    #                               RESULTS                                    #
+    # ------------------------------------------------------------------------ #
+    def column_rates(self):
+        """Returns the proportion of missing values in each column."""
+        return pd.Series(self._counts / max(self._rows, 1), index=self._columns)
+
+    def row_rates(self):
+        """Returns the number of rows with each proportion of missing values."""
+        n = max(len(self._columns), 1)
+        rates = np.arange(self._row_hist.shape[0]) / n
+        return pd.Series(self._row_hist, index=rates)
+
+    def column_buckets(self, buckets=COLUMN_BUCKETS):
+        """Returns the number of columns with missing rates in each
+        inclusive (left, right) bucket."""
+        rates = self.column_rates()
+        return [int(rates.between(left, right).sum()) for left, right in buckets]
+
+    def row_buckets(self, buckets=ROW_BUCKETS):
+        """Returns the number of rows with missing rates in each inclusive
+        (left, right) bucket."""
+        rates = self.row_rates()
+        return [int(rates[(rates.index >= left) & (rates.index <= right)].sum())
+                for left, right in buckets]
+
+    def pattern_frequencies(self, top=None):
+        """Returns the frequency of each missing-value pattern.
+
+        Returns
+        -------
+        DataFrame : with a boolean column per profiled column designating
+            the missing values of the pattern, and its 'Count', in order of
+            decreasing frequency, then of the pattern.
+
+        """
+        if self._patterns is None:
+            raise Exception("Patterns were not profiled.")
+        items = sorted(self._patterns.items(), key=lambda i: (-i[1], i[0]))
+        items = items[:top] if top is not None else items
+        n = len(self._columns)
+        bits = np.array([np.unpackbits(np.frombuffer(p, dtype=np.uint8), count=n)
+                         for p, _ in items], dtype=bool).reshape(len(items), n)
+        df = pd.DataFrame(bits, columns=self._columns)
+        df['Count'] = [count for _, count in items]
+        return df
+
+    def comissingness(self, normalize=False):
+        """Returns the number of rows in which each pair of columns is missing.
+
+        Parameters
+        ----------
+        normalize : bool
+            If True, counts are divided by the number of rows.
+
+        """
+        if self._comissing is None:
+            raise Exception("Co-missingness was not profiled.")
+        values = self._comissing / max(self._rows, 1) if normalize \
+            else self._comissing
+        return pd.DataFrame(values, index=self._columns, columns=self._columns)
+
+    def summary(self, column_buckets=COLUMN_BUCKETS, row_buckets=ROW_BUCKETS):
+        """Returns the percentages of columns and cases in each bucket, as
+        reported by DataSet.summarize."""
+        n_columns = max(len(self._columns), 1)
+        n_rows = max(self._rows, 1)
+        columns = self.column_buckets(column_buckets)
+        rows = self.row_buckets(row_buckets)
+        summary = {}
+        summary["% Columns with no Missing Values"] = columns[0] / n_columns * 100
+        summary["% Columns with up to 25% Missing Values"] = columns[1] / n_columns * 100
+        summary["% Columns with 25% to 50% Missing Values"] = columns[2] / n_columns * 100
+        summary["% Columns with more than 50% Missing Values"] = columns[3] / n_columns * 100
+        summary["% Complete cases"] = rows[0] / n_rows * 100
+        summary["% Cases with up to 10% Missing Values"] = rows[1] / n_rows * 100
+        summary["% Cases with 10% to 25% Missing Values"] = rows[2] / n_rows * 100
+        summary["% Cases with more than 25% Missing Values"] = rows[3] / n_rows * 100
+        return summary
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : normality.py                                                      #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 11:42:08 pm                    #
+# Last Modified : Saturday, October 17th 2026, 11:42:08 pm                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Normality tests of numeric columns.
+
+The NormalityEngine runs a selection of tests on each column, after
+dropping its missing values and drawing a seeded subsample of at most
+max_n values, as the Shapiro-Wilk test is unreliable for larger samples.
+Columns are tested in a pool of workers, to which only the sampled
+values are sent, and the time spent in each test is recorded.
+"""
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy.stats import jarque_bera, norm, normaltest, shapiro
+
+from ..utils.parallel import run
+# --------------------------------------------------------------------------- #
+#                                  Tests                                      #
+# --------------------------------------------------------------------------- #
+def anderson_pvalue(x):
+    """Anderson-Darling test of normality with estimated parameters.
+
+    The p-value is approximated from the adjusted statistic with the
+    formulas of D'Agostino and Stephens (1986).
+
+    """
+    n = len(x)
+    x = np.sort(x)
+    if x[0] == x[-1]:
+        return np.nan
+    z = (x - x.mean()) / x.std(ddof=1)
+    i = np.arange(1, n + 1)
+    a2 = -n - np.sum((2 * i - 1) / n * (norm.logcdf(z) + norm.logsf(z[::-1])))
+    a = a2 * (1 + 0.75 / n + 2.25 / n ** 2)
+    if a >= 153.467:
+        return 0.0
+    if a >= 0.6:
+        return np.exp(1.2937 - 5.709 * a + 0.0186 * a ** 2)
+    if a >= 0.34:
+        return np.exp(0.9177 - 4.279 * a - 1.38 * a ** 2)
+    if a >= 0.2:
+        return 1 - np.exp(-8.318 + 42.796 * a - 59.938 * a ** 2)
+    return 1 - np.exp(-13.436 + 101.14 * a - 223.73 * a ** 2)
+
+# The p-value function, minimum sample size and output label of each test.
+TESTS = {
+    'shapiro': (lambda x: shapiro(x)[1], 3, 'Shapiro p-value'),
+    'dagostino': (lambda x: normaltest(x)[1], 8, "D'Agostino p-value"),
+    'anderson': (anderson_pvalue, 3, 'Anderson p-value'),
+    'jarque_bera': (lambda x: jarque_bera(x)[1], 3, 'Jarque-Bera p-value'),
+}
+
+def _test_column(values, tests):
+    """Runs tests on the values of a column, in a worker process if run in
+    a pool, and returns the p-values and the seconds spent in each test."""
+    pvalues, seconds = {}, {}
+    for test in tests:
+        fn, minimum, _ = TESTS[test]
+        start = time.perf_counter()
+        if values is None or len(values) < minimum:
+            pvalues[test] = np.nan
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                pvalues[test] = float(fn(values))
+        seconds[test] = time.perf_counter() - start
+    return pvalues, seconds
+# --------------------------------------------------------------------------- #
+#                             NormalityEngine                                 #
+# --------------------------------------------------------------------------- #
+class NormalityEngine:
+    """Runs normality tests on the columns of numeric data.
+
+    Parameters
+    ----------
+    tests : list of str
+        The tests to run: 'shapiro', 'dagostino', 'anderson' and/or
+        'jarque_bera'. See TESTS.
+    dropna : bool
+        If True, missing values are dropped from each column before it is
+        tested. If False, columns with missing values have NaN p-values, as
+        with scipy.stats.
+    max_n : int (Optional)
+        The maximum number of values tested per column. Larger columns are
+        subsampled without replacement. If None, columns are tested in full.
+    seed : int
+        The seed of the subsamples.
+    n_jobs : int (Optional)
+        The number of worker processes testing columns. If -1, all cpus are
+        used.
+    executor : concurrent.futures.Executor (Optional)
+        An executor to which the columns are submitted instead.
+
+    """
+
+    def __init__(self, tests=('shapiro',), dropna=True, max_n=5000, seed=0,
+                 n_jobs=None, executor=None):
+        unknown = [test for test in tests if test not in TESTS]
+        if unknown:
+            raise ValueError("Tests must be among {tests}.".format(
+                tests=list(TESTS.keys())))
+        self._tests = list(tests)
+        self._dropna = dropna
+        self._max_n = max_n
+        self._seed = seed
+        self._n_jobs = n_jobs
+        self._executor = executor
+        self._timing = pd.DataFrame()
+
+    @property
+    def tests(self):
+        return list(self._tests)
+
+    @property
+    def dropna(self):
+        return self._dropna
+
+    @property
+    def labels(self):
+        """The labels of the p-value columns, in the order of the tests."""
+        return [TESTS[test][2] for test in self._tests]
+
+    @property
+    def timing(self):
+        """The seconds spent in each test, summed over columns, and the
+        number of values tested, for the most recent run."""
+        return self._timing
+
+    def _values(self, x):
+        """Returns the values of a column to test, or None."""
+        missing = np.isnan(x)
+        if missing.any():
+            if not self._dropna:
+                return None
+            x = x[~missing]
+        if self._max_n is not None and len(x) > self._max_n:
+            rng = np.random.default_rng(self._seed)
+            x = x[np.sort(rng.choice(len(x), self._max_n, replace=False))]
+        return np.ascontiguousarray(x)
+
+    def test(self, data):
+        """Returns the p-values of the tests of each numeric column."""
+        data = data.select_dtypes([np.number])
+        x = np.asfortranarray(data.to_numpy(dtype=float, na_value=np.nan))
+        return self.test_array(x, data.columns)
+
+    def test_array(self, x, columns):
+        """Returns the p-values of the tests of each column of a float array.
+
+        Parameters
+        ----------
+        x : 2D numpy array of floats
+            Observations in rows and variables in columns.
+        columns : list
+            The names of the columns.
+
+        """
+        tasks = [(self._values(x[:, i]), self._tests) for i in range(x.shape[1])]
+        results = run(_test_column, tasks, n_jobs=self._n_jobs,
+                      executor=self._executor)
+        errors = [error for _, error in results if error is not None]
+        if errors:
+            raise errors[0]
+        pvalues = pd.DataFrame([pvalues for (pvalues, _), _ in results],
+                               index=columns, columns=self._tests, dtype=float)
+        pvalues.columns = self.labels
+        seconds = pd.DataFrame([seconds for (_, seconds), _ in results],
+                               columns=self._tests, dtype=float)
+        self._timing = pd.DataFrame({
+            'Seconds': seconds.sum(), 'Columns': len(tasks),
+            'Values': sum(len(v) for v, _ in tasks if v is not None)})
+        return pvalues
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : rollup.py                                                         #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 1:05:27 am                       #
+# Last Modified : Sunday, October 18th 2026, 1:05:27 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Mergeable summaries of quantitative variables and their roll-up.
+
+A QuantSummary is a QuantAccumulator which holds a QuantileSketch of
+each numeric column for percentiles, in place of a reservoir sample.
+Summaries of snapshots are combined by tree reduction into market and
+all-market statistics without concatenating the data.
+"""
+import math
+
+import numpy as np
+
+from .univariate import PERCENTILES, QuantAccumulator
+# --------------------------------------------------------------------------- #
+#                              Tree Reduction                                 #
+# --------------------------------------------------------------------------- #
+def tree_reduce(items, merge=None):
+    """Combines items pairwise, level by level, into one.
+
+    Parameters
+    ----------
+    items : iterable
+        The objects to combine, such as summaries of DataSets.
+    merge : callable (Optional)
+        Combines two items. Defaults to the merge method of the first.
+
+    Returns
+    -------
+    The combination of all items, or None if there are none.
+
+    """
+    merge = merge or (lambda a, b: a.merge(b))
+    items = list(items)
+    if not items:
+        return None
+    while len(items) > 1:
+        items = [merge(items[i], items[i + 1]) if i + 1 < len(items) else items[i]
+                 for i in range(0, len(items), 2)]
+    return items[0]
+# --------------------------------------------------------------------------- #
+#                             QuantileSketch                                  #
+# --------------------------------------------------------------------------- #
+class QuantileSketch:
+    """Mergeable sketch of a distribution from which quantiles are estimated.
+
+    The sketch is a t-digest: values are kept as weighted centroids, which
+    are merged so that each covers at most one unit of the arcsine scale
+    of the quantile. Centroids are small in the tails, where quantiles are
+    most accurate. Until there are more values than max_centroids, values
+    are kept individually and quantiles are exact.
+
+    Parameters
+    ----------
+    compression : int
+        The compression of the digest. The number of centroids after
+        compression is about compression / 2.
+    max_centroids : int (Optional)
+        The number of centroids held before compressing. Defaults to ten
+        times the compression.
+
+    """
+
+    def __init__(self, compression=200, max_centroids=None):
+        self._compression = compression
+        self._max_centroids = max_centroids or 10 * compression
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._min = np.inf
+        self._max = -np.inf
+
+    @property
+    def count(self):
+        return int(self._weights.sum())
+
+    @property
+    def exact(self):
+        """True if every value is held individually."""
+        return bool((self._weights == 1).all())
+
+    def update(self, values):
+        """Adds the non-missing values of an array."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+        self._min = min(self._min, values.min())
+        self._max = max(self._max, values.max())
+        self._add(values, np.ones(len(values)))
+        return self
+
+    def _add(self, means, weights):
+        self._means = np.concatenate([self._means, means])
+        self._weights = np.concatenate([self._weights, weights])
+        if len(self._means) > self._max_centroids:
+            self._compress()
+
+    def _compress(self):
+        """Merges centroids within each unit of the arcsine scale."""
+        order = np.argsort(self._means, kind='mergesort')
+        means, weights = self._means[order], self._weights[order]
+        total = weights.sum()
+        mid = (np.cumsum(weights) - weights / 2) / total
+        k = self._compression / (2 * math.pi) * np.arcsin(2 * mid - 1)
+        groups = np.floor(k).astype(np.int64)
+        groups -= groups.min()
+        w = np.bincount(groups, weights=weights)
+        m = np.bincount(groups, weights=means * weights)
+        kept = w > 0
+        self._weights = w[kept]
+        self._means = m[kept] / self._weights
+
+    def merge(self, other):
+        """Returns the sketch of the union of the values of two sketches."""
+        merged = QuantileSketch(min(self._compression, other._compression),
+                                min(self._max_centroids, other._max_centroids))
+        merged._min = min(self._min, other._min)
+        merged._max = max(self._max, other._max)
+        merged._means = self._means.copy()
+        merged._weights = self._weights.copy()
+        merged._add(other._means, other._weights)
+        return merged
+
+    def quantile(self, q):
+        """Returns the estimated quantiles q in [0, 1], by linear
+        interpolation as in numpy.percentile when the sketch is exact."""
+        q = np.asarray(q, dtype=float)
+        if not len(self._means):
+            return np.full(q.shape, np.nan)
+        if self.exact:
+            return np.percentile(self._means, q * 100)
+        order = np.argsort(self._means, kind='mergesort')
+        means, weights = self._means[order], self._weights[order]
+        total = weights.sum()
+        centers = np.cumsum(weights) - weights / 2
+        x = np.concatenate([[0], centers, [total]])
+        y = np.concatenate([[self._min], means, [self._max]])
+        return np.interp(q * total, x, y)
+# --------------------------------------------------------------------------- #
+#                              QuantSummary                                   #
+# --------------------------------------------------------------------------- #
+class QuantSummary(QuantAccumulator):
+    """Mergeable descriptive statistics of numeric columns.
+
+    A QuantAccumulator whose percentiles are estimated from a
+    QuantileSketch of each column rather than a reservoir sample, so that
+    summaries of any number of DataSets merge without losing the tails.
+
+    Parameters
+    ----------
+    compression : int
+        The compression of the QuantileSketch of each column.
+
+    """
+
+    def __init__(self, compression=200):
+        super(QuantSummary, self).__init__()
+        self._compression = compression
+
+    def _new_store(self):
+        return QuantileSketch(self._compression)
+
+    def _add_values(self, column, values):
+        self._stores[column].update(values)
+
+    def _merge_stores(self, a, b):
+        return a.merge(b)
+
+    def _percentiles(self, store):
+        return store.quantile(PERCENTILES)
+
+    def _empty(self, other):
+        return QuantSummary(min(self._compression, other._compression))
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : sketch.py                                                         #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 12:21:36 am                      #
+# Last Modified : Sunday, October 18th 2026, 12:21:36 am                      #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Mergeable approximate sketches of qualitative variables.
+
+HyperLogLog estimates the number of distinct values of a column from
+registers of the leading zeros of value hashes, and Misra-Gries retains
+a bounded number of counters from which the most frequent values and
+their frequencies are estimated. Both use a fixed amount of memory per
+column, whatever its cardinality, can be pickled, and merge exactly:
+the sketch of the union of two datasets is the merge of their sketches.
+"""
+import copy
+import math
+
+import numpy as np
+import pandas as pd
+
+HASH_KEY = '0123456789123456'
+BLOCK_SIZE = 4096
+# --------------------------------------------------------------------------- #
+#                               Functions                                     #
+# --------------------------------------------------------------------------- #
+def hash_values(values):
+    """Returns deterministic 64-bit hashes of values, ignoring missing values.
+
+    Values are hashed one by one rather than factorized first, so no table
+    of the distinct values of the column is built.
+
+    """
+    values = pd.Series(values)
+    values = values[values.notna()]
+    return pd.util.hash_array(values.astype(object).values, hash_key=HASH_KEY,
+                              categorize=False)
+
+def _bit_length(x):
+    """Returns the number of bits needed to represent each uint64 of x."""
+    x = x.copy()
+    length = np.zeros(x.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = x >= (np.uint64(1) << np.uint64(shift))
+        length[high] += shift
+        x[high] >>= np.uint64(shift)
+    return length + (x > 0)
+# --------------------------------------------------------------------------- #
+#                              HyperLogLog                                    #
+# --------------------------------------------------------------------------- #
+class HyperLogLog:
+    """Estimates the number of distinct values in a stream.
+
+    Parameters
+    ----------
+    error : float
+        The relative standard error of the estimate, which determines the
+        number of registers as (1.04 / error) ** 2, rounded up to a power
+        of 2 between 2**4 and 2**18.
+
+    """
+
+    def __init__(self, error=0.01):
+        p = math.ceil(math.log2((1.04 / error) ** 2))
+        self._p = min(max(p, 4), 18)
+        self._registers = np.zeros(1 << self._p, dtype=np.uint8)
+
+    @property
+    def precision(self):
+        return self._p
+
+    @property
+    def error(self):
+        """The relative standard error of the estimate."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values):
+        """Adds the non-missing values of an array or Series."""
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes):
+        """Adds 64-bit hashes of values."""
+        if not len(hashes):
+            return self
+        p = np.uint64(self._p)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        rest = hashes & ((np.uint64(1) << (np.uint64(64) - p)) - np.uint64(1))
+        # The rank is the position of the leftmost 1 in the remaining bits.
+        rank = (64 - self._p) - _bit_length(rest) + 1
+        np.maximum.at(self._registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other):
+        """Returns the sketch of the union of the values of two sketches."""
+        if other._p != self._p:
+            raise ValueError("HyperLogLog sketches of different precision "
+                             "cannot be merged.")
+        merged = HyperLogLog.__new__(HyperLogLog)
+        merged._p = self._p
+        merged._registers = np.maximum(self._registers, other._registers)
+        return merged
+
+    def estimate(self):
+        """Returns the estimated number of distinct values."""
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self._registers.astype(int)))
+        zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+# --------------------------------------------------------------------------- #
+#                              MisraGries                                     #
+# --------------------------------------------------------------------------- #
+class MisraGries:
+    """Estimates the frequencies of the most frequent values in a stream.
+
+    At most k counters are kept. The estimated frequency of a value is at
+    most its true frequency and at least its true frequency less the
+    bound, which does not exceed n / (k + 1) for n values. Values are
+    counted in blocks of block_size, each reduced to k counters before
+    the next, so that memory is bounded by k and block_size rather than
+    the number of distinct values.
+
+    Parameters
+    ----------
+    error : float
+        The maximum error of a frequency as a fraction of the number of
+        values, which determines k as ceil(1 / error).
+    block_size : int (Optional)
+        The number of values counted at once. Defaults to 4 * k, and at
+        least BLOCK_SIZE.
+
+    """
+
+    def __init__(self, error=0.001, block_size=None):
+        self._k = max(1, math.ceil(1 / error))
+        self._block_size = block_size or max(4 * self._k, BLOCK_SIZE)
+        self._counters = pd.Series(dtype=np.int64)
+        self._n = 0
+        self._bound = 0
+
+    @property
+    def k(self):
+        return self._k
+
+    @property
+    def n(self):
+        """The number of values counted."""
+        return self._n
+
+    @property
+    def bound(self):
+        """The maximum underestimate of any frequency."""
+        return self._bound
+
+    def update(self, values):
+        """Adds the non-missing values of an array or Series."""
+        values = pd.Series(values)
+        for start in range(0, len(values), self._block_size):
+            counts = values.iloc[start:start + self._block_size].value_counts(
+                dropna=True)
+            counts.index = counts.index.astype(object)
+            self._n += int(counts.sum())
+            counters = self._counters.add(counts.astype(np.int64), fill_value=0)
+            self._counters, self._bound = self._reduce(
+                counters.astype(np.int64), self._bound)
+        return self
+
+    def _reduce(self, counters, bound):
+        """Keeps k counters by subtracting the (k+1)th largest from all."""
+        if len(counters) <= self._k:
+            return counters, bound
+        threshold = int(np.partition(counters.values, -(self._k + 1))[-(self._k + 1)])
+        counters = counters - threshold
+        return counters[counters > 0], bound + threshold
+
+    def merge(self, other):
+        """Returns the sketch of the union of the values of two sketches."""
+        merged = MisraGries.__new__(MisraGries)
+        merged._k = min(self._k, other._k)
+        merged._block_size = min(self._block_size, other._block_size)
+        merged._n = self._n + other._n
+        counters = self._counters.add(other._counters, fill_value=0)
+        merged._counters, merged._bound = merged._reduce(
+            counters.astype(np.int64), self._bound + other._bound)
+        return merged
+
+    def top(self, n=None):
+        """Returns the values with the largest estimated frequencies."""
+        counters = self._counters.sort_values(ascending=False, kind='mergesort')
+        return counters if n is None else counters.iloc[:n]
+# --------------------------------------------------------------------------- #
+#                               QualSketch                                    #
+# --------------------------------------------------------------------------- #
+class QualSketch:
+    """Approximate count, unique, top and freq of non-numeric columns.
+
+    Counts are exact. Distinct counts are estimated by a HyperLogLog and
+    the top value and its frequency by a Misra-Gries sketch per column.
+    Columns in which no value is more frequent than the error bound, such
+    as identifiers, have no top value.
+
+    Parameters
+    ----------
+    distinct_error : float
+        The relative standard error of the distinct counts.
+    top_error : float
+        The maximum error of the frequency of the top value, as a fraction
+        of the count.
+
+    """
+
+    def __init__(self, distinct_error=0.01, top_error=0.001):
+        self._distinct_error = distinct_error
+        self._top_error = top_error
+        self._columns = []
+        self._counts = {}
+        self._distinct = {}
+        self._frequent = {}
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def _add(self, column):
+        self._columns.append(column)
+        self._counts[column] = 0
+        self._distinct[column] = HyperLogLog(self._distinct_error)
+        self._frequent[column] = MisraGries(self._top_error)
+
+    def update(self, chunk):
+        """Adds the non-numeric columns of a DataFrame chunk to the sketches."""
+        for column in chunk.select_dtypes(exclude=np.number).columns:
+            if column not in self._counts:
+                self._add(column)
+            values = chunk[column]
+            self._counts[column] += int(values.count())
+            self._distinct[column].update(values)
+            self._frequent[column].update(values)
+        return self
+
+    def merge(self, other):
+        """Returns the sketch of the union of the data of two sketches, such
+        as chunks, files or DataGroup members."""
+        merged = QualSketch(self._distinct_error, self._top_error)
+        for sketch in (self, other):
+            for column in sketch._columns:
+                if column not in merged._counts:
+                    merged._columns.append(column)
+                    merged._counts[column] = sketch._counts[column]
+                    merged._distinct[column] = copy.deepcopy(sketch._distinct[column])
+                    merged._frequent[column] = copy.deepcopy(sketch._frequent[column])
+                else:
+                    merged._counts[column] += sketch._counts[column]
+                    merged._distinct[column] = merged._distinct[column].merge(
+                        sketch._distinct[column])
+                    merged._frequent[column] = merged._frequent[column].merge(
+                        sketch._frequent[column])
+        return merged
+
+    def describe(self):
+        """Returns count, unique, top and freq as a DataFrame."""
+        if not self._columns:
+            return pd.DataFrame()
+        description = pd.DataFrame(index=self._columns,
+                                   columns=['count', 'unique', 'top', 'freq'],
+                                   dtype=object)
+        for column in self._columns:
+            description.loc[column, 'count'] = self._counts[column]
+            # The estimate cannot exceed the count.
+            description.loc[column, 'unique'] = min(
+                self._distinct[column].estimate(), self._counts[column])
+            top = self._frequent[column].top(1)
+            if len(top):
+                description.loc[column, 'top'] = top.index[0]
+                description.loc[column, 'freq'] = int(top.iloc[0])
+        return description
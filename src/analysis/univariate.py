@@ -19,10 +19,17 @@
 # ============================================================================ #
 """This module contains the classes that perform univariate analyses."""
 from abc import ABC, abstractmethod
+import copy
+import warnings
 
 import numpy as np
 import pandas as pd
-from scipy.stats import kurtosis, skew, shapiro, kurtosistest, skewtest
+from scipy.stats import norm
+
+from .normality import NormalityEngine
+from .sketch import QualSketch
+
+PERCENTILES = [0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95]
 
 # ---------------------------------------------------------------------------- #
 #                              DESCRIBE                                        #
@@ -40,10 +47,25 @@ class Describe(ABC):
 class DescribeQuant(Describe):
     """Computes descriptive statistics for a quantitative variable.
 
+    Parameters
+    ----------
+    normality : NormalityEngine (Optional)
+        Runs the normality tests reported in addition to the skew and 
+        kurtosis tests. Defaults to the Shapiro-Wilk test on at most 5000 
+        non-missing values per column. The skew and kurtosis tests are 
+        computed from the moments of all values, with missing values 
+        dropped unless the engine propagates them.
+
     """
-    def __init__(self):
+    def __init__(self, normality=None):
         super(DescribeQuant, self).__init__()
         self._description = {}
+        self._normality = normality or NormalityEngine()
+
+    @property
+    def timing(self):
+        """The seconds spent in each normality test in the last describe."""
+        return self._normality.timing
         
     def describe(self, data):
         """Computes descriptive statistics for a quantitative variable.
@@ -63,37 +85,52 @@ class DescribeQuant(Describe):
         # Ensure only numeric columns are evaluated.
         data = data.select_dtypes([np.number])
         if data.empty:
-            description = pd.DataFrame()
-        else:
-            cols = np.array(data.columns)
-            # Compute basic descriptive statistics and round to 2 sig digits.        
-            description = data.describe(percentiles=[0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95], include=np.number)   
-            description = description.round(2)
-            description = description.T
-            # Add missing counts 
-            d_missing = data.isnull().sum()
-            d_missing = d_missing.rename('# Missing')
-            # Add missing percentages
-            d_pct_missing = round(data.isnull().sum() / len(data) * 100, 2)
-            d_pct_missing = d_pct_missing.rename('% Missing')
-            # Add Kurtosis
-            d_kurtosis = data.kurtosis()
-            d_kurtosis = d_kurtosis.rename('Kurtosis')
-            # Add Skew
-            d_skew = data.skew()
-            d_skew = d_skew.rename('skew')
-            # Concatenate pandas objects into dataframe
-            description = pd.concat([description, d_missing, d_pct_missing, d_kurtosis, d_skew], axis=1)
-            # Add Kurtosis test
-            _, d_kurtosis_test = kurtosistest(data)
-            description['Kurtosis p-value'] = pd.DataFrame(data=[d_kurtosis_test], columns=cols).T
-            # Add Skew test
-            _, d_skew_test = skewtest(data)
-            description['Skew p-value'] = pd.DataFrame(data=[d_skew_test], columns=cols).T
-            # Add shapiro
-            df = data.apply(lambda x: pd.Series(shapiro(x), index=['w', 'Shapiro p-value'])).T
-            description = pd.concat([description, df['Shapiro p-value']], axis=1)
-        return description
+            return pd.DataFrame()
+        # All statistics are computed from one contiguous float array: the 
+        # moments in one NaN-aware pass and the extrema and percentiles 
+        # from one sort of each column.
+        x = np.asfortranarray(data.to_numpy(dtype=float, na_value=np.nan))
+        stats = describe_array(x)
+        description = pd.DataFrame(index=data.columns)
+        for statistic in ['count', 'mean', 'std', 'min'] + \
+                [percentile_label(p) for p in PERCENTILES] + ['max']:
+            description[statistic] = stats[statistic]
+        description = description.round(2)
+        description['# Missing'] = stats['missing']
+        description['% Missing'] = np.round(stats['missing'] / len(data) * 100, 2)
+        description['Kurtosis'] = stats['kurtosis']
+        description['skew'] = stats['skew']
+        # Unless the engine drops them, NaNs propagate into the tests.
+        tested = stats['missing'] == 0 if not self._normality.dropna else \
+            np.ones(x.shape[1], dtype=bool)
+        description['Kurtosis p-value'] = np.where(tested, stats['kurtosis_p'], np.nan)
+        description['Skew p-value'] = np.where(tested, stats['skew_p'], np.nan)
+        pvalues = self._normality.test_array(x, data.columns)
+        return pd.concat([description, pvalues], axis=1)
+
+    def describe_chunks(self, chunks, reservoir_size=10000, seed=None):
+        """Computes descriptive statistics in one pass over DataFrame chunks.
+
+        Counts, missing values, moments, minima and maxima are exact.
+        Percentiles are computed from a uniform reservoir sample of each
+        column, and are exact when a column has no more non-missing values
+        than the reservoir holds. The normality test p-values are not 
+        computed in streaming mode.
+
+        Parameters
+        ----------
+        chunks : iterable of DataFrames
+            The chunks of the data to be analyzed.
+        reservoir_size : int
+            The number of values per column retained for percentiles.
+        seed : None or int
+            Seed for the reservoir sample.
+
+        """
+        accumulator = QuantAccumulator(reservoir_size=reservoir_size, seed=seed)
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator.describe()
 
 
 # ---------------------------------------------------------------------------- #
@@ -102,10 +139,29 @@ class DescribeQuant(Describe):
 class DescribeQual(Describe):
     """Computes descriptive statistics for a qualitative variable.
 
+    Parameters
+    ----------
+    approximate : bool
+        If True, unique is estimated by a HyperLogLog and top and freq by a 
+        Misra-Gries sketch per column, in memory independent of the number
+        of distinct values. See QualSketch.
+    distinct_error : float
+        In approximate mode, the relative standard error of unique.
+    top_error : float
+        In approximate mode, the maximum error of freq as a fraction of 
+        count.
+
     """
-    def __init__(self):
+    def __init__(self, approximate=False, distinct_error=0.01, top_error=0.001):
         super(DescribeQual, self).__init__()
         self._description = {}
+        self._approximate = approximate
+        self._distinct_error = distinct_error
+        self._top_error = top_error
+
+    def sketch(self):
+        """Returns an empty QualSketch with the designated error bounds."""
+        return QualSketch(self._distinct_error, self._top_error)
         
     def describe(self, data):
         """Computes descriptive statistics for a qualitative variable.
@@ -122,12 +178,21 @@ class DescribeQual(Describe):
             values.
 
         """        
+        if self._approximate:
+            return self.sketch().update(data).describe()
         d = data.select_dtypes(exclude=np.number)
         if d.empty:
             description = pd.DataFrame()
         else:
             description = d.describe().T
         return description
+
+    def describe_chunks(self, chunks):
+        """Computes count, unique, top and freq in one pass over chunks."""
+        accumulator = self.sketch() if self._approximate else QualAccumulator()
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator.describe()
                 
 
 
@@ -135,3 +200,391 @@ class DescribeQual(Describe):
         
 
 
+
+
+# ---------------------------------------------------------------------------- #
+#                           STREAMING ACCUMULATORS                             #
+# ---------------------------------------------------------------------------- #
+def moments(x):
+    """Computes NaN-aware count, mean, central moment sums, min and max.
+
+    Parameters
+    ----------
+    x : 2D numpy array of floats
+        Observations in rows and variables in columns.
+
+    Returns
+    -------
+    tuple of 1D arrays : n, mean, M2, M3, M4, min, max where Mk is the sum 
+        of the kth power of the deviations from the mean.
+
+    """
+    mask = np.isnan(x)
+    n = x.shape[0] - mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(mask, 0, x).sum(axis=0) / n
+        d = np.where(mask, 0, x - mean)
+        d2 = d * d
+        m2 = d2.sum(axis=0)
+        m3 = (d2 * d).sum(axis=0)
+        m4 = (d2 * d2).sum(axis=0)
+    empty = n == 0
+    xmin = np.where(mask, np.inf, x).min(axis=0, initial=np.inf)
+    xmax = np.where(mask, -np.inf, x).max(axis=0, initial=-np.inf)
+    xmin[empty] = np.nan
+    xmax[empty] = np.nan
+    return n, mean, m2, m3, m4, xmin, xmax
+
+def merge_moments(a, b):
+    """Combines the moments of two partitions with the parallel formulas.
+
+    Parameters
+    ----------
+    a, b : tuple of arrays 
+        The (n, mean, M2, M3, M4, min, max) tuples returned by moments.
+
+    """
+    na, mean_a, m2a, m3a, m4a, min_a, max_a = a
+    nb, mean_b, m2b, m3b, m4b, min_b, max_b = b
+    na = na.astype(float)
+    nb = nb.astype(float)
+    n = na + nb
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = np.where(nb == 0, 0, np.where(na == 0, 0, mean_b - mean_a))
+        mean = np.where(na == 0, mean_b, 
+                        np.where(nb == 0, mean_a, mean_a + delta * nb / n))
+        m2a, m3a, m4a = [np.where(na == 0, 0, m) for m in (m2a, m3a, m4a)]
+        m2b, m3b, m4b = [np.where(nb == 0, 0, m) for m in (m2b, m3b, m4b)]
+        nn = np.where(n == 0, 1, n)
+        m2 = m2a + m2b + delta ** 2 * na * nb / nn
+        m3 = m3a + m3b + delta ** 3 * na * nb * (na - nb) / nn ** 2 + \
+            3 * delta * (na * m2b - nb * m2a) / nn
+        m4 = m4a + m4b + \
+            delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / nn ** 3 + \
+            6 * delta ** 2 * (na ** 2 * m2b + nb ** 2 * m2a) / nn ** 2 + \
+            4 * delta * (na * m3b - nb * m3a) / nn
+    xmin = np.fmin(min_a, min_b)
+    xmax = np.fmax(max_a, max_b)
+    return n.astype(int), mean, m2, m3, m4, xmin, xmax
+
+def skew_kurtosis(n, m2, m3, m4):
+    """Bias corrected skew and excess kurtosis as computed by pandas."""
+    n = n.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        g1 = n * np.sqrt(n - 1) / (n - 2) * m3 / m2 ** 1.5
+        g2 = n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) - \
+            3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+    zero = m2 == 0
+    g1 = np.where(zero, 0, g1)
+    g2 = np.where(zero, 0, g2)
+    g1 = np.where(n < 3, np.nan, g1)
+    g2 = np.where(n < 4, np.nan, g2)
+    return g1, g2
+
+def percentile_label(p):
+    """Returns the label of a percentile as in DataFrame.describe."""
+    return '{:g}%'.format(p * 100)
+
+def sorted_percentiles(s, n, percentiles=PERCENTILES):
+    """Linearly interpolated percentiles of columns sorted with NaNs last.
+
+    Parameters
+    ----------
+    s : 2D numpy array of floats
+        Columns sorted in ascending order, with NaNs last.
+    n : 1D array of ints
+        The number of non-missing values in each column.
+    percentiles : list of floats
+        The percentiles in [0, 1].
+
+    Returns
+    -------
+    2D array with a row per percentile and a column per column of s.
+
+    """
+    columns = np.arange(s.shape[1])
+    h = np.outer(percentiles, np.maximum(n - 1, 0))
+    lo = np.floor(h).astype(np.int64)
+    hi = np.minimum(lo + 1, np.maximum(n - 1, 0))
+    with np.errstate(invalid='ignore'):
+        values = s[lo, columns] + (h - lo) * (s[hi, columns] - s[lo, columns])
+    values[:, n == 0] = np.nan
+    return values
+
+def normal_tests(n, mean, m2, m3, m4):
+    """D'Agostino skew and kurtosis test p-values from central moment sums,
+    as computed by scipy.stats.skewtest and kurtosistest."""
+    n = n.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Biased sample skew and (Pearson) kurtosis, NaN for constant data.
+        constant = m2 / n <= (np.finfo(float).eps * mean) ** 2
+        b1 = np.where(constant, np.nan, (m3 / n) / (m2 / n) ** 1.5)
+        b2 = np.where(constant, np.nan, (m4 / n) / (m2 / n) ** 2)
+
+        y = b1 * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+        beta2 = (3.0 * (n ** 2 + 27 * n - 70) * (n + 1) * (n + 3)) / \
+            ((n - 2.0) * (n + 5) * (n + 7) * (n + 9))
+        w2 = -1 + np.sqrt(2 * (beta2 - 1))
+        delta = 1 / np.sqrt(0.5 * np.log(w2))
+        alpha = np.sqrt(2.0 / (w2 - 1))
+        y = np.where(y == 0, 1, y)
+        z = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+        skew_p = np.where(n < 8, np.nan, 2 * norm.sf(np.abs(z)))
+
+        e = 3.0 * (n - 1) / (n + 1)
+        varb2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.) * (n + 3) * (n + 5))
+        x = (b2 - e) / np.sqrt(varb2)
+        sqrtbeta1 = 6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9)) * \
+            np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3)))
+        a = 6.0 + 8.0 / sqrtbeta1 * (2.0 / sqrtbeta1 + np.sqrt(1 + 4.0 / (sqrtbeta1 ** 2)))
+        term1 = 1 - 2 / (9.0 * a)
+        denom = 1 + x * np.sqrt(2 / (a - 4.0))
+        term2 = np.sign(denom) * np.where(denom == 0.0, np.nan,
+                                          np.power((1 - 2.0 / a) / np.abs(denom), 1 / 3.0))
+        z = (term1 - term2) / np.sqrt(2 / (9.0 * a))
+        kurtosis_p = np.where(n < 5, np.nan, 2 * norm.sf(np.abs(z)))
+    return skew_p, kurtosis_p
+
+def describe_array(x, percentiles=PERCENTILES):
+    """Computes the descriptive statistics of the columns of a float array.
+
+    The count, mean and central moment sums are computed in one NaN-aware
+    vectorized pass, and the minima, maxima and percentiles are read from
+    a single sort of each column.
+
+    Parameters
+    ----------
+    x : 2D numpy array of floats
+        Observations in rows and variables in columns. A Fortran ordered
+        array keeps each column contiguous.
+    percentiles : list of floats
+        The percentiles in [0, 1].
+
+    Returns
+    -------
+    dict of 1D arrays : count, missing, mean, std, min, the percentiles 
+        labeled as by DataFrame.describe, max, skew, kurtosis, and the 
+        skew_p and kurtosis_p of the D'Agostino tests on complete columns.
+
+    """
+    n, mean, m2, m3, m4, _, _ = moments(x)
+    s = np.sort(x, axis=0)
+    columns = np.arange(x.shape[1])
+    last = np.maximum(n - 1, 0)
+    stats = {}
+    stats['count'] = n.astype(float)
+    stats['missing'] = x.shape[0] - n
+    stats['mean'] = np.where(n == 0, np.nan, mean)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stats['std'] = np.where(n < 2, np.nan, np.sqrt(m2 / (n - 1)))
+    stats['min'] = np.where(n == 0, np.nan, s[0, columns] if len(s) else np.nan)
+    values = sorted_percentiles(s, n, percentiles) if len(s) else \
+        np.full((len(percentiles), x.shape[1]), np.nan)
+    for p, v in zip(percentiles, values):
+        stats[percentile_label(p)] = v
+    stats['max'] = np.where(n == 0, np.nan, s[last, columns] if len(s) else np.nan)
+    stats['skew'], stats['kurtosis'] = skew_kurtosis(n, m2, m3, m4)
+    stats['skew_p'], stats['kurtosis_p'] = normal_tests(n, mean, m2, m3, m4)
+    return stats
+
+
+class QuantAccumulator:
+    """Accumulates descriptive statistics of numeric columns chunk by chunk.
+
+    Count, mean and central moment sums are exact and combined with the
+    parallel merge formulas. Percentiles are estimated from a store of
+    values per column, by default a reservoir sample. Subclasses may keep
+    another store by overriding _new_store, _add_values, _merge_stores
+    and _percentiles. Accumulators are combined with the merge method.
+
+    Parameters
+    ----------
+    reservoir_size : int
+        The number of values per column retained for percentiles.
+    seed : None or int
+        Seed for the reservoir sample.
+
+    """
+
+    def __init__(self, reservoir_size=10000, seed=None):
+        self._reservoir_size = reservoir_size
+        self._rng = np.random.RandomState(seed)
+        self._columns = []
+        self._excluded = set()
+        self._rows = 0
+        self._moments = {}
+        self._stores = {}
+
+    @property
+    def columns(self):
+        return [c for c in self._columns if c not in self._excluded]
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def _exclude(self, columns):
+        for column in columns:
+            if column in self._moments:
+                warnings.warn("Column '{c}' changed type across chunks and is "
+                              "excluded. Pass a schema for consistent types "
+                              "across chunks.".format(c=column))
+                del self._moments[column]
+                del self._stores[column]
+            self._excluded.add(column)
+
+    def update(self, chunk):
+        """Adds the numeric columns of a DataFrame chunk to the statistics."""
+        numeric = chunk.select_dtypes([np.number])
+        self._exclude([c for c in chunk.columns if c not in numeric.columns])
+        columns = [c for c in numeric.columns if c not in self._excluded]
+        self._rows += chunk.shape[0]
+        if not columns:
+            return self
+        x = numeric[columns].to_numpy(dtype=float, na_value=np.nan)
+        chunk_moments = moments(x)
+        for i, column in enumerate(columns):
+            m = tuple(np.array([v[i]]) for v in chunk_moments)
+            if column not in self._moments:
+                self._columns.append(column)
+                self._moments[column] = m
+                self._stores[column] = self._new_store()
+            else:
+                self._moments[column] = merge_moments(self._moments[column], m)
+            values = x[:, i][~np.isnan(x[:, i])]
+            self._add_values(column, values)
+        return self
+
+    def _new_store(self):
+        """Returns an empty reservoir of random keys and values."""
+        return (np.empty(0), np.empty(0))
+
+    def _add_values(self, column, values):
+        """Keeps the values with the smallest random keys in the reservoir."""
+        keys, kept = self._stores[column]
+        keys = np.concatenate([keys, self._rng.random_sample(len(values))])
+        kept = np.concatenate([kept, values])
+        self._stores[column] = self._shrink(keys, kept)
+
+    def _shrink(self, keys, kept):
+        if len(keys) > self._reservoir_size:
+            idx = np.argpartition(keys, self._reservoir_size)[:self._reservoir_size]
+            keys, kept = keys[idx], kept[idx]
+        return keys, kept
+
+    def _merge_stores(self, a, b):
+        """Returns the reservoir of the union of two reservoirs, which is a
+        uniform sample since all keys are drawn from the same distribution."""
+        return self._shrink(np.concatenate([a[0], b[0]]),
+                            np.concatenate([a[1], b[1]]))
+
+    def _percentiles(self, store):
+        """Returns the PERCENTILES of the values of a store."""
+        if not len(store[1]):
+            return np.full(len(PERCENTILES), np.nan)
+        return np.percentile(store[1], np.array(PERCENTILES) * 100)
+
+    def _empty(self, other):
+        """Returns an empty accumulator to receive the merge with other."""
+        merged = copy.copy(self)
+        merged._reservoir_size = min(self._reservoir_size, other._reservoir_size)
+        merged._rng = copy.deepcopy(self._rng)
+        return merged
+
+    def merge(self, other):
+        """Returns the statistics of the union of the data of two
+        accumulators, such as chunks, files or DataGroup members."""
+        merged = self._empty(other)
+        merged._columns = []
+        merged._excluded = self._excluded | other._excluded
+        merged._rows = self._rows + other._rows
+        merged._moments = {}
+        merged._stores = {}
+        for accumulator in (self, other):
+            for column in accumulator.columns:
+                if column in merged._excluded:
+                    continue
+                if column not in merged._moments:
+                    merged._columns.append(column)
+                    merged._moments[column] = accumulator._moments[column]
+                    merged._stores[column] = copy.deepcopy(
+                        accumulator._stores[column])
+                else:
+                    merged._moments[column] = merge_moments(
+                        merged._moments[column], accumulator._moments[column])
+                    merged._stores[column] = merged._merge_stores(
+                        merged._stores[column], accumulator._stores[column])
+        return merged
+
+    def describe(self):
+        """Returns the descriptive statistics as a DataFrame."""
+        columns = self.columns
+        if not columns:
+            return pd.DataFrame()
+        n, mean, m2, m3, m4, xmin, xmax = [np.concatenate(v) for v in 
+            zip(*[self._moments[c] for c in columns])]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.where(n < 2, np.nan, np.sqrt(m2 / (n - 1)))
+        g1, g2 = skew_kurtosis(n, m2, m3, m4)
+        percentiles = np.array([self._percentiles(self._stores[c])
+                                for c in columns])
+        description = pd.DataFrame(index=columns)
+        description['count'] = n.astype(float)
+        description['mean'] = np.where(n == 0, np.nan, mean)
+        description['std'] = std
+        description['min'] = xmin
+        for i, p in enumerate(PERCENTILES):
+            description[percentile_label(p)] = percentiles[:, i]
+        description['max'] = xmax
+        description = description.round(2)
+        description['# Missing'] = self._rows - n
+        description['% Missing'] = np.round((self._rows - n) / max(self._rows, 1)
+                                            * 100, 2)
+        description['Kurtosis'] = g2
+        description['skew'] = g1
+        return description
+
+
+class QualAccumulator:
+    """Accumulates count, unique, top and freq of non-numeric columns."""
+
+    def __init__(self):
+        self._columns = []
+        self._counts = {}
+        self._numeric = set()
+
+    def update(self, chunk):
+        """Adds the non-numeric columns of a DataFrame chunk to the counts."""
+        qual = chunk.select_dtypes(exclude=np.number).columns
+        for column in chunk.columns:
+            if column not in qual and column not in self._counts:
+                self._numeric.add(column)
+                continue
+            counts = chunk[column].value_counts(dropna=True)
+            counts.index = counts.index.astype(object)
+            if column not in self._counts:
+                if column in self._numeric:
+                    warnings.warn("Column '{c}' changed type across chunks. Pass "
+                                  "a schema for consistent types across "
+                                  "chunks.".format(c=column))
+                self._columns.append(column)
+                self._counts[column] = counts
+            else:
+                self._counts[column] = self._counts[column].add(counts, fill_value=0)
+        return self
+
+    def describe(self):
+        """Returns count, unique, top and freq as a DataFrame."""
+        if not self._columns:
+            return pd.DataFrame()
+        description = pd.DataFrame(index=self._columns, 
+                                   columns=['count', 'unique', 'top', 'freq'],
+                                   dtype=object)
+        for column in self._columns:
+            counts = self._counts[column]
+            description.loc[column, 'count'] = int(counts.sum())
+            description.loc[column, 'unique'] = len(counts)
+            if len(counts):
+                description.loc[column, 'top'] = counts.idxmax()
+                description.loc[column, 'freq'] = int(counts.max())
+        return description
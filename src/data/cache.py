@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : cache.py                                                          #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 9:02:11 am                     #
+# Last Modified : Saturday, October 17th 2026, 9:02:11 am                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Columnar on-disk cache for parsed snapshot files.
+
+Parsing a gzipped csv snapshot is dominated by decompression and text
+parsing. The ColumnarCache stores the parsed DataFrame in a columnar
+format (Parquet or Feather) in the user cache directory, so that each
+raw snapshot is parsed only once. Entries are keyed by the source path,
+size, modification time and a content hash, and are invalidated
+automatically when the source changes. Entries of sources which no
+longer exist, and the least recently used entries beyond the size and
+age limits of the cache, are evicted after each write.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:                                     # pragma: no cover
+    HAS_PYARROW = False
+
+CACHE_ENV = "AIRBNB_CACHE_DIR"
+MAX_BYTES = 10 * 1024 ** 3
+FORMATS = {'parquet': '.parquet', 'feather': '.feather'}
+
+def default_cache_dir():
+    """Returns the directory in the AIRBNB_CACHE_DIR environment variable,
+    or 'airbnb' in the user cache directory ($XDG_CACHE_HOME or ~/.cache)."""
+    if os.environ.get(CACHE_ENV):
+        return os.environ[CACHE_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "airbnb")
+# --------------------------------------------------------------------------- #
+#                              ColumnarCache                                  #
+# --------------------------------------------------------------------------- #
+class ColumnarCache:
+    """Stores parsed DataFrames in columnar format next to a json manifest.
+
+    Parameters
+    ----------
+    directory : str (Optional)
+        The directory in which cached files are stored. Defaults to the
+        directory returned by default_cache_dir.
+    fmt : str
+        The columnar format, either 'parquet' or 'feather'.
+    max_bytes : int (Optional)
+        The size of the cache beyond which the least recently used entries
+        are evicted. If None, entries are not evicted by size.
+    max_age : float (Optional)
+        The number of seconds after which an entry not used is evicted. If
+        None, entries are not evicted by age.
+    eviction : bool
+        If False, entries are never evicted, not even those of sources
+        which no longer exist, as for pipeline output kept as data.
+
+    Note
+    ----
+    An entry is fresh if the size and modification time of the source
+    match the manifest. If only the modification time differs, the content
+    hash of the source is recomputed and the entry is kept if the content
+    is unchanged.
+
+    """
+
+    def __init__(self, directory=None, fmt='parquet', max_bytes=MAX_BYTES,
+                 max_age=None, eviction=True):
+        if fmt not in FORMATS:
+            raise ValueError("Format must be one of {formats}.".format(
+                formats=list(FORMATS.keys())))
+        self._directory = directory or default_cache_dir()
+        self._fmt = fmt
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._eviction = eviction
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def fmt(self):
+        return self._fmt
+
+    def _key(self, source, variant=None):
+        """Returns the cache key for a source path and optional variant."""
+        source = os.path.abspath(source)
+        key = hashlib.sha1((source + "|" + str(variant)).encode('utf-8'))
+        basename = os.path.basename(source).split(".")[0]
+        return basename + "_" + key.hexdigest()[:16]
+
+    def _paths(self, source, variant=None):
+        """Returns the data and manifest paths for a source."""
+        key = self._key(source, variant)
+        data_path = os.path.join(self._directory, key + FORMATS[self._fmt])
+        manifest_path = os.path.join(self._directory, key + ".json")
+        return data_path, manifest_path
+
+    @staticmethod
+    def digest(source, blocksize=1 << 20):
+        """Computes the sha1 content hash of a file."""
+        h = hashlib.sha1()
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(blocksize), b''):
+                h.update(block)
+        return h.hexdigest()
+
+    def _read_manifest(self, manifest_path):
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, manifest_path, manifest):
+        self._atomic_write(manifest_path,
+            lambda path: self._dump_json(manifest, path))
+
+    @staticmethod
+    def _dump_json(content, path):
+        with open(path, 'w') as f:
+            json.dump(content, f, indent=2)
+
+    def _atomic_write(self, path, writer):
+        """Writes to a temporary file, then renames it to path."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            writer(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def manifest(self, source, variant=None):
+        """Returns the manifest for a source if the entry is fresh."""
+        if not HAS_PYARROW or not os.path.isfile(source):
+            return None
+        data_path, manifest_path = self._paths(source, variant)
+        manifest = self._read_manifest(manifest_path)
+        if manifest is None or not os.path.exists(data_path):
+            return None
+        stat = os.stat(source)
+        if manifest['size'] != stat.st_size:
+            return None
+        if manifest['mtime_ns'] != stat.st_mtime_ns:
+            if manifest['sha1'] != self.digest(source):
+                return None
+            manifest['mtime_ns'] = stat.st_mtime_ns
+            self._write_manifest(manifest_path, manifest)
+        # The modification time of the data file marks its last use.
+        try:
+            os.utime(data_path)
+        except OSError:
+            return None
+        return manifest
+
+    def isfresh(self, source, variant=None):
+        """Returns True if a fresh cache entry exists for the source."""
+        return self.manifest(source, variant) is not None
+
+    def path(self, source, variant=None):
+        """Returns the path to the columnar copy if the entry is fresh."""
+        if self.isfresh(source, variant):
+            return self._paths(source, variant)[0]
+        return None
+
+    def read(self, source, columns=None, variant=None):
+        """Reads the cached DataFrame, or returns None if not fresh.
+
+        Parameters
+        ----------
+        source : str
+            The path to the source file.
+        columns : array-like (Optional)
+            The columns to read from the columnar copy.
+        variant : str (Optional)
+            Distinguishes multiple parsings of the same source.
+
+        """
+        data_path = self.path(source, variant)
+        if data_path is None:
+            return None
+        if self._fmt == 'parquet':
+            return pd.read_parquet(data_path, columns=columns)
+        return pd.read_feather(data_path, columns=columns)
+
+    def write(self, source, df, variant=None):
+        """Writes the DataFrame parsed from source to the cache.
+
+        Returns the path to the columnar copy, or None if the DataFrame
+        cannot be represented in the columnar format.
+
+        """
+        if not HAS_PYARROW:
+            return None
+        data_path, manifest_path = self._paths(source, variant)
+        stat = os.stat(source)
+        manifest = {'source': os.path.abspath(source),
+                    'variant': variant,
+                    'format': self._fmt,
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'sha1': self.digest(source),
+                    'rows': int(df.shape[0]),
+                    'columns': [str(c) for c in df.columns]}
+        if self._fmt == 'parquet':
+            writer = lambda path: df.to_parquet(path, index=False)
+        else:
+            writer = lambda path: df.reset_index(drop=True).to_feather(path)
+        try:
+            self._atomic_write(data_path, writer)
+        except (pyarrow.ArrowException, TypeError, ValueError):
+            return None
+        self._write_manifest(manifest_path, manifest)
+        self.evict()
+        return data_path
+
+    def write_chunks(self, source, chunks, variant=None, schema=None):
+        """Streams DataFrame chunks parsed from source to the cache.
+
+        With the parquet format, each chunk is written as a row group as
+        soon as it is parsed, so the whole file is never held in memory.
+        Other formats concatenate the chunks and write them at once.
+
+        Parameters
+        ----------
+        source : str
+            The path to the source file.
+        chunks : iterable of DataFrames
+            The parsed chunks of the source, in order.
+        variant : str (Optional)
+            Distinguishes multiple parsings of the same source.
+        schema : pyarrow.Schema (Optional)
+            The types to which every chunk is cast. Defaults to the types
+            of the first chunk.
+
+        Returns the path to the columnar copy, or None if the chunks cannot
+        be represented in the columnar format.
+
+        """
+        if not HAS_PYARROW:
+            return None
+        if self._fmt != 'parquet':
+            frames = list(chunks)
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            return self.write(source, df, variant)
+        import pyarrow.parquet as pq
+        data_path, manifest_path = self._paths(source, variant)
+        stat = os.stat(source)
+        state = {'rows': 0, 'columns': []}
+
+        def writer(path):
+            parquet_writer = None
+            try:
+                for df in chunks:
+                    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+                    if parquet_writer is None:
+                        target = schema or table.schema
+                        target = target.with_metadata(table.schema.metadata)
+                        parquet_writer = pq.ParquetWriter(path, target)
+                        state['columns'] = [str(c) for c in df.columns]
+                    parquet_writer.write_table(table.cast(parquet_writer.schema))
+                    state['rows'] += df.shape[0]
+            finally:
+                if parquet_writer is not None:
+                    parquet_writer.close()
+            if parquet_writer is None:
+                raise ValueError("No chunks to write.")
+
+        try:
+            self._atomic_write(data_path, writer)
+        except (pyarrow.ArrowException, TypeError, ValueError):
+            return None
+        manifest = {'source': os.path.abspath(source),
+                    'variant': variant,
+                    'format': self._fmt,
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'sha1': self.digest(source),
+                    'rows': state['rows'],
+                    'columns': state['columns']}
+        self._write_manifest(manifest_path, manifest)
+        self.evict()
+        return data_path
+
+    def invalidate(self, source, variant=None):
+        """Removes the cache entry for the source."""
+        for path in self._paths(source, variant):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _entries(self):
+        """Returns the source, data path, manifest path, size and time of
+        last use of each entry in the cache."""
+        entries = []
+        if not os.path.isdir(self._directory):
+            return entries
+        for filename in os.listdir(self._directory):
+            if not filename.endswith(".json"):
+                continue
+            manifest_path = os.path.join(self._directory, filename)
+            manifest = self._read_manifest(manifest_path)
+            if manifest is None or 'format' not in manifest:
+                continue
+            data_path = manifest_path[:-5] + FORMATS[manifest['format']]
+            try:
+                stat = os.stat(data_path)
+            except OSError:
+                size, used = 0, 0
+            else:
+                size, used = stat.st_size, stat.st_mtime
+            entries.append((manifest.get('source'), data_path, manifest_path,
+                            size, used))
+        return entries
+
+    def evict(self):
+        """Removes the entries of sources which no longer exist, entries
+        not used within max_age seconds, and the least recently used
+        entries until the cache is within max_bytes. Returns the number of
+        entries removed."""
+        if not self._eviction:
+            return 0
+        entries = sorted(self._entries(), key=lambda e: e[4])
+        now = time.time()
+        removed = []
+        total = sum(e[3] for e in entries)
+        for entry in entries:
+            source, _, _, size, used = entry
+            if (not source or not os.path.exists(source)) or \
+                (self._max_age is not None and now - used > self._max_age) or \
+                (self._max_bytes is not None and total > self._max_bytes):
+                removed.append(entry)
+                total -= size
+        for _, data_path, manifest_path, _, _ in removed:
+            for path in (data_path, manifest_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        return len(removed)
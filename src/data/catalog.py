@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : catalog.py                                                        #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 4:12:37 pm                     #
+# Last Modified : Saturday, October 17th 2026, 4:12:37 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Locally persisted index of the files published by Inside Airbnb.
+
+The get-the-data page lists every file as a link of the form
+http://data.insideairbnb.com/<country>/<region>/<city>/<date>/<folder>/<file>.
+The Catalog parses those links once into entries of country, region,
+city, snapshot date, file kind, url and size, and stores them as json.
+Later refreshes issue a conditional request for the page and merge new
+links into the index, so that downloads are planned from local queries
+rather than by scraping the page on every run.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import re
+import tempfile
+import time
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml
+    PARSER = 'lxml'
+except ImportError:                                     # pragma: no cover
+    PARSER = 'html.parser'
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+CATALOG_PATH = os.path.join(PROJECT_DIR, "data", "external", "catalog.json")
+CATALOG_URL = "http://insideairbnb.com/get-the-data.html"
+URL_PATTERN = re.compile(r"^https?://[^/]+/(?P<country>[^/]+)/(?P<region>[^/]+)/"
+                         r"(?P<city>[^/]+)/(?P<date>\d{4}-\d{2}-\d{2})/"
+                         r"(?P<folder>data|visualisations)/(?P<filename>[^/]+)$")
+COLUMNS = ['country', 'region', 'city', 'date', 'kind', 'url', 'size']
+# --------------------------------------------------------------------------- #
+#                                Parsing                                      #
+# --------------------------------------------------------------------------- #
+def parse_url(url):
+    """Returns the catalog entry for a file url, or None if not a data file.
+
+    The kind of a file is its name without extensions, e.g. 'listings' for
+    data/listings.csv.gz. Summary files in the visualisations folder are
+    suffixed with '_summary', e.g. 'listings_summary'.
+
+    """
+    match = URL_PATTERN.match(url.strip())
+    if match is None:
+        return None
+    kind = match.group('filename').split(".")[0]
+    if match.group('folder') == 'visualisations':
+        kind = kind + "_summary"
+    return {'country': match.group('country'), 'region': match.group('region'),
+            'city': match.group('city'), 'date': match.group('date'),
+            'kind': kind, 'url': match.group(0), 'size': None}
+
+def parse_catalog(html):
+    """Parses the entries from the html of the get-the-data page.
+
+    Only anchor tags are parsed. Duplicate links are returned once.
+
+    """
+    soup = BeautifulSoup(html, PARSER, parse_only=SoupStrainer('a', href=True))
+    entries = {}
+    for anchor in soup.find_all('a', href=True):
+        entry = parse_url(anchor['href'])
+        if entry is not None:
+            entries.setdefault(entry['url'], entry)
+    return list(entries.values())
+# --------------------------------------------------------------------------- #
+#                                Catalog                                      #
+# --------------------------------------------------------------------------- #
+class Catalog:
+    """Persisted, queryable index of the Inside Airbnb files.
+
+    Parameters
+    ----------
+    path : str (Optional)
+        The path to the json catalog. Defaults to 'data/external/catalog.json'
+        in the project directory.
+    url : str (Optional)
+        The url of the get-the-data page.
+
+    """
+
+    def __init__(self, path=None, url=None):
+        self._path = path or CATALOG_PATH
+        self._url = url or CATALOG_URL
+        self._etag = None
+        self._last_modified = None
+        self._refreshed = None
+        self._entries = {}
+        self._index = None
+        if os.path.exists(self._path):
+            self._read()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def refreshed(self):
+        return self._refreshed
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _read(self):
+        with open(self._path, 'r') as f:
+            content = json.load(f)
+        self._etag = content.get('etag')
+        self._last_modified = content.get('last_modified')
+        self._refreshed = content.get('refreshed')
+        self._entries = {entry['url']: entry for entry in content['entries']}
+
+    def save(self):
+        """Writes the catalog atomically."""
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        content = {'url': self._url, 'etag': self._etag,
+                   'last_modified': self._last_modified,
+                   'refreshed': self._refreshed,
+                   'entries': list(self._entries.values())}
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(content, f)
+        os.replace(tmp, self._path)
+
+    def update(self, entries):
+        """Merges entries into the catalog and returns the number added.
+
+        Entries already in the catalog keep their known sizes. Entries no
+        longer listed upstream are retained.
+
+        """
+        added = 0
+        for entry in entries:
+            current = self._entries.get(entry['url'])
+            if current is None:
+                self._entries[entry['url']] = dict(entry)
+                added += 1
+            elif entry.get('size') is not None:
+                current['size'] = entry['size']
+        self._index = None
+        return added
+
+    def refresh(self, sizes=False, n_workers=8, timeout=60):
+        """Refreshes the catalog from the get-the-data page.
+
+        A conditional request is issued for the page, so the page is only
+        parsed if it has changed since the last refresh.
+
+        Parameters
+        ----------
+        sizes : bool
+            If True, the sizes of entries not yet known are obtained with
+            concurrent HEAD requests.
+        n_workers : int
+            The number of concurrent HEAD requests.
+        timeout : float
+            The timeout of each request in seconds.
+
+        Returns
+        -------
+        int : The number of entries added.
+
+        """
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+        response = requests.get(self._url, headers=headers, timeout=timeout)
+        added = 0
+        if response.status_code != 304:
+            response.raise_for_status()
+            added = self.update(parse_catalog(response.content))
+            self._etag = response.headers.get('ETag')
+            self._last_modified = response.headers.get('Last-Modified')
+        if sizes:
+            self._fetch_sizes(n_workers, timeout)
+        self._refreshed = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        self.save()
+        return added
+
+    def _fetch_sizes(self, n_workers, timeout):
+        """Obtains the sizes of entries with unknown sizes."""
+        unknown = [entry for entry in self._entries.values()
+                   if entry['size'] is None]
+        if not unknown:
+            return
+
+        def head(entry):
+            try:
+                response = requests.head(entry['url'], allow_redirects=True,
+                                         timeout=timeout)
+                length = response.headers.get('Content-Length')
+                if response.ok and length is not None:
+                    return int(length)
+            except requests.RequestException as e:
+                print("Failed to obtain size of {url}: {e}".format(
+                    url=entry['url'], e=e))
+            return None
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            for entry, size in zip(unknown, pool.map(head, unknown)):
+                entry['size'] = size
+        self._index = None
+
+    def to_frame(self):
+        """Returns the catalog as a DataFrame."""
+        if self._index is None:
+            df = pd.DataFrame(list(self._entries.values()), columns=COLUMNS)
+            df['date'] = pd.to_datetime(df['date'])
+            self._index = df.sort_values(['country', 'region', 'city', 'date',
+                                          'kind']).reset_index(drop=True)
+        return self._index
+
+    def query(self, cities=None, kinds=None, since=None, until=None,
+              countries=None, regions=None, latest=False, markets=None):
+        """Returns the entries matching the criteria as a DataFrame.
+
+        Parameters
+        ----------
+        cities, countries, regions : str or list of str (Optional)
+            The cities, countries or regions to select, as they appear in
+            urls, e.g. 'san-francisco', 'united-states' and 'ca'.
+        markets : str or list of str (Optional)
+            Names matched against the country, the region or the city, so
+            that 'ca' selects every city of the region.
+        kinds : str or list of str (Optional)
+            The kinds of file to select, e.g. 'listings' or 'reviews'.
+        since, until : str or datetime (Optional)
+            The inclusive range of snapshot dates to select.
+        latest : bool
+            If True, only the latest snapshot of each city is selected.
+
+        """
+        df = self.to_frame()
+        mask = pd.Series(True, index=df.index)
+        for column, values in (('city', cities), ('kind', kinds),
+                               ('country', countries), ('region', regions)):
+            if values is not None:
+                values = [values] if isinstance(values, str) else list(values)
+                mask &= df[column].isin(values)
+        if markets is not None:
+            markets = [markets] if isinstance(markets, str) else list(markets)
+            mask &= df['country'].isin(markets) | df['region'].isin(markets) | \
+                df['city'].isin(markets)
+        if since is not None:
+            mask &= df['date'] >= pd.Timestamp(since)
+        if until is not None:
+            mask &= df['date'] <= pd.Timestamp(until)
+        df = df[mask]
+        if latest:
+            last = df.groupby(['country', 'region', 'city'])['date'].transform('max')
+            df = df[df['date'] == last]
+        return df
+
+    def plan(self, directory, **query):
+        """Returns (url, path) download jobs for the entries of a query.
+
+        Files are placed in directory/<city>/<year>/ and named
+        <region>_<city>_<date>_<folder>_<file>, the layout of the raw data
+        directory. The query keywords are those of the query method.
+
+        """
+        jobs = []
+        for url, city, date in self.query(**query)[['url', 'city', 'date']].itertuples(
+                index=False):
+            filename = "_".join(url.split("/")[4:9])
+            path = os.path.join(directory, city, str(date.year), filename)
+            jobs.append((url, path.replace("\\", "/")))
+        return jobs
@@ -52,8 +52,12 @@ from collections import OrderedDict
 import pandas as pd
 pd.set_option('display.max_columns', None)
 
-from src.analysis.univariate import Describe
+from src.analysis.rollup import QuantSummary, tree_reduce
+from src.analysis.sketch import QualSketch
 from src.data.file_classes import File
+from src.data.parsers import NumberParser, PRICE_COLUMNS
+from src.data.replacement import ReplacementEngine
+from src.data.union import UnionView
 from src.utils.system import get_size
 from .constants import DTYPES
 # --------------------------------------------------------------------------- #
@@ -134,43 +138,51 @@ class DataCollection(DataComponent):
         self._data_collection = OrderedDict()
 
     def merge_data(self):
-        """Merges all DataSets and DataCollections into a single DataFrame."""
-        merged = pd.DataFrame()
-        for _, data_object in self._data_collection.items():
-            df = data_object.get_data()
-            merged = pd.concat([merged,df], axis=0)
-        return merged
+        """Returns a lazy UnionView of all DataSets and DataCollections.
+
+        Nested collections are flattened into a single view of the
+        DataFrames of their DataSets. No data are copied until the view is
+        iterated in chunks or materialized with its to_frame method.
+
+        """
+        return UnionView([data_object.merge_data() 
+                          if isinstance(data_object, DataCollection) 
+                          else data_object.get_data()
+                          for _, data_object in self._data_collection.items()])
 
 
     def metadata(self):
         """Prints DataCollection metadata."""
         super(DataCollection, self).metadata(verbose)
         print("="*30, "DataType Summary", "="*30)
-        merged = self._merge_data()
+        merged = self.merge_data()
         metadata = pd.DataFrame()
         metadata[self._name] = merged.dtypes.value_counts()
         print(metadata)
         return metadata
 
 
+    def summaries(self):
+        """Returns the QuantSummary and QualSketch of the collection, rolled
+        up by tree reduction from those of the contained objects."""
+        return tree_reduce((data_object.summaries() for _, data_object 
+                            in self._data_collection.items()),
+                           lambda a, b: (a[0].merge(b[0]), a[1].merge(b[1])))
+
     def summarize(self):
         """Descriptive summaries for DataCollection and DataSet objects.
-        
-        Parameters
-        ----------
-        verbose : Bool
-            True if the summary should be printed.
 
+        Statistics are rolled up from the summaries of the contained
+        objects, so the data are never merged into a single DataFrame.
+        
         Returns
         -------
         Dict : Cointaining quantitative and qualitative descriptive 
                statistics.
         
         """
-        describe = Describe()
-        df = self.merge_data()
-        describe.fit(df)            
-        summary = describe.get_analysis()        
+        quant, qual = self.summaries()
+        summary = {'quant': quant.describe(), 'qual': qual.describe()}
     
         print("#","=*35  Quantitative Analysis  35*=","#")
         print(summary['quant'])
@@ -222,13 +234,20 @@ class DataCollection(DataComponent):
             Indicates whether the pattern and replacement are valid regex.
 
         """
-        for _, data_object in self._data_collection.items():
-            if columns:
-                data_object.replace_string(pattern, replace, columns, regex)
-            else:
-                data_object.replace_string(pattern, replace, regex)
-            self._add(data_object)
+        return self.replace_strings([(pattern, replace, columns)], regex)
+
+    def replace_strings(self, rules, regex=True, n_jobs=None):
+        """Applies many replacement rules to the contained DataSet objects.
 
+        The rules are compiled once for all DataSets. See 
+        DataSet.replace_strings.
+
+        """
+        engine = rules if isinstance(rules, ReplacementEngine) else \
+            ReplacementEngine(rules, regex=regex, n_jobs=n_jobs)
+        for _, data_object in self._data_collection.items():
+            data_object.replace_strings(engine)
+        return self
 
     def cast_types(self, data_types):
         """Cast objects of the dataframe to designated types."""
@@ -302,11 +321,19 @@ class DataSet(DataComponent):
         print(metadata)        
         return metadata
     
+    def summaries(self):
+        """Returns the QuantSummary and QualSketch of the DataSet.
+
+        They are computed on each call, since the data may be changed by
+        replace_strings, RinseData or callers of get_data.
+
+        """
+        return (QuantSummary().update(self._df), QualSketch().update(self._df))
+
     def summarize(self, verbose=True):
         """Prints DataSet descriptive statistics."""
-        describe = Describe()
-        describe.fit(self)
-        summary = describe.get_analysis()
+        quant, qual = self.summaries()
+        summary = {'quant': quant.describe(), 'qual': qual.describe()}
         if verbose:
             print("\n#=*35  Quantitative Analysis  35*=#")
             print(summary['quant'])
@@ -335,11 +362,26 @@ class DataSet(DataComponent):
             Indicates whether the pattern and replacement are valid regex.
 
         """
-        if columns:
-            self._df[columns] = self._df[columns].replace({pattern:replace}, regex=regex)
-        else:
-            self._df = self._df.replace({pattern:replace}, regex=regex)
+        return self.replace_strings([(pattern, replace, columns)], regex)
 
+    def replace_strings(self, rules, regex=True, n_jobs=None):
+        """Applies many replacement rules to the text columns in one pass.
+        
+        Parameters
+        ----------
+        rules : list of tuples or ReplacementEngine
+            (pattern, replace) or (pattern, replace, columns) rules, applied
+            in order, or an engine compiled from such rules.
+        regex : Bool
+            Indicates whether the patterns are valid regex.
+        n_jobs : int (Optional)
+            The number of worker processes across which columns are spread.
+
+        """
+        engine = rules if isinstance(rules, ReplacementEngine) else \
+            ReplacementEngine(rules, regex=regex, n_jobs=n_jobs)
+        self._df = engine.transform(self._df)
+        return self
 
     def import_data(self, filename, columns=None):
         """Reads the data from filename and appends it to the dataframe member."""
@@ -451,19 +493,16 @@ class RinseData(QuantStudio):
 
     def __init__(self, name):
         super(RinseData, self).__init__(name)
+        self._parser = NumberParser(PRICE_COLUMNS)
 
+    def transform(self, dataset, y=None):
+        """Parses the currency columns of the dataset into floats."""
+        self._parser.parse(dataset.get_data())
+        return dataset
 
-    vars = [price,weekly_price, monthly_price,	security_deposit, 
-            cleaning_fee,	extra_people]
-    df = dataset.get_data()
-    for var in vars:
-        df[var] = df[var].str.replace(',', '')
-        df[var] = df[var].str.replace('$', '')
-        df[var] = df[var].str.replace('%', '')
-    
-    dataset.add(df)
-
-    return dataset
+    def report(self):
+        """Returns the counts of invalid currency tokens by column."""
+        return self._parser.report()
 
 
 
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : delta.py                                                          #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 5:58:13 pm                     #
+# Last Modified : Saturday, October 17th 2026, 5:58:13 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Listing-level change feed between consecutive snapshots.
+
+Consecutive snapshots of a market are mostly identical rows. A Delta
+records only the listings added, removed and changed between two
+snapshots keyed on the listing id, and for changed listings only the
+cells which changed. Rows are compared by a 64-bit content hash, and
+changed rows are compared column by column, so the comparison touches
+each cell once. A History holds the first snapshot of a series in full
+and a Delta for each later snapshot, from which any snapshot can be
+reconstructed.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .schema import conform
+from .union import union_columns
+# --------------------------------------------------------------------------- #
+#                                 Hashing                                     #
+# --------------------------------------------------------------------------- #
+def row_hashes(df, columns=None):
+    """Returns a uint64 content hash of each row of a DataFrame.
+
+    Missing values hash equally, and categorical values hash as their
+    categories, so rows read with differing vocabularies hash alike.
+
+    """
+    columns = list(columns) if columns is not None else list(df.columns)
+    if not columns:
+        return np.zeros(df.shape[0], dtype=np.uint64)
+    return pd.util.hash_pandas_object(df[columns], index=False).values
+
+def _cell_changes(old, new, columns):
+    """Returns a boolean DataFrame of the cells which differ."""
+    changes = {}
+    for column in columns:
+        changes[column] = (
+            pd.util.hash_pandas_object(old[column], index=False).values !=
+            pd.util.hash_pandas_object(new[column], index=False).values)
+    return pd.DataFrame(changes, index=new.index)
+
+def _numeric(dtype):
+    """Returns True for numeric, non-boolean dtypes."""
+    return pd.api.types.is_numeric_dtype(dtype) and \
+        not pd.api.types.is_bool_dtype(dtype)
+
+def _comparable(before, after, columns):
+    """Casts numeric columns whose dtypes differ between two snapshots to a
+    common dtype, so that equal values hash alike.
+
+    An integer column read as float in one snapshot, e.g. because of a
+    missing value elsewhere in the column, would otherwise count every
+    row as changed.
+
+    """
+    casts = {}
+    for column in columns:
+        a, b = before[column].dtype, after[column].dtype
+        if a == b or not (_numeric(a) and _numeric(b)):
+            continue
+        if isinstance(a, np.dtype) and isinstance(b, np.dtype) and \
+                a.kind in 'iu' and b.kind in 'iu':
+            casts[column] = np.result_type(a, b)
+        else:
+            casts[column] = np.dtype('float64')
+    if not casts:
+        return before, after
+    return before.astype(casts), after.astype(casts)
+
+def _keyed(df, key):
+    """Indexes a DataFrame by its key column, which must be unique."""
+    if key not in df.columns:
+        raise KeyError("Key column '{key}' not in DataFrame.".format(key=key))
+    df = df.set_index(key)
+    if not df.index.is_unique:
+        raise ValueError("Key column '{key}' has duplicate values.".format(key=key))
+    return df
+# --------------------------------------------------------------------------- #
+#                                  Delta                                      #
+# --------------------------------------------------------------------------- #
+class Delta:
+    """The changes from one snapshot to the next.
+
+    Parameters
+    ----------
+    key : str
+        The name of the key column.
+    columns : list
+        The columns of the later snapshot, excluding the key.
+    order : array-like
+        The keys of the later snapshot in row order.
+    added : DataFrame
+        The rows of listings added, indexed by key.
+    removed : array-like
+        The keys of listings removed.
+    changed : DataFrame
+        The new values of changed listings, indexed by key, for the columns
+        in which any listing changed.
+    mask : DataFrame
+        Boolean DataFrame, aligned with changed, designating the cells
+        which changed. Other cells of changed hold no meaningful value.
+    dtypes : dict (Optional)
+        The dtype name of each numeric column of the later snapshot, which
+        apply restores.
+
+    """
+
+    def __init__(self, key, columns, order, added, removed, changed, mask,
+                 dtypes=None):
+        self.key = key
+        self.columns = list(columns)
+        self.order = pd.Index(order, name=key)
+        self.added = added
+        self.removed = pd.Index(removed, name=key)
+        self.changed = changed
+        self.mask = mask
+        self.dtypes = dict(dtypes) if dtypes is not None else {}
+
+    def __repr__(self):
+        return "Delta(added={a}, removed={r}, changed={c})".format(
+            a=self.added.shape[0], r=len(self.removed), c=self.changed.shape[0])
+
+    def summary(self):
+        """Returns the number of listings added, removed and changed, and
+        the number of changes in each column."""
+        counts = {'added': self.added.shape[0], 'removed': len(self.removed),
+                  'changed': self.changed.shape[0]}
+        return counts, self.mask.sum().sort_values(ascending=False)
+
+    def changes(self, column):
+        """Returns the new values of a column for listings in which it
+        changed, as a Series indexed by key. Added listings are included."""
+        values = []
+        if column in self.mask.columns:
+            values.append(self.changed.loc[self.mask[column].values, column])
+        if column in self.added.columns:
+            values.append(self.added[column])
+        if not values:
+            return pd.Series([], name=column, dtype='float64')
+        return pd.concat(values) if len(values) > 1 else values[0]
+
+    def apply(self, base):
+        """Returns the later snapshot, given the earlier snapshot."""
+        df = _keyed(base, self.key)
+        df = conform(df, self.columns)
+        df = df.drop(index=self.removed)
+        if self.changed.shape[0]:
+            df = df.copy()
+            for column in self.mask.columns:
+                rows = self.mask[column].values
+                if not rows.any():
+                    continue
+                values = self.changed.loc[rows, column]
+                df[column] = _assign(df[column], values)
+        if self.added.shape[0]:
+            categorical = [c for c in self.columns
+                           if isinstance(df[c].dtype, pd.CategoricalDtype)]
+            df = pd.concat([df, conform(self.added, self.columns)], axis=0,
+                           sort=False)
+            # Categorical columns with differing categories concatenate as
+            # objects, and are recoded to the union of categories.
+            for column in categorical:
+                if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype('category')
+        df = df.reindex(self.order)
+        # Columns read with another dtype in the earlier snapshot take the
+        # dtype of the later one.
+        casts = {column: dtype for column, dtype in self.dtypes.items()
+                 if column in df.columns and str(df[column].dtype) != dtype}
+        if casts:
+            df = df.astype(casts)
+        return df.reset_index()
+
+    def save(self, directory):
+        """Writes the delta to Parquet files and a json manifest."""
+        os.makedirs(directory, exist_ok=True)
+        self.added.reset_index().to_parquet(
+            os.path.join(directory, "added.parquet"), index=False)
+        self.changed.reset_index().to_parquet(
+            os.path.join(directory, "changed.parquet"), index=False)
+        self.mask.reset_index().to_parquet(
+            os.path.join(directory, "mask.parquet"), index=False)
+        pd.DataFrame({self.key: self.order}).to_parquet(
+            os.path.join(directory, "order.parquet"), index=False)
+        pd.DataFrame({self.key: self.removed}).to_parquet(
+            os.path.join(directory, "removed.parquet"), index=False)
+        with open(os.path.join(directory, "delta.json"), 'w') as f:
+            json.dump({'key': self.key, 'columns': self.columns,
+                       'dtypes': self.dtypes}, f, indent=2)
+
+    @classmethod
+    def load(cls, directory):
+        """Reads a delta written by save."""
+        with open(os.path.join(directory, "delta.json"), 'r') as f:
+            meta = json.load(f)
+        key = meta['key']
+        read = lambda name: pd.read_parquet(os.path.join(directory, name + ".parquet"))
+        return cls(key, meta['columns'], read("order")[key],
+                   read("added").set_index(key), read("removed")[key],
+                   read("changed").set_index(key), read("mask").set_index(key),
+                   meta.get('dtypes'))
+
+def _assign(series, values):
+    """Assigns values to a series by index, widening categories as needed."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        new = pd.Index(values.dropna().unique()).difference(series.cat.categories)
+        if len(new):
+            series = series.cat.add_categories(new)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+    series = series.copy()
+    series.loc[values.index] = values
+    return series
+
+def diff(old, new, key='id'):
+    """Computes the Delta from the old to the new snapshot.
+
+    Parameters
+    ----------
+    old, new : DataFrame
+        Consecutive snapshots, each with a unique key column. Columns of
+        either snapshot absent from the other are treated as missing.
+    key : str
+        The name of the key column.
+
+    Numeric columns read with differing dtypes, e.g. int64 in one snapshot
+    and float64 in the other, are compared by value.
+
+    """
+    columns = [c for c in union_columns([new, old]) if c != key]
+    before = conform(_keyed(old, key), columns)
+    after = conform(_keyed(new, key), columns)
+    added = after.index.difference(before.index, sort=False)
+    removed = before.index.difference(after.index, sort=False)
+    common = after.index.intersection(before.index, sort=False)
+    before, current = _comparable(before.loc[common], after.loc[common],
+                                  columns)
+    differs = row_hashes(before) != row_hashes(current)
+    mask = _cell_changes(before[differs], current[differs], columns)
+    mask = mask.loc[:, mask.any(axis=0).values]
+    changed = after.loc[common].loc[differs, list(mask.columns)]
+    dtypes = {c: str(new[c].dtype) for c in new.columns
+              if c != key and _numeric(new[c].dtype)}
+    return Delta(key, [c for c in new.columns if c != key], after.index,
+                 after.loc[added], removed, changed, mask, dtypes)
+# --------------------------------------------------------------------------- #
+#                                 History                                     #
+# --------------------------------------------------------------------------- #
+class History:
+    """A series of snapshots stored as a base snapshot and deltas.
+
+    Parameters
+    ----------
+    base : DataFrame
+        The first snapshot in full.
+    deltas : list of Delta
+        The delta of each later snapshot from its predecessor.
+    keys : list (Optional)
+        The label of each snapshot, e.g. its date.
+
+    """
+
+    def __init__(self, base, deltas, keys=None):
+        self.base = base
+        self.deltas = list(deltas)
+        self.keys = list(keys) if keys is not None else \
+            list(range(len(self.deltas) + 1))
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_snapshots(cls, frames, keys=None, key='id'):
+        """Builds a History from consecutive snapshots in order.
+
+        Snapshots may be supplied by an iterator, in which case no more
+        than two are held in memory at a time.
+
+        """
+        base, previous, deltas = None, None, []
+        for df in frames:
+            if previous is None:
+                base = df
+            else:
+                deltas.append(diff(previous, df, key))
+            previous = df
+        if base is None:
+            raise ValueError("At least one snapshot is required.")
+        return cls(base, deltas, keys)
+
+    @classmethod
+    def from_union(cls, df, key='id', snapshot='snapshot'):
+        """Builds a History from stacked snapshots, e.g. a DataSet loaded
+        from a directory, using the snapshot column to order them."""
+        labels = df[snapshot].cat.categories if \
+            isinstance(df[snapshot].dtype, pd.CategoricalDtype) else \
+            pd.unique(df[snapshot])
+        groups = {label: frame for label, frame in df.groupby(snapshot,
+                                                              observed=True,
+                                                              sort=False)}
+        labels = [label for label in labels if label in groups]
+        frames = [groups[label].drop(columns=snapshot) for label in labels]
+        return cls.from_snapshots(frames, labels, key)
+
+    def _position(self, snapshot):
+        try:
+            return self.keys.index(snapshot)
+        except ValueError:
+            raise KeyError("Snapshot '{s}' is not in the history.".format(s=snapshot))
+
+    def snapshot(self, snapshot):
+        """Reconstructs a snapshot from the base and deltas."""
+        df = self.base
+        for delta in self.deltas[:self._position(snapshot)]:
+            df = delta.apply(df)
+        return df
+
+    def changes(self, column):
+        """Returns the change feed of a column across the history.
+
+        The result has a row for each listing in each later snapshot in
+        which the column changed or the listing was added, with the
+        snapshot, key and new value.
+
+        """
+        feeds = []
+        for label, delta in zip(self.keys[1:], self.deltas):
+            values = delta.changes(column)
+            feeds.append(pd.DataFrame({'snapshot': label,
+                                       delta.key: values.index,
+                                       column: values.values}))
+        if not feeds:
+            return pd.DataFrame(columns=['snapshot', column])
+        return pd.concat(feeds, ignore_index=True)
+
+    def summary(self):
+        """Returns the counts of added, removed and changed listings per
+        snapshot."""
+        rows = [delta.summary()[0] for delta in self.deltas]
+        return pd.DataFrame(rows, index=pd.Index(self.keys[1:], name='snapshot'))
+
+    def save(self, directory):
+        """Writes the base snapshot and each delta under directory."""
+        os.makedirs(directory, exist_ok=True)
+        self.base.to_parquet(os.path.join(directory, "base.parquet"), index=False)
+        for i, delta in enumerate(self.deltas):
+            delta.save(os.path.join(directory, "delta_{i:04d}".format(i=i)))
+        with open(os.path.join(directory, "history.json"), 'w') as f:
+            json.dump({'keys': [str(k) for k in self.keys]}, f, indent=2)
+
+    @classmethod
+    def load(cls, directory):
+        """Reads a History written by save."""
+        with open(os.path.join(directory, "history.json"), 'r') as f:
+            keys = json.load(f)['keys']
+        base = pd.read_parquet(os.path.join(directory, "base.parquet"))
+        deltas = [Delta.load(os.path.join(directory, "delta_{i:04d}".format(i=i)))
+                  for i in range(len(keys) - 1)]
+        return cls(base, deltas, keys)
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : download.py                                                       #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 3:02:44 pm                     #
+# Last Modified : Saturday, October 17th 2026, 3:02:44 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Concurrent, resumable download engine for Inside Airbnb files.
+
+Files are downloaded by a bounded pool of threads with large streaming
+buffers. Each download is written to a '.part' file which is resumed with
+an HTTP Range request after a dropped connection, and renamed once
+complete. A checksum manifest records the size, sha256, ETag and
+Last-Modified header of every completed file, so that later runs issue
+conditional requests and skip files which have not changed upstream.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+
+import requests
+
+BLOCKSIZE = 1 << 20
+# --------------------------------------------------------------------------- #
+#                                Manifest                                     #
+# --------------------------------------------------------------------------- #
+class Manifest:
+    """Checksum manifest of downloaded files stored as json.
+
+    Parameters
+    ----------
+    path : str
+        The path to the manifest file. Entries are keyed by file paths
+        relative to the directory of the manifest.
+
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self._entries = json.load(f)
+
+    @property
+    def path(self):
+        return self._path
+
+    def _key(self, path):
+        directory = os.path.dirname(os.path.abspath(self._path))
+        return os.path.relpath(os.path.abspath(path), directory).replace("\\", "/")
+
+    def get(self, path):
+        with self._lock:
+            return self._entries.get(self._key(path))
+
+    def update(self, path, entry):
+        """Records the entry for a file and saves the manifest."""
+        with self._lock:
+            self._entries[self._key(path)] = entry
+            self._save()
+
+    def remove(self, path):
+        with self._lock:
+            self._entries.pop(self._key(path), None)
+            self._save()
+
+    def _save(self):
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+        os.replace(tmp, self._path)
+
+    def verify(self, path):
+        """Returns True if a file matches the size and sha256 of its entry."""
+        entry = self.get(path)
+        if entry is None or not os.path.exists(path):
+            return False
+        if os.path.getsize(path) != entry['size']:
+            return False
+        return sha256(path) == entry['sha256']
+
+def sha256(path):
+    """Computes the sha256 checksum of a file."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCKSIZE), b''):
+            h.update(block)
+    return h.hexdigest()
+# --------------------------------------------------------------------------- #
+#                               Downloader                                    #
+# --------------------------------------------------------------------------- #
+class DownloadError(Exception):
+    """Raised when a file cannot be downloaded after all retries."""
+
+
+class Downloader:
+    """Downloads files concurrently with resume, retry and conditional GET.
+
+    Parameters
+    ----------
+    manifest : str or Manifest
+        The checksum manifest, or the path to it, e.g. 'data/raw/manifest.json'.
+    n_workers : int
+        The number of concurrent downloads.
+    chunk_size : int
+        The size in bytes of the streaming buffer.
+    retries : int
+        The number of retries of a failed download.
+    backoff : float
+        The base delay in seconds between retries. The delay doubles with
+        each retry and is randomized by up to 50%.
+    timeout : float
+        The connect and read timeout of each request in seconds.
+    verify : bool
+        If True, the checksum of a completed file is verified against the
+        manifest before a conditional request is issued.
+
+    """
+
+    RETRY_STATUS = (408, 429, 500, 502, 503, 504)
+
+    def __init__(self, manifest, n_workers=4, chunk_size=BLOCKSIZE, retries=5,
+                 backoff=1.0, timeout=60, verify=False):
+        self._manifest = manifest if isinstance(manifest, Manifest) \
+            else Manifest(manifest)
+        self._n_workers = n_workers
+        self._chunk_size = chunk_size
+        self._retries = retries
+        self._backoff = backoff
+        self._timeout = timeout
+        self._verify = verify
+        self._local = threading.local()
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def manifest(self):
+        return self._manifest
+
+    @property
+    def n_workers(self):
+        return self._n_workers
+
+    def _session(self):
+        """Returns a requests Session for the current thread."""
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def download_all(self, jobs):
+        """Downloads (url, path) pairs concurrently.
+
+        Returns a list of result dictionaries in the order of jobs. See
+        the download method.
+
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self._n_workers, len(jobs))) as pool:
+            futures = [pool.submit(self._safe_download, url, path)
+                       for url, path in jobs]
+            return [future.result() for future in futures]
+
+    def _safe_download(self, url, path):
+        try:
+            return self.download(url, path)
+        except Exception as e:
+            self._logger.error("Failed to download %s: %s", url, e)
+            return {'url': url, 'path': path, 'status': 'failed', 'bytes': 0,
+                    'error': e}
+
+    def download(self, url, path):
+        """Downloads a single file, resuming and retrying as needed.
+
+        Returns
+        -------
+        dict : with the url, path, status and number of bytes transferred.
+            The status is 'downloaded', 'resumed' or 'not-modified'.
+
+        Raises
+        ------
+        DownloadError if the file cannot be downloaded after all retries.
+
+        """
+        entry = self._manifest.get(path)
+        if entry is not None and os.path.exists(path):
+            if not self._verify or self._manifest.verify(path):
+                if self._not_modified(url, entry):
+                    return {'url': url, 'path': path, 'status': 'not-modified',
+                            'bytes': 0, 'error': None}
+        elif os.path.exists(path):
+            # A file without a manifest entry may be truncated. It is
+            # resumed, which completes it or confirms that it is complete.
+            os.replace(path, path + ".part")
+
+        transferred = 0
+        resumed = os.path.exists(path + ".part")
+        for attempt in range(self._retries + 1):
+            try:
+                transferred += self._fetch(url, path)
+                status = 'resumed' if resumed else 'downloaded'
+                return {'url': url, 'path': path, 'status': status,
+                        'bytes': transferred, 'error': None}
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError,
+                    _RetryableStatus, _Incomplete) as e:
+                transferred += getattr(e, 'transferred', 0)
+                if attempt == self._retries:
+                    raise DownloadError("Failed to download {url} after {n} "
+                                        "retries: {e}".format(url=url,
+                                                              n=self._retries, e=e))
+                resumed = resumed or os.path.exists(path + ".part")
+                delay = self._backoff * 2 ** attempt * (1 + random.random() / 2)
+                self._logger.warning("Retrying %s in %.1fs: %s", url, delay, e)
+                time.sleep(delay)
+
+    def _not_modified(self, url, entry):
+        """Issues a conditional request for a completed file."""
+        headers = {'Accept-Encoding': 'identity'}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        if len(headers) == 1:
+            return False
+        response = self._session().get(url, headers=headers, stream=True,
+                                       timeout=self._timeout)
+        response.close()
+        return response.status_code == 304
+
+    def _fetch(self, url, path):
+        """Streams url into path + '.part', resuming from its current size."""
+        part = path + ".part"
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        # Files are stored as served, so content encoding is not negotiated.
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = 'bytes={offset}-'.format(offset=offset)
+        partial = (self._manifest.get(part) or {})
+        if offset and partial.get('etag'):
+            headers['If-Range'] = partial['etag']
+
+        response = self._session().get(url, headers=headers, stream=True,
+                                       timeout=self._timeout)
+        with response:
+            if response.status_code in self.RETRY_STATUS:
+                raise _RetryableStatus(response.status_code)
+            if response.status_code == 416 and offset:
+                # The partial file is already complete.
+                total = _total_size(response)
+                if total is None or total == offset:
+                    self._complete(url, path, response, offset)
+                    return 0
+                offset = 0
+                os.remove(part)
+                raise _Incomplete("Range not satisfiable, restarting.")
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            expected = _total_size(response) if response.status_code == 206 \
+                else _content_length(response)
+            self._manifest.update(part, {'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')})
+            transferred = 0
+            with open(part, 'ab' if offset else 'wb') as f:
+                try:
+                    for chunk in response.iter_content(chunk_size=self._chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            transferred += len(chunk)
+                except Exception as e:
+                    e.transferred = transferred
+                    raise
+            size = offset + transferred
+            if expected is not None and size != expected:
+                raise _Incomplete("Received {size} of {expected} bytes.".format(
+                    size=size, expected=expected), transferred)
+            self._complete(url, path, response, size)
+            return transferred
+
+    def _complete(self, url, path, response, size):
+        """Renames the partial file and records it in the manifest."""
+        part = path + ".part"
+        checksum = sha256(part)
+        os.replace(part, path)
+        self._manifest.remove(part)
+        self._manifest.update(path, {
+            'url': url, 'size': size, 'sha256': checksum,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'downloaded': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())})
+        self._logger.info("Downloaded %s (%.2fMb)", path, size / BLOCKSIZE)
+
+
+class _RetryableStatus(Exception):
+    def __init__(self, status):
+        super(_RetryableStatus, self).__init__("HTTP status {s}".format(s=status))
+
+
+class _Incomplete(Exception):
+    def __init__(self, message, transferred=0):
+        super(_Incomplete, self).__init__(message)
+        self.transferred = transferred
+
+def _content_length(response):
+    length = response.headers.get('Content-Length')
+    return int(length) if length is not None else None
+
+def _total_size(response):
+    """Returns the total size from a Content-Range header."""
+    content_range = response.headers.get('Content-Range', '')
+    total = content_range.rsplit("/", 1)[-1]
+    return int(total) if total.isdigit() else None
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : ingest.py                                                         #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 5:08:51 pm                     #
+# Last Modified : Saturday, October 17th 2026, 5:08:51 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Streaming ingestion of downloaded snapshots into typed Parquet.
+
+The IngestPipeline couples the Downloader to a pool of converters through
+a bounded queue. As soon as a file has been downloaded, a converter
+decompresses and parses it in chunks with its listings schema and writes
+each chunk as a Parquet row group into the columnar cache. Downloads of further files proceed while earlier files
+are converted, and a full queue holds back the downloaders until the
+converters catch up. DataSet.load then reads the typed Parquet copy
+directly rather than parsing the csv file.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+
+from .cache import ColumnarCache, HAS_PYARROW
+from .download import Downloader
+from .parsers import NumberParser
+from .schema import get_schema, infer_schema, read_header
+
+if HAS_PYARROW:
+    import pyarrow
+
+DEFAULT_CHUNKSIZE = 100000
+# --------------------------------------------------------------------------- #
+#                               Arrow Types                                   #
+# --------------------------------------------------------------------------- #
+def arrow_schema(schema, columns):
+    """Returns the pyarrow schema of columns parsed with a listings Schema.
+
+    Every chunk of a file is cast to this schema, so that chunks in which
+    a column is entirely missing, or which observe different categories,
+    are written with the same types. Columns not in the schema are typed
+    as strings.
+
+    """
+    types = {'int': pyarrow.int64(), 'float': None, 'text': pyarrow.string(),
+             'category': pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+             'bool': pyarrow.bool_(), 'date': pyarrow.timestamp('ns'),
+             'currency': None, 'percent': None}
+    fields = []
+    for column in columns:
+        if column in schema:
+            field = schema[column]
+            dtype = types[field.kind]
+            if dtype is None:
+                dtype = pyarrow.from_numpy_dtype(field.dtype)
+        else:
+            dtype = pyarrow.string()
+        fields.append(pyarrow.field(column, dtype))
+    return pyarrow.schema(fields)
+
+def convert(path, cache=None, schema='infer', chunksize=DEFAULT_CHUNKSIZE,
+            parser=None):
+    """Parses a csv file in chunks into the columnar cache.
+
+    Parameters
+    ----------
+    path : str
+        The path to the csv file.
+    cache : ColumnarCache (Optional)
+        The cache into which the file is written. Defaults to the cache in
+        the default cache directory.
+    schema : Schema, int or str
+        The Schema, the version of the listings schema, or 'infer' to infer
+        the version from the header of the file.
+    chunksize : int
+        The number of rows parsed and written at a time.
+    parser : NumberParser (Optional)
+        Parses the currency and percent columns and counts their invalid
+        tokens across files. A parser for the file is created if None.
+
+    Returns
+    -------
+    dict : with the path of the Parquet copy, the number of rows written,
+        the number of invalid currency and percent tokens, and whether the
+        file was already cached, in which case no rows are written.
+
+    """
+    cache = cache or ColumnarCache()
+    header = list(read_header(path))
+    if schema == 'infer':
+        schema = infer_schema(header)
+    elif not hasattr(schema, 'read_csv'):
+        schema = get_schema('listings', schema)
+    if cache.isfresh(path, schema.key):
+        return {'target': cache.path(path, schema.key), 'rows': None,
+                'invalid': None, 'cached': True}
+    parser = parser or NumberParser([])
+    invalid = parser.invalid
+    chunks = schema.read_csv(path, chunksize=chunksize, parser=parser)
+    target = cache.write_chunks(path, chunks, schema.key,
+                                arrow_schema(schema, header))
+    if target is None:
+        raise ValueError("Unable to write '{path}' to the columnar cache.".format(
+            path=path))
+    manifest = cache.manifest(path, schema.key)
+    return {'target': target, 'rows': manifest['rows'],
+            'invalid': parser.invalid - invalid, 'cached': False}
+# --------------------------------------------------------------------------- #
+#                             IngestPipeline                                  #
+# --------------------------------------------------------------------------- #
+class IngestPipeline:
+    """Downloads files and converts each to Parquet as soon as it arrives.
+
+    Parameters
+    ----------
+    downloader : Downloader or str
+        The Downloader, or the path to its checksum manifest.
+    cache : ColumnarCache (Optional)
+        The cache into which files are written. Defaults to the cache in
+        the default cache directory.
+    schema : Schema, int or str
+        The schema used to parse files. See convert.
+    chunksize : int
+        The number of rows parsed and written at a time.
+    n_converters : int
+        The number of files converted concurrently.
+    queue_size : int
+        The number of downloaded files which may await conversion before
+        downloads are held back.
+
+    """
+
+    def __init__(self, downloader, cache=None, schema='infer',
+                 chunksize=DEFAULT_CHUNKSIZE, n_converters=2, queue_size=4):
+        if not HAS_PYARROW:
+            raise Exception("The ingestion pipeline requires pyarrow.")
+        self._downloader = downloader if isinstance(downloader, Downloader) \
+            else Downloader(downloader)
+        self._cache = cache or ColumnarCache()
+        self._schema = schema
+        self._chunksize = chunksize
+        self._n_converters = n_converters
+        self._queue_size = queue_size
+
+    @property
+    def cache(self):
+        return self._cache
+
+    def run(self, jobs):
+        """Downloads and converts (url, path) pairs.
+
+        Returns
+        -------
+        list of dict : one per job in order, with the url, path, download
+            status, bytes transferred, Parquet target, rows written, the
+            number of invalid currency and percent tokens, the download and
+            conversion times, and any error.
+
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+        if not jobs:
+            return results
+        pending = queue.Queue(maxsize=self._queue_size)
+
+        def produce(i, url, path):
+            start = time.perf_counter()
+            result = self._downloader._safe_download(url, path)
+            result.update({'target': None, 'rows': None, 'invalid': None,
+                           'convert_time': None,
+                           'download_time': time.perf_counter() - start})
+            results[i] = result
+            if result['status'] != 'failed':
+                pending.put(i)
+
+        def consume():
+            while True:
+                i = pending.get()
+                if i is None:
+                    return
+                result = results[i]
+                start = time.perf_counter()
+                try:
+                    converted = convert(result['path'], self._cache, self._schema,
+                                        self._chunksize)
+                    result['target'] = converted['target']
+                    result['rows'] = converted['rows']
+                    result['invalid'] = converted['invalid']
+                except Exception as e:
+                    print("Failed to convert '{path}': {e}".format(
+                        path=result['path'], e=e))
+                    result['error'] = e
+                result['convert_time'] = time.perf_counter() - start
+
+        converters = [threading.Thread(target=consume, daemon=True)
+                      for _ in range(self._n_converters)]
+        for converter in converters:
+            converter.start()
+        try:
+            n_workers = min(self._downloader.n_workers, len(jobs))
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                for future in [pool.submit(produce, i, url, path)
+                               for i, (url, path) in enumerate(jobs)]:
+                    future.result()
+        finally:
+            for _ in converters:
+                pending.put(None)
+            for converter in converters:
+                converter.join()
+        return results
@@ -20,16 +20,39 @@
 # =========================================================================== #
 """ Module for creating a single listings object from multiple files.""" 
 from abc import ABC, abstractmethod
+import copy
 import math
 import os
+import tempfile
+import threading
+import time
 
-from collections import OrderedDict 
+from collections import Counter, OrderedDict 
+from contextlib import contextmanager
 import numpy as np
 import pandas as pd
 
+from .cache import ColumnarCache, HAS_PYARROW
+from .delta import History
+from .sampling import Reservoir, TailBuffer, head, sample_positions
+from .sampling import group_positions, stratified_positions
+from .store import Store
+from .schema import Schema, conform, get_schema, infer_schema, read_header
+from .schema import union_schema
+from .writers import with_format, write
+from .union import list_files, snapshot_of, union_frames
+from ..analysis.missing import MissingnessProfile
+from ..analysis.rollup import QuantSummary, tree_reduce
+from ..analysis.sketch import QualSketch
 from ..analysis.univariate import DescribeQual, DescribeQuant
+from ..analysis.univariate import QualAccumulator, QuantAccumulator
 from ..utils.print import Printer
 from ..utils.format import proper
+from ..utils.fingerprint import file_fingerprint, fingerprint, spec_key
+from ..utils.memo import MEMO
+from ..utils.parallel import run
+
+DEFAULT_CHUNKSIZE = 100000
 # --------------------------------------------------------------------------- #
 #                             DataComponent                                   #
 # --------------------------------------------------------------------------- #
@@ -75,6 +98,19 @@ class DataSet(DataComponent):
         The relative path to the underlying data on disk.
     name : str
         A unique string which identifies the DataSet object.
+    cache : ColumnarCache, bool or None
+        The columnar cache used by the load method. If None, the default 
+        cache (see default_cache_dir) is used when pyarrow is available.
+        If False, every load parses the source file.
+    chunksize : int (Optional)
+        If provided, the DataSet operates in streaming mode. The summarize 
+        and describe methods read the source in chunks of this many rows 
+        when the data has not been loaded.
+    memo : Memo, bool or None
+        Stores the results of the summarize and describe methods by the 
+        fingerprint of the data. If None, the shared in-memory Memo is used.
+        A Memo with a directory persists results across sessions. If False, 
+        results are computed on every call.
 
     Attributes
     ----------
@@ -95,12 +131,47 @@ class DataSet(DataComponent):
     
     """
 
-    def __init__(self, path, name=None):        
+    def __init__(self, path, name=None, cache=None, chunksize=None, memo=None):
         self._name = name or path.split("_")[2:3][0] or os.path.basename(path)
         self._source = path
         self._target = path
         self._islocked = True
         self._dataframe = pd.DataFrame()
+        if cache is None and HAS_PYARROW:
+            cache = ColumnarCache()
+        self._cache = cache or None
+        self._chunksize = chunksize
+        self._memo = MEMO if memo is None else None if memo is False else memo
+        self._load_args = (None, None)
+        self._residency = None
+        self._fingerprint = None
+        self._detached = False
+        self._exposed = False
+
+    def __getstate__(self):
+        # The residency of a DataGroup is not shipped to worker processes.
+        state = self.__dict__.copy()
+        state['_residency'] = None
+        return state
+
+    @classmethod
+    def from_dataframe(cls, df, name, source=None, cache=None, memo=None):
+        """Creates a loaded DataSet from a DataFrame.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The data of the DataSet.
+        name : str
+            The name of the DataSet.
+        source : str (Optional)
+            The path from which the data originates. Defaults to the name.
+
+        """
+        dataset = cls(source or name, name=name, cache=cache, memo=memo)
+        dataset._dataframe = df
+        dataset._detached = True
+        return dataset
 
     @property
     def source(self):
@@ -109,11 +180,49 @@ class DataSet(DataComponent):
     @property
     def target(self):
         return self._target
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def chunksize(self):
+        return self._chunksize
+
+    @property
+    def isloaded(self):
+        return not self._dataframe.empty
+
+    @property
+    def load_args(self):
+        """The columns and schema of the most recent or designated load."""
+        return self._load_args
+
+    def memory_usage(self):
+        """Returns the memory used by the loaded data in bytes."""
+        return int(self._dataframe.memory_usage(index=True, deep=True).sum())
+
+    def unload(self):
+        """Releases the loaded data. The DataSet can be loaded again."""
+        self._dataframe = pd.DataFrame()
+        self._exposed = False
+
+    def _touch(self):
+        """Materializes the data of a DataSet in a lazy DataGroup."""
+        if self._residency is not None:
+            self._residency.touch(self)
       
 
     def get_data(self, columns=None, n=None, pct=None, sample=None, seed=None):
         """Returns the complete or a part of a dataframe.
 
+        If the DataSet has not been loaded, samples are read directly from
+        the source: 'head' stops reading after n rows, 'tail' retains the
+        last n rows in a ring buffer of chunks, and 'random' draws a
+        seeded reservoir sample in a single pass. The columnar copy is read
+        in place of the csv file when it is fresh. A random sample with a
+        given seed is identical whether or not the DataSet is loaded.
+
         Parameters
         ----------
         columns : None, array-like
@@ -127,14 +236,17 @@ class DataSet(DataComponent):
             this returns the first five rows
             'tail' returns the last n (or pct) rows. If n and pct are None, 
             this returns the last five rows
-            'random' returns random sampling of n (or pct) rows. If n and
-            pct are None, this returns a random sampling of 5% of 
-            the rows in the dataframe.
+            'random' returns random sampling of n (or pct) rows, in the 
+            order of the data. If n and pct are None, this returns a random 
+            sampling of 5% of the rows in the dataframe.
         seed : None or integer
             Sets seed for pseudorandom sampling repeatability
             
         """
+        self._touch()
         if self._dataframe.empty:
+            if sample in ('head', 'tail', 'random'):
+                return self._sample_source(columns, n, pct, sample, seed)
             raise Exception("DataSet is empty. Run load method on DataSet object.")
 
         df = self._dataframe
@@ -153,32 +265,319 @@ class DataSet(DataComponent):
             else:
                 df = df.tail(5)                
         elif sample == 'random':
-            if n:
-                df = df.sample(n, random_state=seed)
-            else:
-                df = df.sample(frac=.05, random_state=seed)
+            if not n:
+                n = int(round(.05 * df.shape[0]))
+            df = df.iloc[sample_positions(df.shape[0], n, seed)]
+        if df is self._dataframe:
+            # The caller may now modify the data in place.
+            self._exposed = True
+            self._fingerprint = None
         return df
 
-    def load(self):
+    def _count_rows(self):
+        """Counts the rows of the source, from cache manifests when fresh."""
+        schema = self._load_args[1]
+        count = 0
+        for path in self._files():
+            resolved = self._resolve_schema(path, schema)
+            variant = resolved.key if resolved else None
+            manifest = self._cache.manifest(path, variant) if self._cache else None
+            if manifest is not None:
+                count += manifest['rows']
+                continue
+            column = [read_header(path)[0]]
+            for df in self._iter_file(path, DEFAULT_CHUNKSIZE, column, schema):
+                count += df.shape[0]
+        return count
+
+    def _sample_source(self, columns=None, n=None, pct=None, sample='head',
+                       seed=None):
+        """Samples the source without loading it. See get_data."""
+        if pct and not n:
+            n = math.floor(pct/100 * self._count_rows())
+        elif not n:
+            n = 5 if sample != 'random' else \
+                int(round(.05 * self._count_rows()))
+        chunksize = self._chunksize or DEFAULT_CHUNKSIZE
+        schema = self._load_args[1]
+        read = [c for c in columns if c != 'snapshot'] if columns else None
+        if sample == 'head':
+            chunks = self.iter_chunks(min(chunksize, max(n, 1)), read, schema)
+            df = head(chunks, n)
+        else:
+            sampler = TailBuffer(n) if sample == 'tail' else Reservoir(n, seed)
+            for chunk in self.iter_chunks(chunksize, read, schema):
+                sampler.update(chunk)
+            df = sampler.result()
+        return df[columns] if columns and not df.empty else df
+
+    def fingerprint(self):
+        """Returns a digest identifying the data of the DataSet.
+
+        Data loaded from the source is identified by the sizes and
+        modification times of the source files and the load arguments,
+        so no pass over the data is needed. Data supplied as a DataFrame,
+        or handed out whole by get_data, may be modified in place by the
+        caller, so it is identified by a hash of its current content,
+        computed on every call.
+
+        """
+        if self._detached or self._exposed:
+            self._touch()
+            return fingerprint(self._dataframe)
+        if self._fingerprint is None:
+            columns, schema = self._load_args
+            if isinstance(schema, Schema):
+                schema = schema.key
+            self._fingerprint = spec_key(file_fingerprint(self._files()),
+                                         columns, schema)
+        return self._fingerprint
+
+    def sample(self, n=None, frac=None, strata=None, groups=None,
+               allocation='proportional', columns=None, seed=None, cache=None):
+        """Returns a stratified or group-consistent random sample.
+
+        Parameters
+        ----------
+        n : int (Optional)
+            The size of the sample. With fixed allocation, the number of
+            rows per stratum. With groups, the number of groups.
+        frac : float (Optional)
+            The fraction of rows, or of groups, to sample.
+        strata : str or list (Optional)
+            The column or columns defining strata, e.g. 'room_type',
+            'neighbourhood_cleansed' or 'snapshot'.
+        groups : str (Optional)
+            A column, such as 'id', whose values are sampled as a whole. A
+            group is sampled in every snapshot, and in every DataSet, in
+            which it appears.
+        allocation : str
+            'proportional' or 'fixed'. See stratified_positions.
+        columns : array-like (Optional)
+            The columns to return.
+        seed : int (Optional)
+            The seed of the sample.
+        cache : SampleIndexCache (Optional)
+            The cache of sample positions. Positions of seeded samples are
+            cached by the fingerprint of the data, the specification and
+            the seed, so repeated samples are not recomputed.
+
+        """
+        self._touch()
+        if self._dataframe.empty:
+            raise Exception("DataSet is empty. Run load method on DataSet object.")
+        df = self._dataframe
+        spec = {'n': n, 'frac': frac, 'strata': strata, 'groups': groups,
+                'allocation': allocation}
+        key = None
+        if cache is not None and seed is not None:
+            key = cache.key(self.fingerprint(), spec, seed)
+            positions = cache.get(key)
+            if positions is not None:
+                return df.iloc[positions][columns] if columns else df.iloc[positions]
+        if groups is not None:
+            positions = group_positions(df[groups], n, frac, seed)
+        elif strata is not None:
+            strata = [strata] if isinstance(strata, str) else list(strata)
+            positions = stratified_positions(df[strata], n, frac, allocation, seed)
+        else:
+            n = n if n is not None else int(round((frac or .05) * df.shape[0]))
+            positions = sample_positions(df.shape[0], n, seed)
+        if key is not None:
+            cache.put(key, positions)
+        df = df.iloc[positions]
+        return df[columns] if columns else df
+
+    def _resolve_schema(self, path, schema):
+        """Returns the Schema designated by a Schema, version or 'infer'."""
+        if schema is None or isinstance(schema, Schema):
+            return schema
+        if schema == 'infer':
+            return infer_schema(read_header(path))
+        return get_schema('listings', schema)
+
+    def _read(self, path, columns=None, schema=None):
+        """Reads a single csv file, using the columnar cache when fresh."""
+        schema = self._resolve_schema(path, schema)
+        variant = schema.key if schema else None
+        if self._cache:
+            manifest = self._cache.manifest(path, variant)
+            if manifest is not None:
+                if not columns:
+                    return self._cache.read(path, variant=variant)
+                present = [c for c in columns if c in manifest['columns']]
+                df = self._cache.read(path, present, variant)
+                return conform(df, columns, schema)
+        if schema:
+            df = schema.read_csv(path, columns)
+        elif columns:
+            df = pd.read_csv(path, usecols=lambda c: c in columns, low_memory=False)
+            df = conform(df, columns)
+        else:
+            df = pd.read_csv(path, low_memory=False)
+        if self._cache and not columns:
+            self._cache.write(path, df, variant)
+        return df
+
+    def load(self, columns=None, schema=None, n_jobs=None):
         """Loads data from the source path.
         
         This method can load data from one or multiple csv files into a single
-        DataFrame object. If the source parameter is a directory, all data from the 
-        underlying files will be loaded into a single DataFrame. Otherwise, the
-        DataFrame will contain the data from a single csv file.  
+        DataFrame object. If the source parameter is a directory, the rows of
+        all csv files in the directory tree are stacked into a single 
+        DataFrame, with a 'snapshot' column identifying the file of each row.
+        Files with differing column sets are aligned on the union of their 
+        columns. Otherwise, the DataFrame will contain the data from a single 
+        csv file.  
+
+        Each file is parsed once and stored in the columnar cache. Subsequent
+        loads read the columnar copy for as long as the source is unchanged.
+
+        Parameters
+        ----------
+        columns : array-like (Optional)
+            The columns to load. Only these columns are parsed. Requested
+            columns absent from a file are returned as missing values.
+        schema : Schema, int or str (Optional)
+            The Schema, or the version of the registered listings schema,
+            used to parse the columns into their target types. If 'infer', 
+            the version is inferred from the header of each file. If None, 
+            types are inferred by the csv parser.
+        n_jobs : int (Optional)
+            If the source is a directory, the number of worker processes 
+            parsing files concurrently. If -1, all cpus are used.
         
         """        
+        self._load_args = (columns, schema)
+        self._fingerprint = None
+        self._exposed = False
         if os.path.isdir(self._source):
-            for directory, _, filenames in os.walk(self._source):
-                for filename in filenames:             
-                    df = pd.read_csv(os.path.join(directory, filename), \
-                        low_memory=False)
-                    self._dataframe = pd.concat([self._dataframe, df], axis=1, sort=False)
+            paths = list_files(self._source)
+            keys = [snapshot_of(path) for path in paths]
+            if n_jobs and n_jobs != 1:
+                datasets = [DataSet(path, name=key, cache=self._cache) 
+                            for path, key in zip(paths, keys)]
+                tasks = [(ds, columns, schema) for ds in datasets]
+                frames = []
+                for ds, (handle, error) in zip(datasets, run(_load_task, tasks, n_jobs)):
+                    if error is not None:
+                        raise error
+                    ds._load_handle(handle)
+                    frames.append(ds._dataframe)
+            else:
+                frames = [self._read(path, columns, schema) for path in paths]
+            # Every file is typed by its own layout, and the columns absent
+            # from older layouts by the union of the layouts of all files.
+            schema = union_schema(self._resolve_schema(path, schema)
+                                  for path in paths)
+            self._dataframe = union_frames(frames, keys=keys, schema=schema)
         else:        
-            self._dataframe = pd.read_csv(self._source, low_memory=False)
+            self._dataframe = self._read(self._source, columns, schema)
 
-    def save(self, path=None, **kwargs):
-        """Saves the dataframe to the a csv file.        
+    def _load_handle(self, handle):
+        """Adopts the result of a load task run in a worker process."""
+        kind, content, columns = handle
+        if kind == 'frame':
+            self._dataframe = content
+        else:
+            self._dataframe = pd.read_parquet(content, columns=columns)
+            if kind == 'temp':
+                os.remove(content)
+
+    def _files(self):
+        """Returns the paths of the files underlying the source."""
+        if os.path.isdir(self._source):
+            return list_files(self._source)
+        return [self._source]
+
+    def _iter_file(self, path, chunksize, columns=None, schema=None):
+        """Reads a single file in chunks, from the columnar cache if fresh."""
+        schema = self._resolve_schema(path, schema)
+        variant = schema.key if schema else None
+        if self._cache and self._cache.fmt == 'parquet':
+            manifest = self._cache.manifest(path, variant)
+            if manifest is not None:
+                import pyarrow.parquet as pq
+                present = [c for c in columns if c in manifest['columns']] \
+                    if columns else None
+                parquet_file = pq.ParquetFile(self._cache.path(path, variant))
+                for batch in parquet_file.iter_batches(batch_size=chunksize, 
+                                                       columns=present):
+                    df = batch.to_pandas()
+                    yield conform(df, columns, schema) if columns else df
+                return
+        if schema:
+            chunks = schema.read_csv(path, columns, chunksize=chunksize)
+        else:
+            usecols = (lambda c: c in columns) if columns else None
+            chunks = pd.read_csv(path, usecols=usecols, chunksize=chunksize)
+        for df in chunks:
+            yield conform(df, columns, schema) if columns else df
+
+    def iter_chunks(self, chunksize=None, columns=None, schema=None):
+        """Iterates over the data in DataFrame chunks of bounded size.
+
+        If the data has been loaded, the chunks are slices of the loaded
+        DataFrame. Otherwise the source is read one chunk at a time, so that
+        files larger than memory can be processed. Chunks read from a 
+        directory have a 'snapshot' column identifying their file.
+
+        Parameters
+        ----------
+        chunksize : int (Optional)
+            The number of rows per chunk. Defaults to the chunksize of the
+            DataSet, or 100,000 rows.
+        columns : array-like (Optional)
+            The columns to read.
+        schema : Schema, int or str (Optional)
+            The schema used to parse the source. See the load method.
+
+        """
+        chunksize = chunksize or self._chunksize or DEFAULT_CHUNKSIZE
+        if not self._dataframe.empty:
+            df = self._dataframe[columns] if columns else self._dataframe
+            for start in range(0, df.shape[0], chunksize):
+                yield df.iloc[start:start + chunksize]
+            return
+        isdir = os.path.isdir(self._source)
+        for path in self._files():
+            for df in self._iter_file(path, chunksize, columns, schema):
+                if isdir:
+                    df.insert(0, 'snapshot', snapshot_of(path))
+                yield df
+
+    def history(self, key='id', columns=None, schema=None):
+        """Returns the snapshots of a directory source as a delta History.
+
+        The first snapshot is held in full, and each later snapshot as the
+        listings added, removed and changed since its predecessor. If the
+        data has not been loaded, the files are read one at a time, so
+        that no more than two snapshots are held in memory.
+
+        Parameters
+        ----------
+        key : str
+            The column identifying a listing.
+        columns : array-like (Optional)
+            The columns to read. The key column is always read.
+        schema : Schema, int or str (Optional)
+            The schema used to parse the source. See the load method.
+
+        """
+        if not self._dataframe.empty:
+            df = self._dataframe
+            if columns:
+                df = df[['snapshot', key] + [c for c in columns if c != key]]
+            return History.from_union(df, key)
+        if columns:
+            columns = [key] + [c for c in columns if c != key]
+        paths = self._files()
+        frames = (self._read(path, columns, schema) for path in paths)
+        return History.from_snapshots(frames, [snapshot_of(p) for p in paths], key)
+
+    def save(self, path=None, format=None, compression=None, level=None, 
+             **kwargs):
+        """Saves the dataframe to a csv, compressed csv, Parquet or Feather file.        
 
         This method accepts a path parameter which may be a directory or a
         relative path including a filename. The DataSet object will also have a 
@@ -193,11 +592,23 @@ class DataSet(DataComponent):
 
         If there is no path parameter, the data is saved to the current
         target location.
+
+        Files are written to a temporary file which is renamed to the 
+        target, so that readers never see a partially written file.
                 
         Parameters
         ----------
         path : str (Optional)
             A directory or filename to which the data is to be saved.
+        format : str (Optional)
+            'csv', 'csv.gz', 'parquet' or 'feather'. The extension of the
+            filename is replaced by that of the format. Defaults to the
+            format of the filename, or csv.
+        compression : str (Optional)
+            The compression codec. Defaults to zstd for Parquet and Feather
+            and gzip for csv.gz.
+        level : int (Optional)
+            The compression level.
 
         Raises
         ------
@@ -208,6 +619,7 @@ class DataSet(DataComponent):
         Once the file is saved, the target location is updated to reflect the 
         new location.
         """
+        self._touch()
 
         source_dir = os.path.dirname(self._source)
         source_filename = os.path.basename(self._source)
@@ -216,17 +628,19 @@ class DataSet(DataComponent):
             if self._islocked and (self._source == path or source_dir == path):
                raise Exception("'{path}' is locked.".format(path=path))    
             elif os.path.isdir(path):
-                self._dataframe.to_csv(os.path.join(path, source_filename))
-                self._target = os.path.join(path, source_filename)
+                target = os.path.join(path, source_filename)
             else:
-                self._dataframe.to_csv(path)
-                self._target = path
+                target = path
         else:
             if self._islocked and (self._target == self._source):
                 raise Exception("The source file path is locked. Designate an\
                     alternative location or unlock the source file.")    
-            else:
-                self._dataframe.to_csv(self._target)                
+            target = self._target
+        if format:
+            target = with_format(target, format)
+            if self._islocked and target == self._source:
+                raise Exception("'{path}' is locked.".format(path=target))
+        self._target = write(self._dataframe, target, format, compression, level)
 
     def summarize(self, verbose=False):
         """Produces a summary of a dataframe.
@@ -235,9 +649,30 @@ class DataSet(DataComponent):
         ----------
         verbose : bool
             If True, the summary is printed to sys.out.
+
+        Note
+        ----
+        If the DataSet was created with a chunksize and has not been loaded,
+        the summary is computed in one pass over chunks of the source.
+        Summaries are memoized by the fingerprint of the data, so that
+        summarizing unchanged data again returns the stored summary.
         """
-        if self._dataframe.empty:
+        self._touch()
+        if self._dataframe.empty and not self._chunksize:
             raise Exception("DataSet is empty. Run load method on DataSet object.")
+        summary = self._memoized('summarize', self._summarize)
+
+        if verbose:
+            p = Printer()
+            p.print_dictionary(content=summary, title="Listings Summary")        
+
+        return summary
+
+    def _summarize(self):
+        """Computes the summary of the loaded data or, in streaming mode,
+        of chunks of the source."""
+        if self._dataframe.empty:
+            return self._summarize_chunks()
 
         summary = OrderedDict()
         # Extract market and date information.
@@ -274,61 +709,214 @@ class DataSet(DataComponent):
             summary['Datetime Variables'] = 0                                
 
 
-        # Count missing values column-wise
-        counts = []
-        min_ranges = [0.000, 0.0001, 0.251, 0.501]
-        max_ranges = [0.000, 0.250, 0.500, 1.000]
-
-        missing = self._dataframe.isna().sum() / self._dataframe.shape[0]
-        def count_values_in_range(series, min_range, max_range):
-            return series.between(left=min_range, right=max_range).sum()
+        # Count missing values column-wise and case-wise in one pass over
+        # the missing value bitmap.
+        profile = MissingnessProfile(patterns=False, comissing=False)
+        summary.update(profile.update(self._dataframe).summary())
 
-        for min_range, max_range in zip(min_ranges, max_ranges):
-            counts.append(count_values_in_range(missing, min_range, max_range))
-        
-        summary["% Columns with no Missing Values"] = \
-            counts[0] / self._dataframe.shape[1] * 100
-        summary["% Columns with up to 25% Missing Values"] = \
-            counts[1] / self._dataframe.shape[1] * 100
-        summary["% Columns with 25% to 50% Missing Values"] = \
-            counts[2] / self._dataframe.shape[1] * 100
-        summary["% Columns with more than 50% Missing Values"] = \
-            counts[3] / self._dataframe.shape[1] * 100
-
-        # Count missing values case-wise
-        counts = []
-        min_ranges = [0.000, 0.0001, 0.101, 0.251]
-        max_ranges = [0.000, 0.100, 0.250, 1]        
-        missing = pd.Series()
-        
-        for i in range(len(self._dataframe.index)):
-            missing_by_row = pd.Series(self._dataframe.iloc[i].isnull().sum())                
-            missing = pd.concat([missing, missing_by_row])
+        summary['Size (MB)'] = sum(self._dataframe.memory_usage(index=True))/1000000
+        return summary
 
-        missing = missing / self._dataframe.shape[1]        
-        for min_range, max_range in zip(min_ranges, max_ranges):
-            counts.append(count_values_in_range(missing, min_range, max_range))
-        
-        summary["% Complete cases"] = \
-            counts[0] / self._dataframe.shape[0] * 100
-        summary["% Cases with up to 10% Missing Values"] = \
-            counts[1] / self._dataframe.shape[0] * 100
-        summary["% Cases with 10% to 25% Missing Values"] = \
-            counts[2] / self._dataframe.shape[0] * 100
-        summary["% Cases with more than 25% Missing Values"] = \
-            counts[3] / self._dataframe.shape[0] * 100
+    def _summarize_chunks(self):
+        """Produces the summary in one pass over chunks of the source."""
+        rows = 0
+        size = 0
+        kinds = OrderedDict()
+        profile = MissingnessProfile(patterns=False, comissing=False)
 
-        summary['Size (MB)'] = sum(self._dataframe.memory_usage(index=True))/1000000
+        for chunk in self.iter_chunks():
+            rows += chunk.shape[0]
+            size += sum(chunk.memory_usage(index=True))
+            for column, dtype in chunk.dtypes.items():
+                kinds.setdefault(column, set()).add(self._dtype_kind(dtype))
+            profile.update(chunk)
 
-        if verbose:
-            p = Printer()
-            p.print_dictionary(content=summary, title="Listings Summary")        
+        if rows == 0:
+            raise Exception("DataSet is empty. The source contains no rows.")
 
+        summary = OrderedDict()
+        summary['Date'] = self._source.split("_")[2:3][0]
+        summary['Observations'] = rows
+        summary['Variables'] = len(kinds)
+        resolved = [k.pop() if len(k) == 1 else 'object' for k in kinds.values()]
+        summary['Numeric Variables'] = resolved.count('numeric')
+        summary['Object Variables'] = resolved.count('object')
+        summary['Categorical Variables'] = resolved.count('category')
+        summary['Boolean Variables'] = resolved.count('bool')
+        summary['Datetime Variables'] = resolved.count('datetime')
+
+        summary.update(profile.summary())
+        summary['Size (MB)'] = size / 1000000
         return summary
 
+    def missingness(self, patterns=True, comissing=True):
+        """Returns the MissingnessProfile of the DataSet.
+
+        Parameters
+        ----------
+        patterns : bool
+            If True, the frequencies of missing-value patterns are counted.
+        comissing : bool
+            If True, the co-missingness matrix of column pairs is computed.
+
+        Note
+        ----
+        If the DataSet was created with a chunksize and has not been loaded,
+        the profile is computed in one pass over chunks of the source.
+        """
+        self._touch()
+        profile = MissingnessProfile(patterns=patterns, comissing=comissing)
+        if self._dataframe.empty:
+            if self._chunksize:
+                for chunk in self.iter_chunks():
+                    profile.update(chunk)
+                return profile
+            raise Exception("DataSet is empty. Run load method on DataSet object.")
+        return profile.update(self._dataframe)
+
+    def sketch(self, columns=None, distinct_error=0.01, top_error=0.001):
+        """Returns the QualSketch of the non-numeric columns of the DataSet.
+
+        Sketches of DataSets merge into the sketch of their union. See
+        DataGroup.sketch.
+
+        Parameters
+        ----------
+        columns : list (Optional)
+            The columns to sketch. Defaults to all non-numeric columns.
+        distinct_error : float
+            The relative standard error of the distinct counts.
+        top_error : float
+            The maximum error of the frequency of top values, as a fraction
+            of the count.
+
+        Note
+        ----
+        If the DataSet was created with a chunksize and has not been loaded,
+        the sketch is computed in one pass over chunks of the source.
+        """
+        self._touch()
+        sketch = QualSketch(distinct_error, top_error)
+        if self._dataframe.empty:
+            if self._chunksize:
+                for chunk in self.iter_chunks(columns=columns):
+                    sketch.update(chunk)
+                return sketch
+            raise Exception("DataSet is empty. Run load method on DataSet object.")
+        df = self._dataframe[columns] if columns else self._dataframe
+        return sketch.update(df)
+
+    def statistics(self, columns=None, compression=200):
+        """Returns the QuantSummary of the numeric columns of the DataSet.
+
+        Summaries of DataSets merge into the summary of their union, so
+        statistics of markets and of all markets are rolled up from those
+        of snapshots without concatenating their data. See
+        DataGroup.statistics.
+
+        Parameters
+        ----------
+        columns : list (Optional)
+            The columns to summarize. Defaults to all numeric columns.
+        compression : int
+            The compression of the quantile sketch of each column.
+
+        Note
+        ----
+        If the DataSet was created with a chunksize and has not been loaded,
+        the summary is computed in one pass over chunks of the source. The
+        summary is memoized by the fingerprint of the data.
+        """
+        self._touch()
+        if self._dataframe.empty and not self._chunksize:
+            raise Exception("DataSet is empty. Run load method on DataSet object.")
+        return self._memoized('statistics', 
+            lambda: self._statistics(columns, compression), columns, compression)
+
+    def _statistics(self, columns, compression):
+        summary = QuantSummary(compression)
+        if self._dataframe.empty:
+            for chunk in self.iter_chunks(columns=columns):
+                summary.update(chunk)
+            return summary
+        df = self._dataframe[columns] if columns else self._dataframe
+        return summary.update(df)
+
+    def _memo_parts(self, method, *args):
+        """Returns the parts of the memo key of a method and its arguments."""
+        streaming = not self.isloaded and self._residency is None \
+            and bool(self._chunksize)
+        return (self.fingerprint(), self._source, streaming, method) + args
+
+    def _memoized(self, method, func, *args):
+        """Returns the result of func, memoized by the fingerprint of the
+        data, the method and its arguments."""
+        if self._memo is None:
+            return func()
+        return self._memo(func, *self._memo_parts(method, *args))
+
+    def _shippable(self):
+        """Returns a copy of the DataSet to send to a worker process, and
+        whether the worker reloads its data.
+
+        Data loaded from a source is reloaded by the worker from the 
+        columnar cache rather than pickled to it, unless it has been handed
+        out by get_data and so may have been modified.
+
+        """
+        reload = not self._detached and not self._exposed and \
+            self._cache is not None and \
+            (self.isloaded or self._residency is not None)
+        if not reload:
+            self._touch()
+            return self, False
+        dataset = copy.copy(self)
+        dataset._dataframe = pd.DataFrame()
+        return dataset, True
+
+    @staticmethod
+    def _dtype_kind(dtype):
+        """Classifies a dtype as counted by the summarize method."""
+        if pd.api.types.is_bool_dtype(dtype):
+            return 'bool'
+        if isinstance(dtype, pd.CategoricalDtype):
+            return 'category'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'datetime'
+        if pd.api.types.is_numeric_dtype(dtype):
+            return 'numeric'
+        if pd.api.types.is_object_dtype(dtype) or \
+            pd.api.types.is_string_dtype(dtype):
+            return 'object'
+        return 'other'
+
     def describe(self, columns=None):
-        """Descriptive statistics for quantitative and qualitative variables.""" 
+        """Descriptive statistics for quantitative and qualitative variables.
+
+        If the DataSet was created with a chunksize and has not been loaded,
+        the statistics are computed in one pass over chunks of the source.
+        See DescribeQuant.describe_chunks for the statistics available in
+        streaming mode.
+
+        Descriptions are memoized by the fingerprint of the data and the
+        columns described.
+
+        """ 
+        self._touch()
+        if self._dataframe.empty and not self._chunksize:
+            raise Exception("DataSet is empty. Run load method on DataSet object.")
+        return self._memoized('describe', lambda: self._describe(columns), 
+                              columns)
+
+    def _describe(self, columns=None):
         if self._dataframe.empty:
+            if self._chunksize:
+                quant = QuantAccumulator()
+                qual = QualAccumulator()
+                for chunk in self.iter_chunks(columns=columns):
+                    quant.update(chunk)
+                    qual.update(chunk)
+                return {'quant': quant.describe(), 'qual': qual.describe()}
             raise Exception("DataSet is empty. Run load method on DataSet object.")
 
         description = {}
@@ -346,15 +934,329 @@ class DataSet(DataComponent):
         
         return description
 
+# --------------------------------------------------------------------------- #
+#                                Residency                                    #
+# --------------------------------------------------------------------------- #
+class Residency:
+    """Keeps the loaded DataSets of a lazy DataGroup within a memory budget.
+
+    DataSets are materialized when first used. When the memory used by the
+    loaded DataSets exceeds the budget, the least recently used DataSets
+    are unloaded. An unloaded DataSet reloads from the columnar cache or,
+    if the cache does not hold its data, from a Parquet copy spilled to a
+    temporary directory on eviction.
+
+    The bookkeeping is guarded by a lock, so DataSets may be used from
+    several threads. A DataSet pinned with the pin method is not evicted
+    until it is released, even if the budget is exceeded meanwhile.
+
+    Parameters
+    ----------
+    budget : int (Optional)
+        The memory budget in bytes. If None, DataSets are never evicted.
+
+    """
+
+    def __init__(self, budget=None):
+        self._budget = budget
+        self._resident = OrderedDict()
+        self._spill_dir = None
+        self._spills = {}
+        self._pinned = Counter()
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def budget(self):
+        return self._budget
+
+    @property
+    def nbytes(self):
+        """The memory used by the resident DataSets in bytes."""
+        with self._lock:
+            return sum(nbytes for _, nbytes in self._resident.values())
+
+    @property
+    def resident(self):
+        """The names of the resident DataSets, least recently used first."""
+        with self._lock:
+            return [dataset.name for dataset, _ in self._resident.values()]
+
+    def attach(self, dataset):
+        with self._lock:
+            dataset._residency = self
+            if dataset.isloaded:
+                self.touch(dataset)
+
+    def detach(self, dataset):
+        with self._lock:
+            dataset._residency = None
+            self._resident.pop(id(dataset), None)
+            self._pinned.pop(id(dataset), None)
+            spill = self._spills.pop(id(dataset), None)
+            if spill and os.path.exists(spill):
+                os.remove(spill)
+
+    def touch(self, dataset):
+        """Marks a DataSet as most recently used, materializing it if needed."""
+        with self._lock:
+            key = id(dataset)
+            entry = self._resident.pop(key, None)
+            if entry is None or not dataset.isloaded:
+                self._materialize(dataset)
+                entry = (dataset, dataset.memory_usage())
+            self._resident[key] = entry
+            self._evict()
+
+    @contextmanager
+    def pin(self, dataset):
+        """Materializes a DataSet and keeps it resident within the block."""
+        with self._lock:
+            self._pinned[id(dataset)] += 1
+            try:
+                self.touch(dataset)
+            except Exception:
+                self._unpin(dataset)
+                raise
+        try:
+            yield dataset
+        finally:
+            with self._lock:
+                self._unpin(dataset)
+                self._evict()
+
+    def _unpin(self, dataset):
+        self._pinned[id(dataset)] -= 1
+        if self._pinned[id(dataset)] <= 0:
+            del self._pinned[id(dataset)]
+
+    def _materialize(self, dataset):
+        if dataset.isloaded:
+            return
+        spill = self._spills.get(id(dataset))
+        if spill and os.path.exists(spill):
+            dataset._dataframe = pd.read_parquet(spill)
+        else:
+            dataset.load(*dataset.load_args)
+
+    def _evict(self):
+        """Unloads least recently used DataSets until within the budget."""
+        if self._budget is None:
+            return
+        while len(self._resident) > 1 and self.nbytes > self._budget:
+            # The most recently used DataSet and pinned DataSets are kept.
+            keys = [key for key in list(self._resident.keys())[:-1]
+                    if key not in self._pinned]
+            if not keys:
+                return
+            dataset, _ = self._resident.pop(keys[0])
+            if not self._iscached(dataset):
+                self._spill(dataset)
+            dataset.unload()
+
+    def _iscached(self, dataset):
+        """True if the load of the DataSet can be served by its cache."""
+        columns, schema = dataset.load_args
+        if dataset.cache is None or not os.path.isfile(dataset.source):
+            return False
+        schema = dataset._resolve_schema(dataset.source, schema)
+        return dataset.cache.isfresh(dataset.source, schema.key if schema else None)
+
+    def _spill(self, dataset):
+        if not HAS_PYARROW or id(dataset) in self._spills:
+            return
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="datagroup_")
+        path = os.path.join(self._spill_dir.name, str(id(dataset)) + ".parquet")
+        try:
+            dataset._dataframe.to_parquet(path, index=False)
+        except Exception:
+            return
+        self._spills[id(dataset)] = path
+
 # --------------------------------------------------------------------------- #
 #                                DataGroup                                    #
 # --------------------------------------------------------------------------- #
+def _load_task(dataset, columns=None, schema=None):
+    """Loads a DataSet in a worker process and returns a columnar handle.
+
+    Rather than pickling the DataFrame back to the parent process, the
+    parsed data is left in the columnar cache, or in a temporary Parquet
+    file when the cache does not hold the requested parse, and its path is
+    returned. The DataFrame is returned only when pyarrow is unavailable.
+
+    """
+    dataset.load(columns, schema)
+    df = dataset._dataframe
+    cache = dataset.cache
+    if not HAS_PYARROW or cache is None:
+        return ('frame', df, None)
+    if os.path.isfile(dataset.source):
+        resolved = dataset._resolve_schema(dataset.source, schema)
+        path = cache.path(dataset.source, resolved.key if resolved else None)
+        if path is not None and cache.fmt == 'parquet':
+            return ('cache', path, list(columns) if columns else None)
+    os.makedirs(cache.directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix='.parquet', dir=cache.directory)
+    os.close(fd)
+    try:
+        df.to_parquet(path, index=False)
+    except Exception:
+        os.remove(path)
+        return ('frame', df, None)
+    return ('temp', path, None)
+
+def _summarize_task(dataset, reload=False):
+    """Summarizes a DataSet, reloading its data first if designated, and
+    returns the summary and the seconds elapsed."""
+    start = time.perf_counter()
+    if reload:
+        dataset.load(*dataset.load_args)
+    summary = dataset.summarize()
+    return summary, time.perf_counter() - start
+
+
 class DataGroup(DataComponent):
+    """A named group of DataSet objects, such as the snapshots of a market.
 
-    def __init__(self, name):
+    Parameters
+    ----------
+    name : str
+        The name of the DataGroup.
+    cache : ColumnarCache, bool or None
+        The columnar cache of the DataSets created by add_dataset_from_path.
+        See DataSet.
+    lazy : bool
+        If True, add_dataset_from_path registers DataSets without loading
+        them. DataSets are loaded on first use by their get_data, summarize,
+        describe or save methods.
+    memory_budget : int (Optional)
+        In lazy mode, the memory in bytes that loaded DataSets may use. The
+        least recently used DataSets are unloaded when it is exceeded.
+
+    Attributes
+    ----------
+    errors : dict
+        The errors raised by the most recent load, keyed by DataSet name
+        or file path.
+
+    """
+
+    def __init__(self, name, cache=None, lazy=False, memory_budget=None):
         self._name = name
         self._islocked = False
         self._datagroup = {}
+        self._errors = {}
+        self._cache = cache
+        self._residency = Residency(memory_budget) if lazy else None
+
+    @property
+    def islazy(self):
+        return self._residency is not None
+
+    @property
+    def residency(self):
+        return self._residency
+
+    @classmethod
+    def from_store(cls, filters=None, columns=None, store=None, name='store',
+                   lazy=False, memory_budget=None):
+        """Creates a DataGroup from the partitioned store of processed data.
+
+        Only partitions and row groups which may match the filters are
+        read, and only the requested columns. Each market read becomes a
+        DataSet named after the market, with a 'snapshot' column.
+
+        Parameters
+        ----------
+        filters : list (Optional)
+            Predicates on any column, including market, year and snapshot,
+            e.g. [('market', '==', 'san-francisco'), ('year', '==', 2019),
+            ('price', '<', 150)]. See the store module.
+        columns : list (Optional)
+            The columns to read.
+        store : Store (Optional)
+            The store. Defaults to the store in 'data/processed/listings'.
+        name : str
+            The name of the DataGroup.
+
+        """
+        store = store or Store()
+        read = list(columns) if columns else None
+        if read is not None:
+            read = ['market', 'snapshot'] + [c for c in read
+                                             if c not in ('market', 'snapshot')]
+        df = store.read(filters, read)
+        group = cls(name, lazy=lazy, memory_budget=memory_budget)
+        for market, frame in df.groupby('market', observed=True, sort=True):
+            frame = frame.drop(columns='market').reset_index(drop=True)
+            group._register(DataSet.from_dataframe(
+                frame, str(market), source=os.path.join(store.directory,
+                                                        "market=" + str(market))))
+        return group
+
+    def to_store(self, store=None, names=None, sort_by=None):
+        """Writes the named (or all) loaded DataSets to the partitioned store.
+
+        Each DataSet is written as the market of its name. See
+        Store.write_dataset.
+
+        """
+        store = store or Store()
+        names = names or list(self._datagroup.keys())
+        paths = []
+        for name in names:
+            paths.extend(store.write_dataset(self._datagroup[name], sort_by=sort_by))
+        return paths
+
+    def _register(self, dataset):
+        """Stores a DataSet, placing it under residency in lazy mode."""
+        self._datagroup[dataset.name] = dataset
+        if self._residency is not None:
+            self._residency.attach(dataset)
+
+    @property
+    def errors(self):
+        return self._errors
+
+    def _load_datasets(self, datasets, columns=None, schema=None, n_jobs=None, 
+                       executor=None):
+        """Loads DataSets, in worker processes if n_jobs or executor is given.
+
+        Returns the DataSets which loaded successfully, in the order given.
+        Errors are reported and recorded by DataSet name.
+
+        """
+        tasks = [(dataset, columns, schema) for dataset in datasets]
+        if executor is None and (not n_jobs or n_jobs == 1):
+            results = run(lambda ds, c, s: ds.load(c, s), tasks)
+        else:
+            results = run(_load_task, tasks, n_jobs=n_jobs, executor=executor)
+        self._errors = {}
+        loaded = []
+        for dataset, (handle, error) in zip(datasets, results):
+            if error is None and handle is not None:
+                try:
+                    dataset._load_handle(handle)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                self._errors[dataset.name] = error
+                print("Failed to load '{source}': {error}".format(
+                    source=dataset.source, error=error))
+            else:
+                loaded.append(dataset)
+                if self._residency is not None:
+                    self._residency.touch(dataset)
+        return loaded
 
     def lock_datasets(self, names=None):
         """Locks the enclosed (or named) DataSet objects.
@@ -427,37 +1329,149 @@ class DataGroup(DataComponent):
             d = self._datagroup
         return d
 
-    def load(self, names=None):
+    def sample(self, names=None, **kwargs):
+        """Samples the named (or all) DataSet objects.
+
+        Returns a dictionary of samples keyed by DataSet name. Keyword
+        arguments are those of DataSet.sample. Group samples, such as by
+        'id', select the same groups in every DataSet.
+
+        """
+        if len(self._datagroup) == 0:
+            raise Exception("DataSet is empty.")
+        if isinstance(names, str):
+            names = [names]
+        names = names or list(self._datagroup.keys())
+        return {name: self._datagroup[name].sample(**kwargs) for name in names}
+
+    def missingness(self, names=None, patterns=True, comissing=True):
+        """Returns the MissingnessProfile of the named (or all) DataSet
+        objects, merged as if their data were stacked.
+
+        Keyword arguments are those of DataSet.missingness.
+
+        """
+        if len(self._datagroup) == 0:
+            raise Exception("DataSet is empty.")
+        if isinstance(names, str):
+            names = [names]
+        names = names or list(self._datagroup.keys())
+        profile = MissingnessProfile(patterns=patterns, comissing=comissing)
+        for name in names:
+            profile = profile.merge(self._datagroup[name].missingness(
+                patterns=patterns, comissing=comissing))
+        return profile
+
+    def sketch(self, names=None, **kwargs):
+        """Returns the QualSketch of the named (or all) DataSet objects,
+        merged as if their data were stacked.
+
+        Keyword arguments are those of DataSet.sketch. Each DataSet is 
+        sketched in turn, so memory is fixed per column whatever the number
+        of DataSets or distinct values.
+
+        """
+        if len(self._datagroup) == 0:
+            raise Exception("DataSet is empty.")
+        if isinstance(names, str):
+            names = [names]
+        names = names or list(self._datagroup.keys())
+        sketch = None
+        for name in names:
+            member = self._datagroup[name].sketch(**kwargs)
+            sketch = member if sketch is None else sketch.merge(member)
+        return sketch
+
+    def statistics(self, names=None, **kwargs):
+        """Returns the QuantSummary of the named (or all) DataSet objects,
+        rolled up by tree reduction as if their data were stacked.
+
+        Keyword arguments are those of DataSet.statistics. Only the 
+        summaries of the DataSets are held, never their combined data.
+
+        """
+        if len(self._datagroup) == 0:
+            raise Exception("DataSet is empty.")
+        if isinstance(names, str):
+            names = [names]
+        names = names or list(self._datagroup.keys())
+        return tree_reduce(self._datagroup[name].statistics(**kwargs) 
+                           for name in names)
+
+    def load(self, names=None, columns=None, schema=None, n_jobs=None, 
+             executor=None):
         """Loads the named (or all) contained DataSet objects.
 
         Parameters
         ----------
         names : str or list-like
             The name or names of the underlying DataSet objects to load.
+        columns : array-like (Optional)
+            The columns to load. See DataSet.load.
+        schema : Schema, int or str (Optional)
+            The schema used to parse the files. See DataSet.load.
+        n_jobs : int (Optional)
+            The number of worker processes parsing files concurrently. If 
+            -1, all cpus are used. By default, files are parsed serially.
+        executor : concurrent.futures.Executor (Optional)
+            An executor to which the loading tasks are submitted.
 
         Raises
         ------
         Exception if the DataGroup object is empty.
 
+        Note
+        ----
+        A file which fails to load does not stop the others from loading.
+        Failures are printed and available from the errors attribute.
+
         """        
         if len(self._datagroup) == 0:
             raise Exception("DataSet is empty. Run load method on DataSet object.")
 
-        for name, dataset in self._datagroup.items():
-            self._datagroup[name] = dataset.load()
-
-    def save(self, path=None, names=None):
+        if isinstance(names, str):
+            names = [names]
+        datasets = [self._datagroup[name] for name in names] if names \
+            else list(self._datagroup.values())
+        self._load_datasets(datasets, columns, schema, n_jobs, executor)
+
+    def _save_member(self, dataset, *args):
+        """Saves a DataSet, pinned in memory while it is written if lazy."""
+        if self._residency is None:
+            return dataset.save(*args)
+        with self._residency.pin(dataset):
+            return dataset.save(*args)
+
+    def save(self, path=None, names=None, format=None, compression=None,
+             level=None, n_jobs=None):
         """Saves enclosed or named DataSet objects.
         
         If the path parameter is provided, it must be a directory. In such case,
         each enclosed DataSet object or objects specified by the names
         parameter, will be saved in the new directory specified by the path 
-        parameter in csv format. The filename will remain the same as 
-        the current target filename.  
+        parameter. The filename will remain the same as the current target 
+        filename, with the extension of the format if one is designated.
         
         If the path parameter is not provided the data in the enclosed or named
-        DataSet objects will be saved at their current target locations in
-        csv format.
+        DataSet objects will be saved at their current target locations.
+
+        Parameters
+        ----------
+        path : str (Optional)
+            The directory in which the DataSets are saved.
+        names : list-like (Optional)
+            The names of the DataSets to save.
+        format, compression, level : str, str, int (Optional)
+            See DataSet.save.
+        n_jobs : int (Optional)
+            The number of DataSets written concurrently. Compression and 
+            columnar encoding release the GIL, so writes run in threads.
+
+        Raises
+        ------
+        The first error raised by a DataSet which fails to save, once the
+        others have been saved. Failures are printed and available from the
+        errors attribute.
 
         """
         if path:
@@ -465,13 +1479,24 @@ class DataGroup(DataComponent):
                 raise ValueError("The path parameter must be a directory, not a filename.")   
             if not os.path.exists(path):
                 os.mkdir(path)
-            for dataset in self._datagroup.values():
-                filename = os.path.basename(dataset.target)
-                dataset.save(os.path.join(path, filename))            
-        else:
-            for dataset in self._datagroup.values():
-                dataset.save()            
-
+        if isinstance(names, str):
+            names = [names]
+        datasets = [self._datagroup[name] for name in names] if names \
+            else list(self._datagroup.values())
+        tasks = []
+        for dataset in datasets:
+            target = os.path.join(path, os.path.basename(dataset.target)) \
+                if path else None
+            tasks.append((dataset, target, format, compression, level))
+        results = run(self._save_member, tasks, n_jobs=n_jobs, threads=True)
+        self._errors = {}
+        for dataset, (_, error) in zip(datasets, results):
+            if error is not None:
+                self._errors[dataset.name] = error
+                print("Failed to save '{name}': {error}".format(
+                    name=dataset.name, error=error))
+        if self._errors:
+            raise next(iter(self._errors.values()))
 
     def add_dataset(self, dataset):
         """Adds a DataSet object to the DataGroup.
@@ -491,9 +1516,10 @@ class DataGroup(DataComponent):
         if name in self._datagroup.keys():
             raise KeyError("A DataSet object '{name}' already exists in the \
                 DataGroup".format(name=name))
-        self._datagroup[name] = dataset
+        self._register(dataset)
 
-    def add_dataset_from_path(self, path):
+    def add_dataset_from_path(self, path, columns=None, schema=None, 
+                              n_jobs=None, executor=None):
         """Adds DataSet objects from files located at path.
 
         If path is a directory, DataSet objects are created, loaded from the
@@ -506,19 +1532,36 @@ class DataGroup(DataComponent):
         path : str
             A relative directory containing csv files or a path to a single
             file.
+        columns : array-like (Optional)
+            The columns to load. See DataSet.load.
+        schema : Schema, int or str (Optional)
+            The schema used to parse the files. See DataSet.load.
+        n_jobs : int (Optional)
+            The number of worker processes parsing files concurrently. If 
+            -1, all cpus are used. By default, files are parsed serially.
+        executor : concurrent.futures.Executor (Optional)
+            An executor to which the loading tasks are submitted.
+
+        Note
+        ----
+        DataSets are added in sorted path order. Files which fail to load
+        are not added. Failures are printed and available from the errors 
+        attribute.
 
         """
 
         if os.path.isdir(path):
-            for directory, _, filenames in os.walk(path):
-                for filename in filenames:                     
-                    ds = DataSet(os.path.join(directory, filename))
-                    ds.load() 
-                    self._datagroup[ds.name] = ds
+            paths = list_files(path)
         else:
-            ds = DataSet(path)
-            ds.load() 
-            self._datagroup[ds.name] = ds     
+            paths = [path]
+        datasets = [DataSet(p, cache=self._cache) for p in paths]
+        if self._residency is not None:
+            for ds in datasets:
+                ds._load_args = (columns, schema)
+                self._register(ds)
+            return
+        for ds in self._load_datasets(datasets, columns, schema, n_jobs, executor):
+            self._register(ds)
 
     def change_dataset(self, dataset):
         """Replaces a dataset object of same name with the passed dataset.
@@ -536,9 +1579,11 @@ class DataGroup(DataComponent):
 
         """
         if dataset.name in self._datagroup.keys():
-            self._datagroup[dataset.name] = dataset
+            if self._residency is not None:
+                self._residency.detach(self._datagroup[dataset.name])
+            self._register(dataset)
         else:
-            self._add_dataset(dataset)
+            self.add_dataset(dataset)
 
     def remove_dataset(self, dataset):
         """Removes a dataset from the DataGroup object.
@@ -557,8 +1602,10 @@ class DataGroup(DataComponent):
             del self._datagroup[dataset.name]
         except KeyError as e:
             print(e)
+        if self._residency is not None:
+            self._residency.detach(dataset)
 
-    def summarize(self, verbose=False):
+    def summarize(self, verbose=False, n_jobs=None, executor=None):
         """Returns and optionally prints a DataGroup summary.
 
         The DataGroup summary includes summary data and summary statistics. 
@@ -571,27 +1618,72 @@ class DataGroup(DataComponent):
         Parameters
         ----------
         verbose : Boolean
-            If True, the DataGroup summary is printed to sysout.
+            If True, the progress of each DataSet and the DataGroup summary
+            are printed to sysout.
+        n_jobs : int (Optional)
+            The number of worker processes summarizing DataSets concurrently.
+            If -1, all cpus are used. Workers reload data loaded from a
+            source from the columnar cache and return only the summaries.
+        executor : concurrent.futures.Executor (Optional)
+            An executor to which the summaries are submitted instead.
 
         Returns
         -------
-        Dictionary containing two elements: 'stats' and 'data'. The
-            'stats' element provides descriptive statistics for
-            the summary 'data'.
+        Dictionary containing three elements: 'stats', 'data' and 'timing'. 
+            The 'stats' element provides descriptive statistics for
+            the summary 'data'. The 'timing' element holds the seconds 
+            taken to summarize each DataSet.
+
+        Note
+        ----
+        A DataSet which fails to summarize does not stop the others. 
+        Failures are printed and available from the errors attribute.
 
         """
+        datasets = list(self._datagroup.values())
+        summaries = [None] * len(datasets)
+        seconds = [0.0] * len(datasets)
+        pending, tasks = [], []
+        parallel = executor is not None or (n_jobs and n_jobs != 1)
+        for i, dataset in enumerate(datasets):
+            # Memoized summaries are not sent to worker processes.
+            if parallel and dataset._memo is not None:
+                summaries[i] = dataset._memo.get(dataset._memo.key(
+                    *dataset._memo_parts('summarize')))
+                if summaries[i] is not None:
+                    continue
+            pending.append(i)
+            tasks.append(dataset._shippable() if parallel else (dataset, False))
+
+        self._errors = {}
+        def report(position, result, error):
+            dataset = datasets[pending[position]]
+            if error is not None:
+                self._errors[dataset.name] = error
+                print("Failed to summarize '{source}': {error}".format(
+                    source=dataset.source, error=error))
+            elif verbose:
+                print("Summarized {name} in {seconds:.2f} seconds.".format(
+                    name=dataset.name, seconds=result[1]))
+
+        results = run(_summarize_task, tasks, n_jobs=n_jobs if parallel else None,
+                      executor=executor, callback=report)
+        for i, (result, error) in zip(pending, results):
+            if error is None:
+                summaries[i], seconds[i] = result
+                if parallel and datasets[i]._memo is not None:
+                    datasets[i]._memo.put(datasets[i]._memo.key(
+                        *datasets[i]._memo_parts('summarize')), summaries[i])
+
+        # Assemble the summary data once from the summaries.
         summary = {}
-        # Compute summaries for each DataSet object.
-        summary_data = pd.DataFrame()
-        for dataset in self._datagroup.values():
-            summary_dict = dataset.summarize()
-            summary_df = pd.DataFrame(summary_dict, index=[0])
-            summary_data = pd.concat([summary_df, summary_data], 
-                                    ignore_index=True, axis=0, sort=False)
+        summary_data = pd.DataFrame([s for s in summaries if s is not None])
         summary['data'] = summary_data
+        summary['timing'] = pd.DataFrame({'Name': [ds.name for ds in datasets],
+                                          'Seconds': seconds})
 
         # Compute descriptive statistics on summary data.
-        summary_data = summary_data.drop(['Date'], axis=1)
+        summary_data = summary_data.drop(['Date'], axis=1, errors='ignore')
         summary_stats = summary_data.describe().T.round(2)
         summary_stats = summary_stats.reset_index() 
         summary['stats'] = summary_stats
@@ -27,57 +27,99 @@ import click
 import logging
 import os
 from pathlib import Path
-import re
-import requests
+import site
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+site.addsitedir(str(PROJECT_DIR))
 
-from bs4 import BeautifulSoup
+from src.data.cache import ColumnarCache
+from src.data.catalog import Catalog, CATALOG_URL
+from src.data.download import Downloader
+from src.data.ingest import IngestPipeline
 
-def get_data(project_dir,year, market):
-    """Downloads data into raw data directory."""
+def get_data(project_dir, year, market, n_workers=4, refresh=False, 
+             ingest=False):
+    """Downloads data into raw data directory.
+
+    Downloads are planned from the local catalog of Inside Airbnb files,
+    which is built on first use and refreshed on request. Files are
+    downloaded concurrently and resumed after dropped connections. A
+    checksum manifest in the raw data directory records each completed
+    file, so files unchanged upstream are not downloaded again.
+
+    Parameters
+    ----------
+    project_dir : str
+        The project directory.
+    year : str
+        The year of the snapshots to download.
+    market : str
+        The country, region or city, or comma separated markets, e.g.
+        'san-francisco' or 'united-states'. Each selects every city whose
+        country, region or city it names.
+    n_workers : int
+        The number of concurrent downloads.
+    refresh : bool
+        If True, the catalog is refreshed from the get-the-data page.
+    ingest : bool
+        If True, each file is parsed into typed Parquet as soon as it has
+        been downloaded. The Parquet files are kept under data/interim/
+        in a ColumnarCache which never evicts them. DataSets read them
+        when given ColumnarCache(<project_dir>/data/interim).
+
+    """
     
     logger = logging.getLogger(__name__)
     logger.info('downloading data into raw data directory')
 
-    # point to output directory
-    url = "http://insideairbnb.com/get-the-data.html"
     mbyte=1024*1024
+    raw_data_dir = os.path.join(project_dir, "data/raw/")
+
+    catalog = Catalog(os.path.join(project_dir, "data/external/catalog.json"))
+    if refresh or not len(catalog):
+        print('Refreshing catalog: ', CATALOG_URL)
+        catalog.refresh()
 
-    print('Reading: ', url)
-    html = requests.get(url).text
-    soup = BeautifulSoup(html)
+    markets = [m.strip() for m in market.split(",") if m.strip()]
+    unknown = [m for m in markets if catalog.query(markets=m).empty]
+    if unknown:
+        raise ValueError("Unknown market(s) %s. Markets are countries, regions "
+                         "or cities as they appear in the catalog, e.g. "
+                         "'united-states', 'ca' or 'san-francisco'." % 
+                         ", ".join(unknown))
+    jobs = catalog.plan(raw_data_dir, markets=markets, kinds='listings',
+                        since=year + "-01-01", until=year + "-12-31")
+    print('Planned %d downloads' % len(jobs))
 
-    print('Processing: ', url)
-    for name in soup.findAll('a', href=True):
-        zipurl = name['href']
-        directory = ""
-        raw_data_dir = os.path.join(project_dir, "data/raw/")
-        if( zipurl.endswith('listings.csv.gz') and market in zipurl and year in zipurl):     
-            city =  zipurl.split("/")[5]          
-            parts = zipurl.split("/")[4:9]   
-            filename = '_'.join(parts)             
-            directory = os.path.join(raw_data_dir, city, year).replace("\\", "/")
-            os.makedirs(directory, exist_ok=True)
-            filepath = os.path.join(directory, filename).replace("\\", "/")        
-            if os.path.exists(filepath):
-                print("%s already downloaded" % filepath)
-            else:
-                r = requests.get(zipurl, stream=True)
-                if( r.status_code == requests.codes.ok ) :
-                    fsize = int(r.headers['content-length'])
-                    print('Downloading %s (%sMb)' % ( filepath, fsize/mbyte ))
-                    with open(filepath, 'wb') as fd:
-                        for chunk in r.iter_content(chunk_size=1024): # chuck size can be larger
-                            if chunk: # ignore keep-alive requests
-                                fd.write(chunk)
-                        fd.close()
+    downloader = Downloader(os.path.join(raw_data_dir, "manifest.json"),
+                            n_workers=n_workers)
+    if ingest:
+        cache = ColumnarCache(os.path.join(project_dir, "data", "interim"),
+                              max_bytes=None, eviction=False)
+        results = IngestPipeline(downloader, cache=cache).run(jobs)
+    else:
+        results = downloader.download_all(jobs)
+    for result in results:
+        if result['status'] == 'failed':
+            print('Failed to download %s: %s' % (result['url'], result['error']))
+        elif result['status'] == 'not-modified':
+            print("%s already downloaded" % result['path'])
+        else:
+            print('Downloaded %s (%sMb)' % (result['path'], result['bytes']/mbyte))
+        if result.get('target'):
+            print('Ingested %s' % result['target'])
 
 @click.command()
 @click.argument('market')
 @click.argument('year')
-def main(market, year):
-    # Obtains the root directory for the project.
-    project_dir = Path(__file__).resolve().parents[2]
-    get_data(project_dir, year, market)    
+@click.option('--workers', default=4, help='Number of concurrent downloads.')
+@click.option('--refresh', is_flag=True, help='Refresh the catalog of files.')
+@click.option('--ingest', is_flag=True, help='Convert files to Parquet on arrival.')
+def main(market, year, workers, refresh, ingest):
+    try:
+        get_data(PROJECT_DIR, year, market, n_workers=workers, refresh=refresh,
+                 ingest=ingest)    
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='MARKET')
 
 if __name__ == "__main__":
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : parsers.py                                                        #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 2:24:15 am                       #
+# Last Modified : Sunday, October 18th 2026, 2:24:15 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Parsing of currency and percent columns, such as '$1,234.00' and '95%'.
+
+Price columns hold few distinct strings relative to their length, so each
+column is factorized and only its distinct tokens are stripped of '$', ','
+'%' and spaces and converted, in a single vectorized pass. The values
+are then gathered by their codes. Tokens which are not numbers after
+stripping are counted as invalid and parsed as missing values.
+"""
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ['price', 'weekly_price', 'monthly_price', 'security_deposit',
+                 'cleaning_fee', 'extra_people']
+PERCENT_COLUMNS = ['host_response_rate', 'host_acceptance_rate']
+SYMBOLS = r'[$,%\s]'
+# --------------------------------------------------------------------------- #
+#                               Functions                                     #
+# --------------------------------------------------------------------------- #
+def _parse(series, dtype='float32'):
+    """Returns the parsed values of a series and the counts of its invalid
+    tokens."""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        invalid = pd.Series(dtype=np.int64)
+    else:
+        codes, uniques = pd.factorize(series)
+        tokens = pd.Series(uniques, dtype=object).astype(str).str.replace(
+            SYMBOLS, '', regex=True)
+        parsed = pd.to_numeric(tokens, errors='coerce').to_numpy(dtype=float)
+        bad = np.isnan(parsed) & (tokens != '').to_numpy()
+        # Code -1 marks missing values, which take the trailing NaN.
+        values = np.append(parsed, np.nan)[codes]
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        invalid = pd.Series(counts[bad], index=pd.Index(uniques[bad], dtype=object),
+                            dtype=np.int64)
+    if dtype == 'cents':
+        values = pd.array(np.round(values * 100), dtype='Int64')
+    else:
+        values = values.astype(dtype)
+    return pd.Series(values, index=series.index, name=series.name), invalid
+
+def parse_number(series, dtype='float32'):
+    """Converts a series of currency or percent strings to numbers.
+
+    Parameters
+    ----------
+    series : Series
+        Strings such as '$1,234.00' or '95%'. Numeric series are cast.
+    dtype : str
+        The dtype of the result, or 'cents' for nullable integer cents.
+
+    """
+    return _parse(series, dtype)[0]
+# --------------------------------------------------------------------------- #
+#                              NumberParser                                   #
+# --------------------------------------------------------------------------- #
+class NumberParser:
+    """Parses currency and percent columns of DataFrames or chunks.
+
+    Invalid tokens are counted per column across all the frames parsed,
+    and reported by the report method.
+
+    Parameters
+    ----------
+    columns : list
+        The columns to parse. Columns absent from a frame are skipped.
+    dtype : str
+        The dtype of the parsed columns, or 'cents' for nullable integer
+        cents.
+
+    """
+
+    def __init__(self, columns=PRICE_COLUMNS, dtype='float32'):
+        self._columns = list(columns)
+        self._dtype = dtype
+        self._values = Counter()
+        self._invalid = {column: Counter() for column in self._columns}
+
+    @property
+    def invalid(self):
+        """The number of invalid tokens parsed."""
+        return sum(sum(c.values()) for c in self._invalid.values())
+
+    def parse_series(self, series, dtype=None):
+        """Parses a series, counting its invalid tokens under its name.
+
+        Parameters
+        ----------
+        series : Series
+            Currency or percent strings. Series of columns not designated
+            are added to the report.
+        dtype : str (Optional)
+            The dtype of the result. Defaults to the dtype of the parser.
+
+        """
+        column = series.name
+        if column not in self._invalid:
+            self._columns.append(column)
+            self._invalid[column] = Counter()
+        values, invalid = _parse(series, dtype or self._dtype)
+        self._values[column] += int(values.notna().sum() + invalid.sum())
+        self._invalid[column].update(invalid.to_dict())
+        return values
+
+    def parse(self, df):
+        """Parses the columns of a DataFrame in place and returns it."""
+        for column in list(self._columns):
+            if column in df.columns:
+                df[column] = self.parse_series(df[column])
+        return df
+
+    def parse_chunks(self, chunks):
+        """Yields the parsed chunks of an iterable of DataFrames."""
+        for chunk in chunks:
+            yield self.parse(chunk)
+
+    def report(self, examples=3):
+        """Returns the counts of values and invalid tokens of each column,
+        with the most frequent invalid tokens."""
+        report = pd.DataFrame(index=self._columns)
+        report['Values'] = [self._values[c] for c in self._columns]
+        report['Invalid'] = [sum(self._invalid[c].values()) for c in self._columns]
+        report['% Invalid'] = np.round(report['Invalid'] /
+                                       report['Values'].clip(lower=1) * 100, 2)
+        report['Examples'] = [", ".join(str(t) for t, _ in
+                                        self._invalid[c].most_common(examples))
+                              for c in self._columns]
+        return report
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : replacement.py                                                    #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 3:06:52 am                       #
+# Last Modified : Sunday, October 18th 2026, 3:06:52 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Batched string replacement over the text columns of DataFrames.
+
+A ReplacementEngine compiles its rules once. Each text column is
+factorized, and the rules which apply to the column are run in order on
+all of its distinct strings at once, with the vectorized string methods
+of pandas. The results are then gathered by code. Columns can be spread
+across a pool of workers, to which only their distinct strings are sent.
+Numeric columns are never scanned.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from ..utils.parallel import run
+# --------------------------------------------------------------------------- #
+#                               Functions                                     #
+# --------------------------------------------------------------------------- #
+def _ismissing(pattern):
+    """True if a pattern stands for missing values, such as None or NaN."""
+    return pd.api.types.is_scalar(pattern) and bool(pd.isna(pattern))
+
+def _replace_values(values, rules):
+    """Applies compiled rules in order to the distinct values of a column,
+    in a worker process if run in a pool.
+
+    The strings are held in a pandas string array, so that regex rules run
+    through its vectorized str.replace, natively when pandas can. Regex
+    rules replace every match within strings. Literal rules replace
+    strings equal to the pattern whole, as DataFrame.replace, or missing
+    values if the pattern is missing. A value replaced by a non-string is
+    left alone by the remaining rules, unless it is missing.
+
+    """
+    values = np.array(values, dtype=object)
+    text = np.array([isinstance(v, str) for v in values], dtype=bool)
+    strings = pd.Series(values[text], index=np.flatnonzero(text),
+                        dtype=pd.StringDtype())
+    for pattern, replace in rules:
+        if isinstance(pattern, re.Pattern):
+            strings = strings.str.replace(pattern.pattern, replace, regex=True,
+                                          flags=pattern.flags & ~re.UNICODE)
+        elif _ismissing(pattern):
+            missing = np.flatnonzero(~text & pd.isna(values))
+            values[missing] = replace
+            if isinstance(replace, str) and len(missing):
+                text[missing] = True
+                strings = pd.concat([strings, pd.Series(
+                    replace, index=missing, dtype=strings.dtype)]).sort_index()
+        else:
+            hit = (strings == pattern).fillna(False).to_numpy(dtype=bool)
+            if not hit.any():
+                continue
+            if isinstance(replace, str):
+                strings[hit] = replace
+            else:
+                values[strings.index[hit]] = replace
+                text[strings.index[hit]] = False
+                strings = strings[~hit]
+    values[strings.index] = strings.to_numpy(dtype=object)
+    return values
+# --------------------------------------------------------------------------- #
+#                           ReplacementEngine                                 #
+# --------------------------------------------------------------------------- #
+class ReplacementEngine:
+    """Applies many string replacement rules to DataFrames at once.
+
+    Parameters
+    ----------
+    rules : list of tuples
+        (pattern, replace) or (pattern, replace, columns) rules, applied in
+        order. A rule without columns applies to all text columns.
+    regex : bool
+        If True, patterns are regular expressions and every match within a
+        string is replaced. If False, strings equal to a pattern are
+        replaced whole, as with DataFrame.replace, and a pattern of None or
+        NaN replaces missing values.
+    n_jobs : int (Optional)
+        The number of worker processes replacing columns. If -1, all cpus
+        are used.
+    executor : concurrent.futures.Executor (Optional)
+        An executor to which the columns are submitted instead.
+
+    """
+
+    def __init__(self, rules, regex=True, n_jobs=None, executor=None):
+        self._rules = []
+        for rule in rules:
+            pattern, replace = rule[0], rule[1]
+            columns = rule[2] if len(rule) > 2 and rule[2] else None
+            if isinstance(columns, str):
+                columns = [columns]
+            if regex and _ismissing(pattern):
+                raise ValueError("Missing values cannot be matched by a regular "
+                                 "expression. Use regex=False to replace them.")
+            compiled = re.compile(pattern) if regex else pattern
+            self._rules.append((compiled, replace,
+                                None if columns is None else set(columns)))
+        self._n_jobs = n_jobs
+        self._executor = executor
+        self._counts = pd.Series(dtype=np.int64)
+
+    @property
+    def counts(self):
+        """The number of values changed in each column by the most recent
+        transform."""
+        return self._counts
+
+    def rules_for(self, column):
+        """Returns the compiled rules which apply to a column, in order."""
+        return [(pattern, replace) for pattern, replace, columns in self._rules
+                if columns is None or column in columns]
+
+    @staticmethod
+    def text_columns(df):
+        """Returns the object, string and categorical columns of df."""
+        return list(df.select_dtypes(include=['object', 'string', 'category']
+                                     ).columns)
+
+    def transform(self, df):
+        """Returns a copy of df with the rules applied to its text columns."""
+        columns = [c for c in self.text_columns(df) if self.rules_for(c)]
+        factors = [pd.factorize(df[column]) for column in columns]
+        # The trailing NaN stands for the missing values, which have code -1.
+        tasks = [(np.append(np.asarray(uniques, dtype=object), np.nan),
+                  self.rules_for(column))
+                 for column, (_, uniques) in zip(columns, factors)]
+        results = run(_replace_values, tasks, n_jobs=self._n_jobs,
+                      executor=self._executor)
+        errors = [error for _, error in results if error is not None]
+        if errors:
+            raise errors[0]
+        df = df.copy(deep=False)
+        counts = {}
+        for column, (codes, _), (values, _), (replaced, _) in \
+            zip(columns, factors, tasks, results):
+            with np.errstate(invalid='ignore'):
+                same = (values == replaced) | (pd.isna(values) & pd.isna(replaced))
+            changed = ~np.asarray(same, dtype=bool)
+            positions = np.where(codes < 0, len(values) - 1, codes)
+            counts[column] = int(np.bincount(positions, minlength=len(values)
+                                             )[changed].sum())
+            if not changed.any():
+                continue
+            series = pd.Series(replaced[positions], index=df.index, name=column,
+                               dtype=object)
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                series = series.astype('category')
+            elif not pd.api.types.is_object_dtype(df[column].dtype):
+                series = series.astype(df[column].dtype)
+            df[column] = series
+        self._counts = pd.Series(counts, dtype=np.int64)
+        return df
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : sampling.py                                                       #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 7:48:26 pm                     #
+# Last Modified : Saturday, October 17th 2026, 7:48:26 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Single-pass samplers over streams of DataFrame chunks.
+
+Random samples are drawn by assigning each row a uniform random key from
+a seeded generator, in row order, and keeping the rows with the n
+smallest keys. The keys depend only on the seed and the position of a
+row, so a sample is the same whether it is drawn from a loaded DataFrame
+or from chunks of any size read from disk.
+
+Stratified and group samples are generated with vectorized operations on
+integer codes, and their positions may be cached by the fingerprint of
+the data, the sample specification and the seed.
+"""
+from collections import deque
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .cache import default_cache_dir
+from .union import union_frames
+from ..utils.fingerprint import spec_key
+
+# --------------------------------------------------------------------------- #
+#                                Functions                                    #
+# --------------------------------------------------------------------------- #
+def sample_positions(n_rows, n, seed=None):
+    """Returns the sorted positions of a random sample of n of n_rows rows."""
+    n = min(n, n_rows)
+    if n <= 0:
+        return np.array([], dtype=np.int64)
+    keys = np.random.default_rng(seed).random(n_rows)
+    return np.sort(np.argpartition(keys, n - 1)[:n])
+
+def head(chunks, n):
+    """Returns the first n rows of a stream of chunks, reading no further."""
+    frames, count = [], 0
+    for df in chunks:
+        frames.append(df.iloc[:n - count])
+        count += frames[-1].shape[0]
+        if count >= n:
+            break
+    return union_frames(frames)
+# --------------------------------------------------------------------------- #
+#                                Samplers                                     #
+# --------------------------------------------------------------------------- #
+class TailBuffer:
+    """Ring buffer of chunks retaining the last n rows of a stream."""
+
+    def __init__(self, n):
+        self._n = n
+        self._chunks = deque()
+        self._buffered = 0
+        self._seen = 0
+
+    def update(self, df):
+        """Appends a chunk, discarding chunks no longer among the last n rows."""
+        total = df.shape[0]
+        df = df.iloc[max(0, total - self._n):]
+        start = self._seen + total - df.shape[0]
+        self._seen += total
+        self._chunks.append((np.arange(start, start + df.shape[0]), df))
+        self._buffered += df.shape[0]
+        while self._chunks and \
+                self._buffered - self._chunks[0][1].shape[0] >= self._n:
+            self._buffered -= self._chunks.popleft()[1].shape[0]
+
+    def result(self):
+        """Returns the last n rows, indexed by row position."""
+        if not self._chunks:
+            return pd.DataFrame()
+        positions = np.concatenate([p for p, _ in self._chunks])
+        df = union_frames([df for _, df in self._chunks]).set_axis(positions, axis=0)
+        return df.iloc[df.shape[0] - min(self._n, df.shape[0]):]
+
+
+class Reservoir:
+    """Seeded single-pass random sample of n rows from a stream of chunks.
+
+    Parameters
+    ----------
+    n : int
+        The size of the sample.
+    seed : int (Optional)
+        The seed of the random keys.
+
+    """
+
+    def __init__(self, n, seed=None):
+        self._n = n
+        self._rng = np.random.default_rng(seed)
+        self._sample = None
+        self._keys = np.array([], dtype=np.float64)
+        self._positions = np.array([], dtype=np.int64)
+        self._seen = 0
+
+    @property
+    def seen(self):
+        return self._seen
+
+    def update(self, df):
+        """Offers the rows of a chunk to the sample."""
+        keys = self._rng.random(df.shape[0])
+        positions = np.arange(self._seen, self._seen + df.shape[0])
+        self._seen += df.shape[0]
+        if self._n <= 0:
+            return
+        # Once the reservoir is full, only rows with keys below the largest
+        # key in the reservoir can enter it.
+        if self._keys.shape[0] >= self._n:
+            entering = keys < self._keys.max()
+            df, keys, positions = df[entering], keys[entering], positions[entering]
+        if not df.shape[0]:
+            return
+        frames = [df] if self._sample is None else [self._sample, df]
+        sample = union_frames(frames)
+        keys = np.concatenate([self._keys, keys])
+        positions = np.concatenate([self._positions, positions])
+        if keys.shape[0] > self._n:
+            keep = np.argpartition(keys, self._n - 1)[:self._n]
+            sample, keys, positions = sample.iloc[keep], keys[keep], positions[keep]
+        self._sample = sample.reset_index(drop=True)
+        self._keys = keys
+        self._positions = positions
+
+    def result(self):
+        """Returns the sample in stream order, indexed by row position."""
+        if self._sample is None:
+            return pd.DataFrame()
+        order = np.argsort(self._positions, kind='mergesort')
+        return self._sample.iloc[order].set_axis(self._positions[order], axis=0)
+# --------------------------------------------------------------------------- #
+#                           Stratified Sampling                               #
+# --------------------------------------------------------------------------- #
+def _codes(strata):
+    """Returns integer codes of strata, with missing values as a stratum."""
+    if isinstance(strata, pd.DataFrame):
+        combined = np.zeros(strata.shape[0], dtype=np.int64)
+        for column in strata.columns:
+            codes = _codes(strata[column])
+            combined = combined * (codes.max() + 1 if codes.shape[0] else 1) + codes
+            combined = pd.factorize(combined)[0]
+        return combined
+    codes, uniques = pd.factorize(strata)
+    return np.where(codes < 0, len(uniques), codes)
+
+def _apportion(total, sizes):
+    """Allocates total among strata in proportion to their sizes, using the
+    largest remainder method so that quotas sum exactly to total."""
+    exact = total * sizes / max(sizes.sum(), 1)
+    quotas = np.floor(exact).astype(np.int64)
+    remainder = int(total - quotas.sum())
+    if remainder > 0:
+        order = np.argsort(-(exact - quotas), kind='mergesort')
+        quotas[order[:remainder]] += 1
+    return np.minimum(quotas, sizes)
+
+def stratified_positions(strata, n=None, frac=None, allocation='proportional',
+                         seed=None):
+    """Returns the sorted positions of a stratified random sample.
+
+    Parameters
+    ----------
+    strata : Series, array-like or DataFrame
+        The stratum of each row. The columns of a DataFrame are combined.
+    n : int (Optional)
+        With proportional allocation, the size of the sample. With fixed
+        allocation, the number of rows drawn from each stratum.
+    frac : float (Optional)
+        With proportional allocation, the fraction of rows to sample.
+    allocation : str
+        'proportional' allocates the sample in proportion to the size of
+        each stratum. 'fixed' draws n rows from each stratum, or all rows
+        of smaller strata.
+    seed : int (Optional)
+        The seed of the random keys.
+
+    """
+    if allocation not in ('proportional', 'fixed'):
+        raise ValueError("Allocation must be 'proportional' or 'fixed'.")
+    if n is None and (frac is None or allocation == 'fixed'):
+        raise ValueError("Provide n, or frac with proportional allocation.")
+    codes = _codes(strata)
+    n_rows = codes.shape[0]
+    sizes = np.bincount(codes, minlength=codes.max() + 1 if n_rows else 0)
+    if allocation == 'fixed':
+        quotas = np.minimum(sizes, n)
+    else:
+        total = n if n is not None else int(round(frac * n_rows))
+        quotas = _apportion(min(total, n_rows), sizes)
+    # Rows are ordered by stratum, then by random key, and each stratum
+    # contributes the rows ranked within its quota.
+    keys = np.random.default_rng(seed).random(n_rows)
+    order = np.lexsort((keys, codes))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+    ranks = np.empty(n_rows, dtype=np.int64)
+    ranks[order] = np.arange(n_rows) - starts[codes[order]]
+    return np.flatnonzero(ranks < quotas[codes])
+
+def _group_keys(groups, seed):
+    """Returns a key in [0, 1) for each row, determined by its group and the
+    seed alone, so that a group has the same key in every snapshot."""
+    values = pd.Series(np.asarray(groups, dtype=object)).astype(str).values
+    hash_key = "{seed:016d}".format(seed=seed or 0)[-16:]
+    hashes = pd.util.hash_array(values, hash_key=hash_key, categorize=True)
+    return hashes / float(2 ** 64)
+
+def group_positions(groups, n=None, frac=None, seed=None):
+    """Returns the sorted positions of the rows of a random sample of groups.
+
+    Every row of a sampled group is selected. Groups, such as listing ids,
+    are sampled by a hash of the group and the seed, so the same groups are
+    selected in every snapshot in which they appear.
+
+    Parameters
+    ----------
+    groups : Series or array-like
+        The group of each row, e.g. the listing id.
+    n : int (Optional)
+        The number of groups to sample.
+    frac : float (Optional)
+        The fraction of groups to sample. A group is selected if its key is
+        below frac, which is consistent across data of different extent.
+    seed : int (Optional)
+        The seed of the group keys. Defaults to 0.
+
+    """
+    if n is None and frac is None:
+        raise ValueError("Provide n or frac.")
+    keys = _group_keys(groups, seed)
+    if n is None:
+        return np.flatnonzero(keys < frac)
+    unique = np.unique(keys)
+    if n <= 0:
+        return np.array([], dtype=np.int64)
+    threshold = unique[min(n, unique.shape[0]) - 1]
+    return np.flatnonzero(keys <= threshold)
+# --------------------------------------------------------------------------- #
+#                            SampleIndexCache                                 #
+# --------------------------------------------------------------------------- #
+class SampleIndexCache:
+    """Memory and disk cache of sample positions.
+
+    Positions are keyed by the fingerprint of the data, the specification
+    of the sample and its seed, and stored as .npy files.
+
+    Parameters
+    ----------
+    directory : str (Optional)
+        The directory of the .npy files. Defaults to 'samples' in the
+        directory returned by default_cache_dir. If False, positions are
+        kept in memory only.
+
+    """
+
+    def __init__(self, directory=None):
+        self._directory = os.path.join(default_cache_dir(), "samples") \
+            if directory is None else directory
+        self._memory = {}
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + ".npy")
+
+    def key(self, fingerprint, spec, seed):
+        return spec_key(fingerprint, spec, seed)
+
+    def get(self, key):
+        """Returns the cached positions for a key, or None."""
+        if key in self._memory:
+            return self._memory[key]
+        if self._directory and os.path.exists(self._path(key)):
+            positions = np.load(self._path(key))
+            self._memory[key] = positions
+            return positions
+        return None
+
+    def put(self, key, positions):
+        """Caches positions under a key."""
+        self._memory[key] = positions
+        if self._directory:
+            os.makedirs(self._directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._directory, suffix=".npy")
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, positions)
+            os.replace(tmp, self._path(key))
+
+    def clear(self):
+        """Removes all cached positions."""
+        self._memory = {}
+        if self._directory and os.path.isdir(self._directory):
+            for filename in os.listdir(self._directory):
+                if filename.endswith(".npy"):
+                    os.remove(os.path.join(self._directory, filename))
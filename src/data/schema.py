@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : schema.py                                                         #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 10:05:48 am                    #
+# Last Modified : Saturday, October 17th 2026, 10:05:48 am                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Versioned schema registry for Inside Airbnb files.
+
+A Schema maps each column of a file layout to a target type, along with
+categorical vocabularies and date formats. Schemas are used to parse only
+the requested columns, directly into compact types. The layout of the
+listings file changed over time, so each layout is registered under a
+version and the version matching a file is inferred from its header.
+"""
+from collections import OrderedDict
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .parsers import parse_number
+# --------------------------------------------------------------------------- #
+#                                 Field                                       #
+# --------------------------------------------------------------------------- #
+KINDS = ['int', 'float', 'text', 'category', 'bool', 'date', 'currency',
+         'percent']
+
+class Field:
+    """Describes the target type of a single column.
+
+    Parameters
+    ----------
+    name : str
+        The column name.
+    kind : str
+        One of 'int', 'float', 'text', 'category', 'bool', 'date',
+        'currency' or 'percent'.
+    dtype : str (Optional)
+        The target dtype for 'int' and 'float' fields. Defaults to 'Int64'
+        and 'float32' respectively.
+    categories : list (Optional)
+        The vocabulary of a 'category' field. Observed values outside of
+        the vocabulary are appended to the categories.
+    fmt : str (Optional)
+        The strftime format of a 'date' field.
+
+    """
+
+    DEFAULT_DTYPES = {'int': 'Int64', 'float': 'float32', 'text': 'object',
+                      'category': 'category', 'bool': 'boolean',
+                      'date': 'datetime64[ns]', 'currency': 'float32',
+                      'percent': 'float32'}
+
+    def __init__(self, name, kind, dtype=None, categories=None, fmt=None):
+        if kind not in KINDS:
+            raise ValueError("Kind must be one of {kinds}.".format(kinds=KINDS))
+        self.name = name
+        self.kind = kind
+        self.dtype = dtype or self.DEFAULT_DTYPES[kind]
+        self.categories = categories
+        self.fmt = fmt or ('%Y-%m-%d' if kind == 'date' else None)
+
+    def __repr__(self):
+        return "Field({name}, {kind}, {dtype})".format(name=self.name,
+                                                       kind=self.kind,
+                                                       dtype=self.dtype)
+
+    @property
+    def read_dtype(self):
+        """The dtype passed to the csv parser for this field."""
+        if self.kind in ['int', 'float']:
+            return self.dtype
+        if self.kind == 'category':
+            return 'category'
+        return 'object'
+
+    def parse(self, series):
+        """Converts a series read with read_dtype to the target type."""
+        if self.kind == 'category' and self.categories:
+            observed = [c for c in series.cat.categories
+                        if c not in self.categories]
+            return series.cat.set_categories(list(self.categories) + observed)
+        if self.kind == 'bool':
+            return series.map({'t': True, 'f': False}).astype(self.dtype)
+        if self.kind == 'date':
+            return pd.to_datetime(series, format=self.fmt, errors='coerce')
+        if self.kind in ['currency', 'percent']:
+            return parse_number(series, self.dtype)
+        return series
+
+    def empty(self, n):
+        """Returns an all missing series of length n in the target type."""
+        if self.kind == 'category':
+            return pd.Series(pd.Categorical([np.nan] * n,
+                                            categories=self.categories or []))
+        return pd.Series([None] * n, dtype='object').astype(self.dtype)
+# --------------------------------------------------------------------------- #
+#                                 Schema                                      #
+# --------------------------------------------------------------------------- #
+class Schema:
+    """An ordered collection of Fields describing a file layout.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of file described, e.g. 'listings'.
+    version : int
+        The version of the layout.
+    fields : list of Field
+        The fields in file order.
+    description : str (Optional)
+        A note on the snapshots which use the layout.
+
+    """
+
+    def __init__(self, kind, version, fields, description=None):
+        self._kind = kind
+        self._version = version
+        self._fields = OrderedDict((f.name, f) for f in fields)
+        self._description = description
+
+    def __repr__(self):
+        return "Schema({name}, {n} columns)".format(name=self.name,
+                                                    n=len(self._fields))
+
+    def __contains__(self, column):
+        return column in self._fields
+
+    def __getitem__(self, column):
+        return self._fields[column]
+
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def version(self):
+        return self._version
+
+    @property
+    def name(self):
+        return "{kind}-v{version}".format(kind=self._kind, version=self._version)
+
+    @property
+    def description(self):
+        return self._description
+
+    @property
+    def columns(self):
+        return list(self._fields.keys())
+
+    @property
+    def key(self):
+        """A short hash of the field definitions used to key cached parses."""
+        spec = repr([(f.name, f.kind, f.dtype, f.categories, f.fmt)
+                     for f in self._fields.values()])
+        digest = hashlib.sha1(spec.encode('utf-8')).hexdigest()[:8]
+        return self.name + "-" + digest
+
+    def select(self, exclude=None, kinds=None):
+        """Returns the columns of the schema filtered by name or kind.
+
+        Parameters
+        ----------
+        exclude : array-like (Optional)
+            Columns to leave out, e.g. OMIT_COLUMNS from build_features.
+        kinds : array-like (Optional)
+            Only columns of these kinds are returned.
+
+        """
+        exclude = set(exclude or [])
+        return [c for c, f in self._fields.items()
+                if c not in exclude and (kinds is None or f.kind in kinds)]
+
+    def dtypes(self, columns):
+        """Returns the read_csv dtype mapping for the columns."""
+        return {c: self._fields[c].read_dtype for c in columns
+                if c in self._fields}
+
+    def parse(self, df, parser=None):
+        """Converts the columns of a DataFrame to their target types.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The columns as read with read_dtype.
+        parser : NumberParser (Optional)
+            Parses the currency and percent columns, counting their invalid
+            tokens for its report.
+
+        """
+        for column in df.columns:
+            if column not in self._fields:
+                continue
+            field = self._fields[column]
+            if parser is not None and field.kind in ['currency', 'percent']:
+                df[column] = parser.parse_series(df[column], field.dtype)
+            else:
+                df[column] = field.parse(df[column])
+        return df
+
+    def conform(self, df, columns):
+        """Orders columns and adds requested columns missing from the file."""
+        return conform(df, columns, self)
+
+    def read_csv(self, path, columns=None, parser=None, **kwargs):
+        """Parses the requested columns of a csv file into target types.
+
+        Parameters
+        ----------
+        path : str
+            The path to the csv file.
+        columns : array-like (Optional)
+            The columns to return. Defaults to all columns in the file.
+        parser : NumberParser (Optional)
+            Parses the currency and percent columns. See parse.
+        kwargs : dict
+            Additional keyword arguments passed to pandas.read_csv.
+
+        """
+        header = list(read_header(path))
+        requested = list(columns) if columns else header
+        present = [c for c in requested if c in header]
+        df = pd.read_csv(path, usecols=present, dtype=self.dtypes(present),
+                         low_memory=False, **kwargs)
+        if isinstance(df, pd.DataFrame):
+            return self.conform(self.parse(df, parser), requested)
+        return (self.conform(self.parse(chunk, parser), requested) for chunk in df)
+# --------------------------------------------------------------------------- #
+#                                 Registry                                    #
+# --------------------------------------------------------------------------- #
+SCHEMAS = OrderedDict()
+
+def register(schema):
+    """Adds a schema to the registry."""
+    SCHEMAS[(schema.kind, schema.version)] = schema
+    return schema
+
+def get_schema(kind='listings', version=None):
+    """Returns a registered schema, by default the latest version of kind."""
+    if version is None:
+        versions = [v for k, v in SCHEMAS.keys() if k == kind]
+        if not versions:
+            raise KeyError("No schema registered for '{kind}'.".format(kind=kind))
+        version = max(versions)
+    try:
+        return SCHEMAS[(kind, version)]
+    except KeyError:
+        raise KeyError("Schema '{kind}-v{version}' is not registered.".format(
+            kind=kind, version=version))
+
+def conform(df, columns, schema=None):
+    """Orders columns and adds requested columns missing from the DataFrame.
+
+    Columns absent from the DataFrame are added as missing values of their
+    target type in the schema, so that snapshots of older layouts can be
+    combined with newer ones. Columns not in the schema are filled with
+    float NaN, which concatenation upcasts as it would an absent column.
+    The DataFrame passed in is not modified.
+
+    """
+    absent = [column for column in columns if column not in df.columns]
+    if absent:
+        df = df.copy(deep=False)
+    for column in absent:
+        if schema is not None and column in schema:
+            s = schema[column].empty(df.shape[0])
+            s.index = df.index
+        else:
+            s = pd.Series(np.nan, index=df.index, dtype='float64')
+        df[column] = s
+    return df[list(columns)]
+
+def union_schema(schemas):
+    """Returns a Schema with the fields of all schemas.
+
+    The fields of the latest version take precedence, followed by the
+    fields which only earlier versions have, so that the union of
+    snapshots of several layouts is typed throughout.
+
+    """
+    schemas = sorted({s.key: s for s in schemas if s is not None}.values(),
+                     key=lambda s: s.version, reverse=True)
+    if not schemas:
+        return None
+    if len(schemas) == 1:
+        return schemas[0]
+    fields = OrderedDict()
+    for schema in schemas:
+        for column in schema.columns:
+            fields.setdefault(column, schema[column])
+    return Schema(schemas[0].kind, schemas[0].version, list(fields.values()),
+                  description="Union of " + ", ".join(s.name for s in schemas))
+
+def read_header(path):
+    """Returns the column names of a csv file without reading the data."""
+    return pd.read_csv(path, nrows=0).columns
+
+def infer_schema(columns, kind='listings'):
+    """Returns the registered schema which best matches a set of columns.
+
+    The best match is the layout sharing the most columns with the file and,
+    among equals, the one with the fewest columns absent from the file.
+
+    """
+    columns = set(columns)
+    candidates = [s for (k, _), s in SCHEMAS.items() if k == kind]
+    if not candidates:
+        raise KeyError("No schema registered for '{kind}'.".format(kind=kind))
+    def score(schema):
+        shared = len(columns.intersection(schema.columns))
+        return (shared, -(len(schema.columns) - shared), schema.version)
+    return max(candidates, key=score)
+# --------------------------------------------------------------------------- #
+#                            Listings Layouts                                 #
+# --------------------------------------------------------------------------- #
+ROOM_TYPES = ['Entire home/apt', 'Private room', 'Shared room', 'Hotel room']
+RESPONSE_TIMES = ['within an hour', 'within a few hours', 'within a day',
+                  'a few days or more']
+BED_TYPES = ['Real Bed', 'Futon', 'Pull-out Sofa', 'Airbed', 'Couch']
+CANCELLATION_POLICIES = ['flexible', 'moderate', 'strict',
+                         'strict_14_with_grace_period', 'super_strict_30',
+                         'super_strict_60', 'long_term']
+EXPERIENCES = ['none', 'business', 'family', 'romantic', 'social']
+
+def _listings_fields(version):
+    """Returns the listings fields in file order for a layout version."""
+    F = Field
+    fields = [
+        F('id', 'int', 'int64'), F('listing_url', 'text'),
+        F('scrape_id', 'int', 'int64'), F('last_scraped', 'date'),
+        F('name', 'text'), F('summary', 'text'), F('space', 'text'),
+        F('description', 'text'),
+        F('experiences_offered', 'category', categories=EXPERIENCES),
+        F('neighborhood_overview', 'text'), F('notes', 'text'),
+        F('transit', 'text'), F('access', 'text'), F('interaction', 'text'),
+        F('house_rules', 'text'), F('thumbnail_url', 'text'),
+        F('medium_url', 'text'), F('picture_url', 'text'),
+        F('xl_picture_url', 'text'), F('host_id', 'int', 'int64'),
+        F('host_url', 'text'), F('host_name', 'text'),
+        F('host_since', 'date'), F('host_location', 'text'),
+        F('host_about', 'text'),
+        F('host_response_time', 'category', categories=RESPONSE_TIMES),
+        F('host_response_rate', 'percent'),
+        F('host_acceptance_rate', 'percent'),
+        F('host_is_superhost', 'bool'), F('host_thumbnail_url', 'text'),
+        F('host_picture_url', 'text'), F('host_neighbourhood', 'category'),
+        F('host_listings_count', 'float'),
+        F('host_total_listings_count', 'float'),
+        F('host_verifications', 'text'), F('host_has_profile_pic', 'bool'),
+        F('host_identity_verified', 'bool'), F('street', 'text'),
+        F('neighbourhood', 'category'), F('neighbourhood_cleansed', 'category'),
+        F('neighbourhood_group_cleansed', 'category'), F('city', 'category'),
+        F('state', 'category'), F('zipcode', 'text'), F('market', 'category'),
+        F('smart_location', 'category'), F('country_code', 'category'),
+        F('country', 'category'), F('latitude', 'float', 'float64'),
+        F('longitude', 'float', 'float64'), F('is_location_exact', 'bool'),
+        F('property_type', 'category'),
+        F('room_type', 'category', categories=ROOM_TYPES),
+        F('accommodates', 'int', 'Int16'), F('bathrooms', 'float'),
+        F('bedrooms', 'float'), F('beds', 'float'),
+        F('bed_type', 'category', categories=BED_TYPES),
+        F('amenities', 'text'), F('square_feet', 'float'),
+        F('price', 'currency'), F('weekly_price', 'currency'),
+        F('monthly_price', 'currency'), F('security_deposit', 'currency'),
+        F('cleaning_fee', 'currency'), F('guests_included', 'int', 'Int16'),
+        F('extra_people', 'currency'), F('minimum_nights', 'int', 'Int32'),
+        F('maximum_nights', 'int', 'Int32')]
+    if version >= 2:
+        fields += [
+            F('minimum_minimum_nights', 'int', 'Int32'),
+            F('maximum_minimum_nights', 'int', 'Int32'),
+            F('minimum_maximum_nights', 'int', 'Int32'),
+            F('maximum_maximum_nights', 'int', 'Int32'),
+            F('minimum_nights_avg_ntm', 'float'),
+            F('maximum_nights_avg_ntm', 'float')]
+    fields += [
+        F('calendar_updated', 'category'), F('has_availability', 'bool'),
+        F('availability_30', 'int', 'Int16'),
+        F('availability_60', 'int', 'Int16'),
+        F('availability_90', 'int', 'Int16'),
+        F('availability_365', 'int', 'Int16'),
+        F('calendar_last_scraped', 'date'),
+        F('number_of_reviews', 'int', 'Int32')]
+    if version >= 2:
+        fields += [F('number_of_reviews_ltm', 'int', 'Int32')]
+    fields += [
+        F('first_review', 'date'), F('last_review', 'date'),
+        F('review_scores_rating', 'float'),
+        F('review_scores_accuracy', 'float'),
+        F('review_scores_cleanliness', 'float'),
+        F('review_scores_checkin', 'float'),
+        F('review_scores_communication', 'float'),
+        F('review_scores_location', 'float'),
+        F('review_scores_value', 'float'),
+        F('requires_license', 'bool'), F('license', 'text'),
+        F('jurisdiction_names', 'text'), F('instant_bookable', 'bool'),
+        F('is_business_travel_ready', 'bool'),
+        F('cancellation_policy', 'category', categories=CANCELLATION_POLICIES),
+        F('require_guest_profile_picture', 'bool'),
+        F('require_guest_phone_verification', 'bool'),
+        F('calculated_host_listings_count', 'int', 'Int32')]
+    if version >= 2:
+        fields += [
+            F('calculated_host_listings_count_entire_homes', 'int', 'Int32'),
+            F('calculated_host_listings_count_private_rooms', 'int', 'Int32'),
+            F('calculated_host_listings_count_shared_rooms', 'int', 'Int32')]
+    fields += [F('reviews_per_month', 'float')]
+    return fields
+
+register(Schema('listings', 1, _listings_fields(1),
+                description="Listings snapshots published before 2019."))
+register(Schema('listings', 2, _listings_fields(2),
+                description="Listings snapshots published from 2019, adding "
+                "the nightly limit, last twelve months review and host "
+                "listings by room type columns."))
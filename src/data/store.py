@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : store.py                                                          #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 6:55:09 pm                     #
+# Last Modified : Saturday, October 17th 2026, 6:55:09 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Partitioned columnar store of processed listings.
+
+Processed snapshots are stored as Parquet files in a Hive layout,
+
+    data/processed/listings/market=<market>/year=<year>/snapshot=<date>/
+
+with min/max statistics for every column of every row group. Reads take
+filters on any column and a projection. Partitions whose market, year or
+snapshot cannot match are never opened, row groups whose statistics
+cannot match are skipped, and only the projected columns are read.
+
+Filters follow the pyarrow convention: a list of (column, op, value)
+tuples which must all hold, or a list of such lists of which any must
+hold. Supported ops are '==', '!=', '<', '<=', '>', '>=', 'in' and
+'not in'.
+"""
+import os
+from pathlib import Path
+import shutil
+import tempfile
+
+import pandas as pd
+
+from .cache import HAS_PYARROW
+from .union import snapshot_of
+
+if HAS_PYARROW:
+    import pyarrow
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+STORE_DIR = os.path.join(PROJECT_DIR, "data", "processed", "listings")
+PARTITIONS = ['market', 'year', 'snapshot']
+ROW_GROUP_SIZE = 16384
+# --------------------------------------------------------------------------- #
+#                                 Filters                                     #
+# --------------------------------------------------------------------------- #
+def to_expression(filters):
+    """Converts filters in disjunctive normal form to a dataset expression."""
+    if not filters:
+        return None
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+    disjunction = None
+    for conjunction in filters:
+        expression = None
+        for column, op, value in conjunction:
+            term = _predicate(ds.field(column), op, value)
+            expression = term if expression is None else expression & term
+        disjunction = expression if disjunction is None else disjunction | expression
+    return disjunction
+
+def _predicate(field, op, value):
+    if op in ('=', '=='):
+        return field == value
+    if op == '!=':
+        return field != value
+    if op == '<':
+        return field < value
+    if op == '<=':
+        return field <= value
+    if op == '>':
+        return field > value
+    if op == '>=':
+        return field >= value
+    if op == 'in':
+        return field.isin(list(value))
+    if op == 'not in':
+        return ~field.isin(list(value))
+    raise ValueError("Filter op '{op}' is not supported.".format(op=op))
+# --------------------------------------------------------------------------- #
+#                                  Store                                      #
+# --------------------------------------------------------------------------- #
+class Store:
+    """Hive partitioned Parquet store of listings by market, year and snapshot.
+
+    Parameters
+    ----------
+    directory : str (Optional)
+        The root of the store. Defaults to 'data/processed/listings' in the
+        project directory.
+    row_group_size : int
+        The number of rows per row group. Smaller row groups allow finer
+        skipping at the cost of more statistics.
+
+    """
+
+    def __init__(self, directory=None, row_group_size=ROW_GROUP_SIZE):
+        if not HAS_PYARROW:
+            raise Exception("The partitioned store requires pyarrow.")
+        self._directory = directory or STORE_DIR
+        self._row_group_size = row_group_size
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def _partitioning(self):
+        return ds.partitioning(pyarrow.schema([('market', pyarrow.string()),
+                                               ('year', pyarrow.int32()),
+                                               ('snapshot', pyarrow.string())]),
+                               flavor='hive')
+
+    def partition(self, market, snapshot):
+        """Returns the directory of a market and snapshot."""
+        return os.path.join(self._directory, "market=" + market,
+                            "year=" + snapshot[:4], "snapshot=" + snapshot)
+
+    def write(self, df, market, snapshot, sort_by=None):
+        """Writes a snapshot of a market, replacing any previous version.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The listings of the snapshot, without partition columns.
+        market : str
+            The market, e.g. 'san-francisco'.
+        snapshot : str
+            The snapshot date, 'YYYY-MM-DD'.
+        sort_by : str or list (Optional)
+            Columns by which rows are sorted before writing. Sorting on a
+            commonly filtered column narrows the min/max range of each row
+            group, so that more row groups are skipped.
+
+        """
+        df = df.drop(columns=[c for c in PARTITIONS if c in df.columns])
+        if sort_by:
+            df = df.sort_values(sort_by, kind='mergesort')
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        directory = self.partition(market, snapshot)
+        parent = os.path.dirname(directory)
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=parent, prefix=".tmp")
+        try:
+            pq.write_table(table, os.path.join(tmp, "part-0.parquet"),
+                           row_group_size=self._row_group_size,
+                           write_statistics=True)
+            if os.path.exists(directory):
+                shutil.rmtree(directory)
+            os.replace(tmp, directory)
+        finally:
+            if os.path.exists(tmp):
+                shutil.rmtree(tmp)
+        return directory
+
+    def write_dataset(self, dataset, market=None, sort_by=None):
+        """Writes each snapshot of a loaded DataSet.
+
+        A DataSet loaded from a directory is split on its 'snapshot'
+        column. Otherwise the snapshot is taken from the source filename.
+        The market defaults to the name of the DataSet.
+
+        """
+        market = market or dataset.name
+        df = dataset.get_data()
+        if 'snapshot' not in df.columns:
+            return [self.write(df, market, snapshot_of(dataset.source), sort_by)]
+        return [self.write(frame, market, str(snapshot), sort_by)
+                for snapshot, frame in df.groupby('snapshot', observed=True,
+                                                  sort=False)]
+
+    def _dataset(self):
+        """Returns the dataset of the store.
+
+        A dataset otherwise takes its schema from its first file, so the
+        schemas of all files are unified, and columns added in later
+        snapshot vintages read as null in earlier ones.
+
+        """
+        dataset = ds.dataset(self._directory, format='parquet',
+                             partitioning=self._partitioning(),
+                             exclude_invalid_files=True)
+        schemas = [fragment.physical_schema
+                   for fragment in dataset.get_fragments()]
+        if len(schemas) < 2:
+            return dataset
+        schema = pyarrow.unify_schemas([dataset.schema] + schemas,
+                                       promote_options='permissive')
+        return ds.dataset(self._directory, schema=schema, format='parquet',
+                          partitioning=self._partitioning(),
+                          exclude_invalid_files=True)
+
+    def markets(self):
+        """Returns the markets in the store."""
+        if not os.path.isdir(self._directory):
+            return []
+        return sorted(d.split("=", 1)[1] for d in os.listdir(self._directory)
+                      if d.startswith("market="))
+
+    def plan(self, filters=None):
+        """Returns the files and row groups a read with filters would scan.
+
+        Returns
+        -------
+        list of (path, row_groups) tuples, where row_groups are the indices
+        of the row groups whose statistics may match the filters.
+
+        """
+        if not os.path.isdir(self._directory):
+            return []
+        expression = to_expression(filters)
+        dataset = self._dataset()
+        plan = []
+        for fragment in dataset.get_fragments(filter=expression):
+            groups = fragment.split_by_row_group(expression, schema=dataset.schema)
+            plan.append((fragment.path, [g.row_groups[0].id for g in groups]))
+        return [(path, groups) for path, groups in plan if groups]
+
+    def read(self, filters=None, columns=None):
+        """Reads the rows matching filters as a DataFrame.
+
+        Parameters
+        ----------
+        filters : list (Optional)
+            Predicates on any column, including market, year and snapshot.
+        columns : list (Optional)
+            The columns to read. Partition columns may be included.
+
+        """
+        if not os.path.isdir(self._directory):
+            return pd.DataFrame(columns=columns)
+        table = self._dataset().to_table(columns=columns,
+                                         filter=to_expression(filters))
+        return table.to_pandas()
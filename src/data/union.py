@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : union.py                                                          #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 2:21:09 pm                     #
+# Last Modified : Saturday, October 17th 2026, 2:21:09 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Row-wise union of DataFrames from snapshots of differing layouts."""
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from .schema import conform
+
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+CSV_EXTENSIONS = ('.csv', '.csv.gz')
+
+def list_files(path):
+    """Returns the csv files in a directory tree in sorted order."""
+    return [os.path.join(directory, filename)
+            for directory, _, filenames in sorted(os.walk(path))
+            for filename in sorted(filenames)
+            if filename.endswith(CSV_EXTENSIONS)]
+
+def snapshot_of(path):
+    """Returns the snapshot date in a filename, or the filename."""
+    basename = os.path.basename(path)
+    match = DATE_PATTERN.search(basename)
+    return match.group(0) if match else basename.split(".")[0]
+
+def union_columns(frames):
+    """Returns the union of the columns of frames in order of appearance."""
+    columns = {}
+    for df in frames:
+        for column in df.columns:
+            columns.setdefault(column, None)
+    return list(columns.keys())
+
+def union_frames(frames, keys=None, key_name='snapshot', schema=None):
+    """Stacks DataFrames row-wise into a single DataFrame.
+
+    The columns of the frames are aligned on the union of their columns.
+    Columns absent from a frame are filled with missing values of the
+    target type in the schema. Categorical columns are recoded to the union
+    of their categories so that they remain categorical. The aligned
+    frames are then stacked by a single concatenation.
+
+    Parameters
+    ----------
+    frames : list of DataFrames
+        The frames to stack, in order.
+    keys : list (Optional)
+        A key for each frame, such as its snapshot date. If provided, the
+        keys are added as a categorical column named key_name.
+    key_name : str
+        The name of the key column.
+    schema : Schema (Optional)
+        Supplies the types of columns absent from some frames.
+
+    """
+    frames = list(frames)
+    if not frames:
+        return pd.DataFrame()
+    columns = union_columns(frames)
+    frames = [df if list(df.columns) == columns else conform(df, columns, schema)
+              for df in frames]
+    frames = _align_categories(frames, columns)
+    df = pd.concat(frames, axis=0, ignore_index=True, sort=False)
+    if keys is not None:
+        key_codes, categories = pd.factorize(pd.Index(keys))
+        codes = np.repeat(key_codes, [f.shape[0] for f in frames])
+        df.insert(0, key_name, pd.Categorical.from_codes(codes, categories))
+    return df
+
+def _align_categories(frames, columns):
+    """Sets categorical columns shared by frames to the union of categories."""
+    recast = [{} for _ in frames]
+    for column in columns:
+        dtypes = [df[column].dtype for df in frames]
+        categorical = [isinstance(d, pd.CategoricalDtype) for d in dtypes]
+        if not any(categorical):
+            continue
+        # Non-categorical columns can only be recast if they are all missing.
+        if not all(c or df[column].isna().all()
+                   for c, df in zip(categorical, frames)):
+            continue
+        categories = {}
+        for d, c in zip(dtypes, categorical):
+            if c:
+                for category in d.categories:
+                    categories.setdefault(category, None)
+        dtype = pd.CategoricalDtype(list(categories.keys()))
+        for i, df in enumerate(frames):
+            if df[column].dtype != dtype:
+                recast[i][column] = df[column].astype(dtype)
+    aligned = []
+    for df, columns in zip(frames, recast):
+        if columns:
+            df = df.copy(deep=False)
+            for column, series in columns.items():
+                df[column] = series
+        aligned.append(df)
+    return aligned
+# --------------------------------------------------------------------------- #
+#                               UnionView                                     #
+# --------------------------------------------------------------------------- #
+class UnionView:
+    """Lazy row-wise union of DataFrames.
+
+    The view holds references to the frames, never copies of them. Column
+    projections and row filters are recorded and applied frame by frame
+    when the view is iterated in chunks or materialized, so that only the
+    selected rows and columns are ever copied. Views of views flatten into
+    a single view of the underlying frames.
+
+    Parameters
+    ----------
+    frames : list of DataFrames or UnionViews
+        The frames to stack, in order.
+    schema : Schema (Optional)
+        Supplies the types of columns absent from some frames.
+
+    """
+
+    def __init__(self, frames=(), schema=None):
+        self._schema = schema
+        self._columns = None
+        self._frame = None
+        # Each part is a frame, the columns visible from it and its filters.
+        self._parts = []
+        for frame in frames:
+            if isinstance(frame, UnionView):
+                self._parts.extend(frame._parts_of_view())
+            else:
+                self._parts.append((frame, None, ()))
+
+    def _parts_of_view(self):
+        """Returns the parts with the projection of the view pushed down."""
+        if self._columns is None:
+            return list(self._parts)
+        return [(df, self._columns, filters) for df, _, filters in self._parts]
+
+    def _copy(self):
+        view = UnionView(schema=self._schema)
+        view._parts = list(self._parts)
+        view._columns = self._columns
+        return view
+
+    @property
+    def columns(self):
+        """The union of the columns of the frames, or the selected columns."""
+        if self._columns is not None:
+            return list(self._columns)
+        columns = {}
+        for df, own, _ in self._parts:
+            for column in (df.columns if own is None else own):
+                columns.setdefault(column, None)
+        return list(columns.keys())
+
+    @property
+    def dtypes(self):
+        """The types of the columns of the union, resolved column by column
+        from the types of the frames as union_frames would combine them,
+        without building the union."""
+        columns = self.columns
+        dtypes = [self._dtype(column) for column in columns]
+        return pd.Series(dtypes, index=columns, dtype=object)
+
+    def _fill_dtype(self, column):
+        """Returns the type of the missing values filling an absent column."""
+        if self._schema is not None and column in self._schema:
+            return self._schema[column].empty(0).dtype
+        return np.dtype('float64')
+
+    def _dtype(self, column):
+        present = []
+        for df, own, filters in self._parts:
+            if column in df.columns and (own is None or column in own):
+                present.append((df, filters))
+        dtypes = [df[column].dtype for df, _ in present]
+        if len(present) < len(self._parts):
+            dtypes.append(self._fill_dtype(column))
+        categorical = [isinstance(d, pd.CategoricalDtype) for d in dtypes]
+        if any(categorical):
+            # Non-categorical columns are recast only if they are all missing.
+            recast = all(isinstance(df[column].dtype, pd.CategoricalDtype) or
+                         df[column][self._mask(df, filters)].isna().all()
+                         for df, filters in present)
+            if recast:
+                categories = {}
+                for d in dtypes:
+                    if isinstance(d, pd.CategoricalDtype):
+                        for category in d.categories:
+                            categories.setdefault(category, None)
+                return pd.CategoricalDtype(list(categories.keys()))
+        return pd.concat([pd.Series([], dtype=d) for d in dtypes]).dtype
+
+    def __len__(self):
+        return sum(int(self._mask(df, filters).sum()) if filters else df.shape[0]
+                   for df, _, filters in self._parts)
+
+    def select(self, columns):
+        """Returns a view of the columns, in order. Columns absent from a
+        frame are filled with missing values."""
+        view = self._copy()
+        view._columns = list(columns)
+        return view
+
+    def where(self, condition):
+        """Returns a view of the rows satisfying a condition.
+
+        Parameters
+        ----------
+        condition : callable or str
+            A function of a DataFrame returning a boolean mask of its rows,
+            or an expression evaluated by DataFrame.eval. Conditions are
+            evaluated on each frame with its own columns.
+
+        """
+        view = self._copy()
+        view._parts = [(df, own, filters + (condition,))
+                       for df, own, filters in self._parts]
+        return view
+
+    @staticmethod
+    def _mask(df, filters):
+        mask = np.ones(df.shape[0], dtype=bool)
+        for condition in filters:
+            result = df.eval(condition) if isinstance(condition, str) \
+                else condition(df)
+            mask &= np.asarray(result, dtype=bool)
+        return mask
+
+    def _pieces(self):
+        """Yields the filtered rows of each frame and the selected columns
+        present in it."""
+        columns = self.columns
+        for df, own, filters in self._parts:
+            visible = [c for c in columns if c in df.columns and 
+                       (own is None or c in own)]
+            if filters:
+                yield df.loc[self._mask(df, filters), visible]
+            else:
+                yield df[visible]
+
+    def _union(self, frames):
+        return conform(union_frames(frames, schema=self._schema), self.columns,
+                       self._schema)
+
+    def iter_chunks(self, chunksize=None):
+        """Yields the filtered, projected rows frame by frame.
+
+        Parameters
+        ----------
+        chunksize : int (Optional)
+            The maximum number of rows per chunk. Frames larger than this
+            are yielded in slices.
+
+        """
+        columns = self.columns
+        for df in self._pieces():
+            if df.shape[1] < len(columns):
+                df = conform(df, columns, self._schema)
+            if chunksize is None:
+                yield df
+            else:
+                for start in range(0, df.shape[0], chunksize):
+                    yield df.iloc[start:start + chunksize]
+
+    def to_frame(self):
+        """Returns the view as a single DataFrame.
+
+        The frame is built on the first call only and is then reused. The
+        rows of filtered frames are copied out before the pieces are
+        stacked by union_frames, so both are held in memory while the
+        frame is built. Use iter_chunks to process the rows without
+        materializing them.
+
+        """
+        if self._frame is None:
+            self._frame = self._union(list(self._pieces()))
+        return self._frame
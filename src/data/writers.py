@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : writers.py                                                        #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 8:57:31 pm                     #
+# Last Modified : Saturday, October 17th 2026, 8:57:31 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Atomic writers of DataFrames in csv, compressed csv, Parquet and Feather.
+
+Each file is written to a temporary file in the target directory, then
+renamed over the target, so that readers never observe a partially
+written file. Columnar formats are compressed with zstd by default,
+which yields files several times smaller than csv and writes faster.
+"""
+import os
+import tempfile
+
+import pandas as pd
+
+EXTENSIONS = {'csv': '.csv', 'csv.gz': '.csv.gz', 'parquet': '.parquet',
+              'feather': '.feather'}
+COMPRESSION = {'csv': None, 'csv.gz': 'gzip', 'parquet': 'zstd',
+               'feather': 'zstd'}
+
+def format_of(path):
+    """Returns the format designated by the extension of a path, or None."""
+    for fmt in ('csv.gz', 'csv', 'parquet', 'feather'):
+        if path.endswith(EXTENSIONS[fmt]):
+            return fmt
+    return None
+
+def with_format(path, fmt):
+    """Replaces the extension of a path with the extension of a format."""
+    current = format_of(path)
+    if current is not None:
+        path = path[:-len(EXTENSIONS[current])]
+    return path + EXTENSIONS[fmt]
+
+def _default_index(df):
+    """Returns True if the index of a DataFrame is an unnamed RangeIndex
+    from 0 by 1, which columnar formats need not store."""
+    index = df.index
+    return isinstance(index, pd.RangeIndex) and index.name is None and \
+        index.start == 0 and index.step == 1
+
+def write(df, path, fmt=None, compression=None, level=None, index=True):
+    """Writes a DataFrame to path atomically.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The data to write.
+    path : str
+        The path of the file.
+    fmt : str (Optional)
+        'csv', 'csv.gz', 'parquet' or 'feather'. Defaults to the format of
+        the extension of path, or 'csv'.
+    compression : str (Optional)
+        The codec, e.g. 'zstd', 'snappy', 'gzip' or 'lz4'. Defaults to
+        'zstd' for Parquet and Feather, and 'gzip' for csv.gz.
+    level : int (Optional)
+        The compression level of the codec.
+    index : bool
+        If True, the index is written to csv files, as by pandas.to_csv.
+        Columnar formats keep a non-default index. Parquet restores it on
+        read, and Feather, which has no index, stores it as columns.
+
+    """
+    fmt = fmt or format_of(path) or 'csv'
+    if fmt not in EXTENSIONS:
+        raise ValueError("Format must be one of {formats}.".format(
+            formats=list(EXTENSIONS.keys())))
+    compression = compression or COMPRESSION[fmt]
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        if fmt in ('csv', 'csv.gz'):
+            if compression:
+                options = {'method': compression}
+                if level is not None:
+                    options['compresslevel'] = level
+                compression = options
+            df.to_csv(tmp, index=index, compression=compression)
+        elif fmt == 'parquet':
+            df.to_parquet(tmp, compression=compression, compression_level=level)
+        else:
+            df = df.reset_index(drop=_default_index(df))
+            df.to_feather(tmp, compression=compression, compression_level=level)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : fingerprint.py                                                    #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 8:20:14 pm                     #
+# Last Modified : Saturday, October 17th 2026, 8:20:14 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Content fingerprints of DataFrames and files used to key cached results."""
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+def fingerprint(df):
+    """Returns a hex digest of the columns, dtypes and content of a DataFrame.
+
+    The content is hashed row by row with vectorized 64-bit hashes, which
+    are then digested together with the index, so that any change to a
+    value, a column, a dtype or the order of rows changes the fingerprint.
+
+    """
+    h = hashlib.sha1()
+    h.update(json.dumps([[str(c), str(d)] for c, d in df.dtypes.items()]).encode())
+    h.update(str(df.shape).encode())
+    if df.shape[0] and df.shape[1]:
+        h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    elif df.shape[0]:
+        h.update(pd.util.hash_pandas_object(df.index).values.tobytes())
+    return h.hexdigest()
+
+def file_fingerprint(paths):
+    """Returns a hex digest of the paths, sizes and modification times of files."""
+    h = hashlib.sha1()
+    for path in paths:
+        stat = os.stat(path)
+        h.update("{path}|{size}|{mtime}".format(path=os.path.abspath(path),
+                                               size=stat.st_size,
+                                               mtime=stat.st_mtime_ns).encode())
+    return h.hexdigest()
+
+def spec_key(*parts):
+    """Returns a hex digest of json serializable parts, e.g. arguments."""
+    content = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : memo.py                                                           #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 10:31:47 pm                    #
+# Last Modified : Saturday, October 17th 2026, 10:31:47 pm                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Memoization of results keyed by data fingerprints and arguments.
+
+Results are held in an in-memory LRU and, if a directory is designated,
+persisted as files so that they survive across sessions. Keys are
+digests of the fingerprint of the data and the arguments of the call,
+so a result is reused only for unchanged data.
+"""
+from collections import OrderedDict
+import copy
+import os
+from pathlib import Path
+import threading
+
+from .fingerprint import spec_key
+from .persistence import Persistence
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+MEMO_DIR = os.path.join(PROJECT_DIR, "data", "interim", "memo")
+# --------------------------------------------------------------------------- #
+#                                  Memo                                       #
+# --------------------------------------------------------------------------- #
+class Memo:
+    """In-memory LRU of results with an optional on-disk store.
+
+    Parameters
+    ----------
+    maxsize : int
+        The number of results kept in memory.
+    directory : str (Optional)
+        The directory of the on-disk store. If None, results are kept in
+        memory only. See MEMO_DIR for the default directory of the project.
+    persistence : Persistence (Optional)
+        Serializes results to the on-disk store.
+
+    """
+
+    def __init__(self, maxsize=128, directory=None, persistence=None):
+        self._maxsize = maxsize
+        self._directory = directory
+        self._persistence = persistence or Persistence()
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # A Memo shipped to a worker process shares the on-disk store, but
+        # not the results in memory or the lock, which cannot be pickled.
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_results'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def __len__(self):
+        return len(self._results)
+
+    def key(self, *parts):
+        """Returns the key of a fingerprint and the arguments of a call."""
+        return spec_key(*parts)
+
+    def _path(self, key):
+        return os.path.join(self._directory, key + ".pkl")
+
+    def get(self, key, default=None):
+        """Returns a copy of the result for a key, or default."""
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._results[key])
+        if self._directory and os.path.exists(self._path(key)):
+            try:
+                result = self._persistence.deserialize(self._path(key))
+            except Exception as e:
+                print(e)
+            else:
+                self._remember(key, result)
+                with self._lock:
+                    self.hits += 1
+                return copy.deepcopy(result)
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key, result):
+        """Stores a copy of a result under a key."""
+        result = copy.deepcopy(result)
+        self._remember(key, result)
+        if self._directory:
+            self._persistence.serialize(result, self._path(key))
+
+    def _remember(self, key, result):
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+
+    def __call__(self, func, *parts):
+        """Returns the result of func for the key of parts, calling func
+        only if no result is stored."""
+        key = self.key(*parts)
+        missing = object()
+        result = self.get(key, missing)
+        if result is missing:
+            result = func()
+            self.put(key, result)
+        return result
+
+    def clear(self, disk=False):
+        """Removes the results in memory and, if disk is True, on disk."""
+        with self._lock:
+            self._results = OrderedDict()
+        if disk and self._directory and os.path.isdir(self._directory):
+            for filename in os.listdir(self._directory):
+                if filename.endswith(".pkl"):
+                    os.remove(os.path.join(self._directory, filename))
+
+MEMO = Memo()
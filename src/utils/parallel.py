@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : parallel.py                                                       #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 12:14:36 pm                    #
+# Last Modified : Saturday, October 17th 2026, 12:14:36 pm                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Utilities for running independent tasks in a pool of workers."""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import as_completed
+import os
+
+def n_workers(n_jobs):
+    """Returns the number of workers designated by n_jobs.
+
+    None or 1 designates serial execution. Negative values count back from
+    the number of cpus, so that -1 uses all cpus.
+
+    """
+    if not n_jobs:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+def run(fn, tasks, n_jobs=None, executor=None, threads=False, callback=None):
+    """Applies fn to each tuple of arguments in tasks.
+
+    Parameters
+    ----------
+    fn : callable
+        The function to apply. For process pools, it must be defined at
+        module level.
+    tasks : list of tuples
+        The positional arguments for each call.
+    n_jobs : int (Optional)
+        The number of workers. See n_workers.
+    executor : concurrent.futures.Executor (Optional)
+        An executor to which the tasks are submitted. It is not shut down.
+    threads : bool
+        If True, a thread pool rather than a process pool is created.
+    callback : callable (Optional)
+        Called in the calling process with the position of each task, its
+        result and its error, as each task completes.
+
+    Returns
+    -------
+    list of (result, error) tuples in the order of tasks. The error is the
+    exception raised by the task, or None.
+
+    """
+    tasks = list(tasks)
+    workers = n_workers(n_jobs)
+    if executor is None and (workers == 1 or len(tasks) < 2):
+        results = []
+        for i, args in enumerate(tasks):
+            results.append(_call(fn, args))
+            if callback is not None:
+                callback(i, *results[-1])
+        return results
+    if executor is not None:
+        return _gather(executor, fn, tasks, callback)
+    pool = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with pool(max_workers=min(workers, len(tasks))) as executor:
+        return _gather(executor, fn, tasks, callback)
+
+def _call(fn, args):
+    try:
+        return fn(*args), None
+    except Exception as e:
+        return None, e
+
+def _gather(executor, fn, tasks, callback=None):
+    futures = {executor.submit(fn, *args): i for i, args in enumerate(tasks)}
+    results = [None] * len(tasks)
+    for future in as_completed(futures):
+        i = futures[future]
+        try:
+            results[i] = (future.result(), None)
+        except Exception as e:
+            results[i] = (None, e)
+        if callback is not None:
+            callback(i, *results[i])
+    return results
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_missing.py                                                   #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 10:12:05 pm                    #
+# Last Modified : Saturday, October 17th 2026, 10:12:05 pm                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the missing value profiler."""
+import numpy as np
+import pandas as pd
+from pytest import mark
+from ...conftest import make_listings
+from ...src.analysis.missing import MissingnessProfile
+from ...src.data.listings import DataGroup, DataSet
+# --------------------------------------------------------------------------- #
+#                         Test MissingnessProfile                             #
+# --------------------------------------------------------------------------- #
+class MissingnessTests:
+    """Tests MissingnessProfile class"""
+
+    @mark.analysis
+    @mark.missing
+    def test_profile(self):
+        df = make_listings(n=300)
+        isna = df.isna()
+        profile = MissingnessProfile().update(df)
+        assert (profile.column_rates() == isna.mean()).all(), \
+            "Column rates differ from isna().mean()"
+        by_row = isna.sum(axis=1) / df.shape[1]
+        expected = [by_row.between(left, right).sum() for left, right in
+                    [(0, 0), (0.0001, 0.1), (0.101, 0.25), (0.251, 1)]]
+        assert profile.row_buckets() == expected, "Row buckets differ"
+        comissing = isna.astype(int).T.dot(isna.astype(int))
+        assert (profile.comissingness() == comissing).all().all(), \
+            "Co-missingness differs from the product of the bitmap"
+        patterns = profile.pattern_frequencies()
+        assert patterns['Count'].sum() == df.shape[0], "Pattern counts differ"
+        expected = isna.value_counts()
+        top = patterns.iloc[0]
+        assert top['Count'] == expected.iloc[0], "Most frequent pattern differs"
+        assert tuple(top[df.columns]) == expected.index[0], \
+            "Most frequent pattern differs"
+
+    @mark.analysis
+    @mark.missing
+    def test_chunks_and_merge(self):
+        df = make_listings(n=300)
+        whole = MissingnessProfile().update(df)
+        chunked = MissingnessProfile()
+        for start in range(0, 300, 70):
+            chunked.update(df.iloc[start:start + 70])
+        merged = MissingnessProfile().update(df.iloc[:100]).merge(
+            MissingnessProfile().update(df.iloc[100:]))
+        for profile in (chunked, merged):
+            assert profile.summary() == whole.summary(), "Summaries differ"
+            assert (profile.comissingness() == whole.comissingness()).all().all(), \
+                "Co-missingness differs"
+            assert profile.pattern_frequencies().equals(
+                whole.pattern_frequencies()), "Patterns differ"
+
+    @mark.analysis
+    @mark.missing
+    def test_merge_columns(self):
+        df = make_listings(n=200)
+        first = df.drop(columns=['weekly_price'])
+        stacked = pd.concat([first.iloc[:100], df.iloc[100:]], sort=False)
+        expected = MissingnessProfile(columns=df.columns).update(stacked)
+        merged = MissingnessProfile().update(first.iloc[:100]).merge(
+            MissingnessProfile().update(df.iloc[100:]))
+        merged = merged._aligned(list(df.columns))
+        assert merged.summary() == expected.summary(), "Summaries differ"
+        assert (merged.comissingness() == expected.comissingness()).all().all(), \
+            "Co-missingness differs after merging columns"
+        assert np.array_equal(merged.row_rates().values,
+                              expected.row_rates().values), "Row rates differ"
+
+    @mark.analysis
+    @mark.missing
+    def test_datagroup(self):
+        group = DataGroup(name='missing')
+        df = make_listings(n=200)
+        group.add_dataset(DataSet.from_dataframe(df.iloc[:120], 'a'))
+        group.add_dataset(DataSet.from_dataframe(df.iloc[120:], 'b'))
+        profile = group.missingness()
+        assert profile.rows == 200, "Merged profile is missing rows"
+        assert profile.summary() == MissingnessProfile().update(df).summary(), \
+            "DataGroup profile differs from the stacked profile"
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_normality.py                                                 #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 11:58:51 pm                    #
+# Last Modified : Saturday, October 17th 2026, 11:58:51 pm                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the normality test engine."""
+import numpy as np
+import pandas as pd
+from pytest import mark, raises
+from scipy.stats import jarque_bera, normaltest, shapiro
+from ...src.analysis.normality import NormalityEngine
+# --------------------------------------------------------------------------- #
+#                          Test NormalityEngine                               #
+# --------------------------------------------------------------------------- #
+class NormalityEngineTests:
+    """Tests NormalityEngine class"""
+
+    @mark.analysis
+    @mark.normality
+    def test_tests(self):
+        rng = np.random.RandomState(2)
+        df = pd.DataFrame({'normal': rng.normal(size=800),
+                           'lognormal': rng.lognormal(size=800)})
+        df.loc[::10, 'normal'] = np.nan
+        engine = NormalityEngine(tests=['shapiro', 'dagostino', 'anderson',
+                                        'jarque_bera'])
+        pvalues = engine.test(df)
+        values = df['normal'].dropna()
+        assert np.isclose(pvalues.loc['normal', 'Shapiro p-value'],
+                          shapiro(values)[1]), "Shapiro p-value differs"
+        assert np.isclose(pvalues.loc['normal', "D'Agostino p-value"],
+                          normaltest(values)[1]), "D'Agostino p-value differs"
+        assert np.isclose(pvalues.loc['normal', 'Jarque-Bera p-value'],
+                          jarque_bera(values)[1]), "Jarque-Bera p-value differs"
+        assert pvalues.loc['normal', 'Anderson p-value'] > 0.05, \
+            "Normal data rejected by the Anderson test"
+        assert (pvalues.loc['lognormal'] < 0.001).all(), \
+            "Lognormal data not rejected"
+        assert list(engine.timing.index) == engine.tests, "Timing not per test"
+        with raises(ValueError):
+            NormalityEngine(tests=['kolmogorov'])
+
+    @mark.analysis
+    @mark.normality
+    def test_subsample(self):
+        rng = np.random.RandomState(4)
+        df = pd.DataFrame(rng.normal(size=(12000, 3)), columns=['a', 'b', 'c'])
+        engine = NormalityEngine(max_n=5000, seed=7)
+        first = engine.test(df)
+        assert engine.timing['Values'].iloc[0] == 15000, "Columns not capped"
+        assert first.equals(NormalityEngine(max_n=5000, seed=7).test(df)), \
+            "Seeded subsamples differ"
+        parallel = NormalityEngine(max_n=5000, seed=7, n_jobs=2).test(df)
+        pd.testing.assert_frame_equal(parallel, first)
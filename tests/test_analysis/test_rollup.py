@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_rollup.py                                                    #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 1:31:02 am                       #
+# Last Modified : Sunday, October 18th 2026, 1:31:02 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests mergeable summaries and their roll-up."""
+import pickle
+
+import numpy as np
+import pandas as pd
+from pytest import mark
+from ...conftest import make_listings
+from ...src.analysis.rollup import QuantileSketch, QuantSummary, tree_reduce
+from ...src.analysis.univariate import DescribeQuant, QuantAccumulator
+from ...src.data.listings import DataGroup, DataSet
+# --------------------------------------------------------------------------- #
+#                              Test Roll-up                                   #
+# --------------------------------------------------------------------------- #
+class RollupTests:
+    """Tests QuantileSketch, QuantSummary and tree reduction"""
+
+    @mark.analysis
+    @mark.rollup
+    def test_tree_reduce(self):
+        assert tree_reduce([], lambda a, b: a + b) is None, "Empty not None"
+        assert tree_reduce(range(7), lambda a, b: a + b) == 21, "Sum differs"
+        assert tree_reduce(['a', 'b', 'c'], lambda a, b: a + b) == 'abc', \
+            "Order not preserved"
+
+    @mark.analysis
+    @mark.rollup
+    def test_quantile_sketch(self):
+        rng = np.random.RandomState(0)
+        x = rng.lognormal(size=100000)
+        small = QuantileSketch().update(x[:500])
+        assert small.exact, "Small sketch compressed"
+        assert np.allclose(small.quantile([0.1, 0.5, 0.9]),
+                           np.percentile(x[:500], [10, 50, 90])), \
+            "Exact quantiles differ"
+        sketches = [QuantileSketch().update(part) for part in np.split(x, 20)]
+        sketch = tree_reduce(sketches)
+        assert sketch.count == len(x), "Count differs"
+        q = np.array([0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99])
+        ranks = np.searchsorted(np.sort(x), sketch.quantile(q)) / len(x)
+        assert np.abs(ranks - q).max() < 0.005, "Quantile rank error too large"
+        restored = pickle.loads(pickle.dumps(sketch))
+        assert np.array_equal(restored.quantile(q), sketch.quantile(q)), \
+            "Sketch not serializable"
+
+    @mark.analysis
+    @mark.rollup
+    def test_quant_summary(self):
+        df = make_listings(n=1500)
+        exact = DescribeQuant().describe(df)
+        parts = [QuantSummary().update(df.iloc[i:i + 300])
+                 for i in range(0, 1500, 300)]
+        summary = tree_reduce(parts)
+        description = summary.describe()
+        assert list(description.index) == list(exact.index), "Columns differ"
+        for column in ['count', 'mean', 'std', 'min', '50%', 'max', 
+                       '# Missing', '% Missing']:
+            assert np.allclose(description[column].astype(float), 
+                               exact[column].astype(float), equal_nan=True), \
+                "{c} differs".format(c=column)
+        assert np.allclose(description['skew'], exact['skew'], equal_nan=True), \
+            "Skew differs"
+
+    @mark.analysis
+    @mark.rollup
+    def test_quant_accumulator_merge(self):
+        df = make_listings(n=1500)
+        whole = QuantAccumulator(seed=0).update(df).describe()
+        parts = [QuantAccumulator(seed=i).update(df.iloc[i:i + 500])
+                 for i in range(0, 1500, 500)]
+        # Reservoirs smaller than the data are merged into a sample.
+        small = tree_reduce([QuantAccumulator(reservoir_size=100, seed=i).update(
+            df.iloc[i:i + 500]) for i in range(0, 1500, 500)])
+        pd.testing.assert_frame_equal(tree_reduce(parts).describe(), whole)
+        assert all(len(store[1]) <= 100 for store in small._stores.values()), \
+            "Merged reservoir exceeds its size"
+        assert isinstance(QuantSummary().merge(QuantSummary()), QuantSummary), \
+            "Merge changed the class of the summary"
+
+    @mark.analysis
+    @mark.rollup
+    def test_datagroup(self):
+        df = make_listings(n=1000)
+        group = DataGroup(name='rollup')
+        group.add_dataset(DataSet.from_dataframe(df.iloc[:400], 'a'))
+        group.add_dataset(DataSet.from_dataframe(df.iloc[400:700], 'b'))
+        group.add_dataset(DataSet.from_dataframe(df.iloc[700:], 'c'))
+        merged = group.statistics().describe()
+        whole = DataSet.from_dataframe(df, 'd').statistics().describe()
+        pd.testing.assert_frame_equal(merged, whole, check_exact=False)
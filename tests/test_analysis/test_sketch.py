@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_sketch.py                                                    #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 12:40:12 am                      #
+# Last Modified : Sunday, October 18th 2026, 12:40:12 am                      #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests approximate sketches of qualitative variables."""
+import pickle
+
+import numpy as np
+import pandas as pd
+from pytest import mark
+from ...conftest import make_listings
+from ...src.analysis.sketch import HyperLogLog, MisraGries
+from ...src.analysis.univariate import DescribeQual
+from ...src.data.listings import DataGroup, DataSet
+# --------------------------------------------------------------------------- #
+#                              Test Sketches                                  #
+# --------------------------------------------------------------------------- #
+class SketchTests:
+    """Tests HyperLogLog, MisraGries and QualSketch classes"""
+
+    @mark.analysis
+    @mark.sketch
+    def test_hyperloglog(self):
+        values = pd.Series(["listing %d" % i for i in range(50000)])
+        hll = HyperLogLog(error=0.01)
+        for start in range(0, 50000, 8000):
+            hll.update(values.iloc[start:start + 8000])
+        assert abs(hll.estimate() - 50000) < 50000 * 3 * hll.error, \
+            "Distinct count estimate outside three standard errors"
+        small = HyperLogLog().update(values.iloc[:100].tolist() * 3)
+        assert abs(small.estimate() - 100) <= 2, "Small cardinality inaccurate"
+        halves = HyperLogLog().update(values.iloc[:30000]).merge(
+            HyperLogLog().update(values.iloc[20000:]))
+        assert halves.estimate() == hll.estimate(), "Merged estimate differs"
+        restored = pickle.loads(pickle.dumps(hll))
+        assert restored.estimate() == hll.estimate(), "Sketch not serializable"
+
+    @mark.analysis
+    @mark.sketch
+    def test_misra_gries(self):
+        rng = np.random.RandomState(0)
+        values = pd.Series(rng.zipf(1.5, 40000).astype(str))
+        truth = values.value_counts()
+        sketch = MisraGries(error=0.01)
+        for start in range(0, 40000, 5000):
+            sketch.update(values.iloc[start:start + 5000])
+        assert len(sketch.top()) <= sketch.k, "Counters exceed k"
+        assert sketch.bound <= 40000 / (sketch.k + 1), "Error bound exceeded"
+        top = sketch.top(3)
+        assert list(top.index) == list(truth.index[:3]), "Top values differ"
+        for value, count in top.items():
+            assert truth[value] - sketch.bound <= count <= truth[value], \
+                "Frequency outside its error bound"
+        # Blocks smaller than the chunks hold no more than k counters.
+        blocked = MisraGries(error=0.01, block_size=250)
+        for start in range(0, 40000, 5000):
+            blocked.update(values.iloc[start:start + 5000])
+            assert len(blocked.top()) <= blocked.k, "Counters exceed k"
+        assert blocked.n == 40000, "Values not counted"
+        assert blocked.bound <= 40000 / (blocked.k + 1), "Error bound exceeded"
+        assert list(blocked.top(3).index) == list(truth.index[:3]), \
+            "Top values differ"
+
+    @mark.analysis
+    @mark.sketch
+    def test_describe_qual(self):
+        df = make_listings(n=2000)
+        exact = DescribeQual().describe(df)
+        approximate = DescribeQual(approximate=True).describe(df)
+        assert list(approximate.index) == list(exact.index), "Columns differ"
+        assert (approximate['count'] == exact['count']).all(), "Counts differ"
+        heavy = exact['freq'] > 0.05 * exact['count']
+        assert (approximate['top'][heavy] == exact['top'][heavy]).all(), \
+            "Top values differ"
+        assert (approximate['freq'][heavy] == exact['freq'][heavy]).all(), \
+            "Frequencies of top values differ"
+        assert np.allclose(approximate['unique'].astype(float),
+                           exact['unique'].astype(float), rtol=0.05), \
+            "Distinct counts outside tolerance"
+
+    @mark.analysis
+    @mark.sketch
+    def test_datagroup(self):
+        df = make_listings(n=1000)
+        group = DataGroup(name='sketch')
+        group.add_dataset(DataSet.from_dataframe(df.iloc[:600], 'a'))
+        group.add_dataset(DataSet.from_dataframe(df.iloc[600:], 'b'))
+        merged = group.sketch().describe()
+        whole = DataSet.from_dataframe(df, 'c').sketch().describe()
+        pd.testing.assert_frame_equal(merged, whole)
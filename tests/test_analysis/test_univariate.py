@@ -19,8 +19,13 @@
 # Copyright (c) 2020 DecisionScients                                          #
 # =========================================================================== #
 """Tests Univariate Analysis Modules."""
+import numpy as np
+import pandas as pd
 from pytest import mark
+from scipy.stats import kurtosistest, skewtest
+from ...src.analysis.normality import NormalityEngine
 from ...src.analysis.univariate import DescribeQuant, DescribeQual
+from ...src.analysis.univariate import PERCENTILES, moments, merge_moments
 # --------------------------------------------------------------------------- #
 #                             Test DataSet                                    #
 # --------------------------------------------------------------------------- #
@@ -41,4 +46,64 @@ class DescribeTests:
         ds = get_dataset
         data = ds.get_data()
         d = DescribeQual()
-        print(d.describe(data))        
\ No newline at end of file
+        print(d.describe(data))
+
+    @mark.analysis
+    @mark.analysis_univariate
+    def test_merge_moments(self):
+        rng = np.random.RandomState(5)
+        x = rng.lognormal(size=(1000, 3))
+        x[rng.rand(1000, 3) < 0.1] = np.nan
+        expected = moments(x)
+        merged = moments(x[:10])
+        for start in range(10, 1000, 333):
+            merged = merge_moments(merged, moments(x[start:start + 333]))
+        for e, m in zip(expected, merged):
+            assert np.allclose(e, m), "Merged moments differ from one pass"
+
+    @mark.analysis
+    @mark.analysis_univariate
+    def test_describe_chunks(self):
+        rng = np.random.RandomState(5)
+        df = pd.DataFrame({'a': rng.normal(size=300), 'b': rng.poisson(3, 300),
+                           'c': rng.choice(['x', 'y', 'z'], 300)})
+        df.loc[::7, 'a'] = np.nan
+        chunks = [df.iloc[i:i + 64] for i in range(0, 300, 64)]
+        quant = DescribeQuant().describe_chunks(chunks)
+        expected = DescribeQuant().describe(df)[quant.columns]
+        pd.testing.assert_frame_equal(quant, expected, check_dtype=False)
+        qual = DescribeQual().describe_chunks(chunks)
+        assert qual.loc['c', 'count'] == 300, "Qualitative count incorrect"
+        assert qual.loc['c', 'unique'] == 3, "Qualitative unique incorrect"
+
+    @mark.analysis
+    @mark.analysis_univariate
+    def test_describe_quant_fused(self):
+        rng = np.random.RandomState(3)
+        df = pd.DataFrame({'a': rng.normal(size=400), 'b': rng.lognormal(size=400),
+                           'c': rng.randint(0, 9, 400), 'd': np.ones(400),
+                           'e': np.nan})
+        df.loc[::9, 'b'] = np.nan
+        description = DescribeQuant().describe(df)
+        expected = df.describe(percentiles=PERCENTILES).round(2).T
+        pd.testing.assert_frame_equal(description[expected.columns], expected,
+                                      check_dtype=False)
+        assert (description['# Missing'] == df.isnull().sum()).all(), \
+            "Missing counts incorrect"
+        assert np.allclose(description['Kurtosis'], df.kurtosis(), equal_nan=True), \
+            "Kurtosis differs from pandas"
+        assert np.allclose(description['skew'], df.skew(), equal_nan=True), \
+            "Skew differs from pandas"
+        for column in ['a', 'c']:
+            assert np.isclose(description.loc[column, 'Skew p-value'],
+                              skewtest(df[column])[1]), "Skew test differs"
+            assert np.isclose(description.loc[column, 'Kurtosis p-value'],
+                              kurtosistest(df[column])[1]), "Kurtosis test differs"
+        assert np.isclose(description.loc['b', 'Skew p-value'],
+                          skewtest(df['b'].dropna())[1]), \
+            "Missing values were not dropped from the skew test"
+        propagated = DescribeQuant(NormalityEngine(dropna=False)).describe(df)
+        assert np.isnan(propagated.loc['b', 'Skew p-value']), \
+            "Missing values did not propagate into the skew test"
+        assert np.isnan(propagated.loc['b', 'Shapiro p-value']), \
+            "Missing values did not propagate into the Shapiro test"
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_cache.py                                                     #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 9:40:27 am                     #
+# Last Modified : Saturday, October 17th 2026, 9:40:27 am                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the columnar cache."""
+import os
+import shutil
+
+import pandas as pd
+from pytest import mark
+from ...src.data.cache import CACHE_ENV, ColumnarCache, default_cache_dir
+from ...src.data.listings import DataSet
+# --------------------------------------------------------------------------- #
+#                             Test ColumnarCache                              #
+# --------------------------------------------------------------------------- #
+class ColumnarCacheTests:
+    """Tests ColumnarCache Class"""
+
+    @mark.data
+    @mark.cache
+    def test_cache_write_read(self, get_listings_file, tmp_path):
+        cache = ColumnarCache(directory=str(tmp_path))
+        assert cache.read(get_listings_file) is None, "Empty cache returned data"
+        df = pd.read_csv(get_listings_file, low_memory=False)
+        path = cache.write(get_listings_file, df)
+        assert os.path.exists(path), "Columnar copy not written"
+        assert cache.isfresh(get_listings_file), "Entry not fresh after write"
+        pd.testing.assert_frame_equal(cache.read(get_listings_file), df)
+        df2 = cache.read(get_listings_file, columns=['id', 'price'])
+        assert list(df2.columns) == ['id', 'price'], "Column projection failed"
+
+    @mark.data
+    @mark.cache
+    @mark.parametrize("fmt", ['parquet', 'feather'])
+    def test_cache_invalidation(self, get_listings_file, tmp_path, fmt):
+        source = os.path.join(str(tmp_path), os.path.basename(get_listings_file))
+        shutil.copy(get_listings_file, source)
+        cache = ColumnarCache(directory=os.path.join(str(tmp_path), "cache"), fmt=fmt)
+        cache.write(source, pd.read_csv(source, low_memory=False))
+        # Touching the file keeps the entry since the content is unchanged.
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.isfresh(source), "Touched file invalidated the entry"
+        # Changing the content invalidates the entry.
+        pd.read_csv(source).head(10).to_csv(source, index=False)
+        assert not cache.isfresh(source), "Modified file not invalidated"
+        assert cache.read(source) is None, "Stale entry returned data"
+
+    @mark.data
+    @mark.cache
+    def test_dataset_load_uses_cache(self, get_listings_file, tmp_path):
+        cache = ColumnarCache(directory=str(tmp_path))
+        ds = DataSet(get_listings_file, cache=cache)
+        ds.load()
+        assert cache.isfresh(get_listings_file), "Load did not populate the cache"
+        ds2 = DataSet(get_listings_file, cache=cache)
+        ds2.load()
+        pd.testing.assert_frame_equal(ds.get_data(), ds2.get_data())
+        ds3 = DataSet(get_listings_file, cache=False)
+        assert ds3.cache is None, "Cache not disabled"
+
+    @mark.data
+    @mark.cache
+    def test_cache_eviction(self, get_listings_file, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_ENV, str(tmp_path))
+        assert default_cache_dir() == str(tmp_path), "Environment not honored"
+        assert ColumnarCache().directory == str(tmp_path), "Default not honored"
+        sources = []
+        for name in ['a', 'b', 'c']:
+            source = os.path.join(str(tmp_path), name + ".csv.gz")
+            shutil.copy(get_listings_file, source)
+            sources.append(source)
+        df = pd.read_csv(get_listings_file, low_memory=False)
+        directory = os.path.join(str(tmp_path), "cache")
+        cache = ColumnarCache(directory)
+        for source in sources:
+            cache.write(source, df)
+        os.remove(sources[0])
+        kept = ColumnarCache(directory, max_bytes=1, max_age=0, eviction=False)
+        assert kept.evict() == 0 and kept.manifest(sources[1]) is not None, \
+            "Entries evicted with eviction disabled"
+        assert cache.evict() == 1, "Entry of a removed source not evicted"
+        assert not cache.isfresh(sources[0]) and cache.isfresh(sources[1]), \
+            "Wrong entry evicted"
+        size = os.path.getsize(cache.path(sources[1]))
+        # Reading b marks it as used after c, so c is the least recently used.
+        os.utime(cache.path(sources[2]), (1, 1))
+        cache.read(sources[1])
+        small = ColumnarCache(directory, max_bytes=size)
+        assert small.evict() == 1, "Cache not reduced to its size limit"
+        assert small.isfresh(sources[1]) and not small.isfresh(sources[2]), \
+            "Least recently used entry not evicted"
+        os.utime(small.path(sources[1]), (1, 1))
+        assert ColumnarCache(directory, max_age=3600).evict() == 1, \
+            "Expired entry not evicted"
+        assert not [f for f in os.listdir(directory) if f.endswith('.json')], \
+            "Manifests left behind"
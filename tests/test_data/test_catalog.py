@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_catalog.py                                                   #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 4:40:02 pm                     #
+# Last Modified : Saturday, October 17th 2026, 4:40:02 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the catalog of Inside Airbnb files."""
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import os
+import threading
+
+from pytest import fixture, mark
+from ...src.data.catalog import Catalog, parse_catalog, parse_url
+
+HOST = "http://data.insideairbnb.com"
+CITIES = [('united-states', 'ca', 'san-francisco'),
+          ('united-states', 'ny', 'new-york-city'),
+          ('spain', 'catalonia', 'barcelona')]
+DATES = ['2017-06-02', '2018-05-09', '2019-11-01', '2019-12-04']
+FILES = ['data/listings.csv.gz', 'data/reviews.csv.gz',
+         'visualisations/listings.csv', 'visualisations/neighbourhoods.geojson']
+
+def make_page(dates=DATES):
+    rows = ["<tr><td><a href='{host}/{c}/{r}/{city}/{d}/{f}'>{f}</a></td></tr>"
+            .format(host=HOST, c=c, r=r, city=city, d=d, f=f)
+            for c, r, city in CITIES for d in dates for f in FILES]
+    return ("<html><body><a href='/about.html'>About</a><table>" + 
+            "".join(rows) + "</table></body></html>").encode('utf-8')
+# --------------------------------------------------------------------------- #
+#                           Local HTTP Server                                 #
+# --------------------------------------------------------------------------- #
+class _Handler(BaseHTTPRequestHandler):
+    page = b""
+    etag = '"v1"'
+    log = []
+
+    def do_GET(self):
+        self.log.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.page)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, *args):
+        pass
+
+@fixture
+def get_page_url():
+    _Handler.page = make_page(DATES[:3])
+    _Handler.etag = '"v1"'
+    _Handler.log = []
+    server = HTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d/get-the-data.html" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+# --------------------------------------------------------------------------- #
+#                             Test Catalog                                    #
+# --------------------------------------------------------------------------- #
+class CatalogTests:
+    """Tests Catalog Class"""
+
+    @mark.data
+    @mark.catalog
+    def test_parse_catalog(self):
+        entry = parse_url(HOST + "/united-states/ca/san-francisco/2019-12-04/"
+                          "data/listings.csv.gz")
+        assert entry['city'] == 'san-francisco', "City not parsed"
+        assert entry['region'] == 'ca', "Region not parsed"
+        assert entry['date'] == '2019-12-04', "Date not parsed"
+        assert entry['kind'] == 'listings', "Kind not parsed"
+        assert parse_url("/about.html") is None, "Non-data link parsed"
+        entries = parse_catalog(make_page() + make_page())
+        assert len(entries) == len(CITIES) * len(DATES) * len(FILES), \
+            "Links not parsed once each"
+        kinds = {e['kind'] for e in entries}
+        assert kinds == {'listings', 'reviews', 'listings_summary',
+                         'neighbourhoods_summary'}, "Kinds misparsed"
+
+    @mark.data
+    @mark.catalog
+    def test_catalog_refresh(self, get_page_url, tmp_path):
+        path = os.path.join(str(tmp_path), "catalog.json")
+        catalog = Catalog(path, url=get_page_url)
+        assert catalog.refresh() == 36, "Catalog not built"
+        # Unchanged pages are not parsed again.
+        assert catalog.refresh() == 0, "Unchanged page added entries"
+        assert _Handler.log[-1].get('If-None-Match') == '"v1"', \
+            "Conditional request not issued"
+        # New snapshots are merged incrementally and persisted.
+        _Handler.page = make_page(DATES)
+        _Handler.etag = '"v2"'
+        assert Catalog(path, url=get_page_url).refresh() == 12, \
+            "New snapshots not merged"
+        assert len(Catalog(path)) == 48, "Catalog not persisted"
+
+    @mark.data
+    @mark.catalog
+    def test_catalog_query_plan(self, tmp_path):
+        catalog = Catalog(os.path.join(str(tmp_path), "catalog.json"))
+        catalog.update(parse_catalog(make_page()))
+        df = catalog.query(cities=['san-francisco', 'barcelona'], kinds='listings',
+                           since='2018-01-01')
+        assert len(df) == 6, "Query returned wrong entries"
+        assert set(df['city']) == {'san-francisco', 'barcelona'}, "Cities wrong"
+        df = catalog.query(countries='united-states', kinds='reviews', latest=True)
+        assert list(df['date'].astype(str)) == ['2019-12-04'] * 2, \
+            "Latest snapshots not selected"
+        jobs = catalog.plan("raw", cities='san-francisco', kinds='listings',
+                            since='2019-01-01', until='2019-12-31')
+        assert jobs[0] == (HOST + "/united-states/ca/san-francisco/2019-11-01/"
+                           "data/listings.csv.gz", "raw/san-francisco/2019/"
+                           "ca_san-francisco_2019-11-01_data_listings.csv.gz"), \
+            "Plan does not follow the raw data layout"
+        assert len(jobs) == 2, "Plan has wrong number of jobs"
+        df = catalog.query(markets=['ca', 'barcelona'], kinds='listings')
+        assert set(df['city']) == {'san-francisco', 'barcelona'}, \
+            "Markets not matched against regions and cities"
+        assert len(catalog.query(markets='united-states', kinds='listings')) == 8, \
+            "Markets not matched against countries"
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_delta.py                                                     #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 6:31:47 pm                     #
+# Last Modified : Saturday, October 17th 2026, 6:31:47 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the snapshot delta engine."""
+import numpy as np
+import pandas as pd
+from pytest import mark, raises
+from ...conftest import SNAPSHOTS, make_listings
+from ...src.data.cache import ColumnarCache
+from ...src.data.delta import History, diff
+from ...src.data.listings import DataSet
+from ...src.data.schema import get_schema
+from ...src.data.union import union_frames
+
+def make_snapshots():
+    """Returns three typed snapshots with known changes between them."""
+    schema = get_schema('listings', 2)
+    typed = lambda df: schema.parse(df.astype(schema.dtypes(df.columns)))
+    first = typed(make_listings(n=400))
+    second = first.drop(index=range(0, 20)).copy()
+    second.loc[second.index[:30], 'price'] = second['price'].iloc[:30] + 10
+    second.loc[second.index[30:35], 'room_type'] = 'Hotel room'
+    added = typed(make_listings(n=15, seed=5))
+    added['id'] = np.arange(5000, 5015)
+    second = pd.concat([second, added], ignore_index=True)
+    second['room_type'] = second['room_type'].astype('category')
+    third = second.sample(frac=1, random_state=1).reset_index(drop=True)
+    third.loc[:9, 'bedrooms'] = np.nan
+    return [first, second, third]
+# --------------------------------------------------------------------------- #
+#                               Test Delta                                    #
+# --------------------------------------------------------------------------- #
+class DeltaTests:
+    """Tests diff, Delta and History."""
+
+    @mark.data
+    @mark.delta
+    def test_diff(self):
+        first, second, _ = make_snapshots()
+        delta = diff(first, second)
+        counts, columns = delta.summary()
+        assert counts == {'added': 15, 'removed': 20, 'changed': 35}, \
+            "Wrong counts of added, removed and changed listings"
+        assert set(delta.mask.columns) == {'price', 'room_type'}, \
+            "Only changed columns should be recorded"
+        assert columns['price'] == 30, "Price changes miscounted"
+        prices = delta.changes('price')
+        assert len(prices) == 45, "Change feed should include added listings"
+        pd.testing.assert_frame_equal(delta.apply(first), second)
+        with raises(ValueError):
+            diff(pd.concat([first, first]), second)
+
+    @mark.data
+    @mark.delta
+    def test_diff_dtypes(self, tmp_path):
+        first = pd.DataFrame({'id': [1, 2, 3], 'beds': [1.0, 2.0, np.nan],
+                              'accommodates': [2, 4, 6]})
+        second = pd.DataFrame({'id': [1, 2, 3], 'beds': [1, 2, 3],
+                               'accommodates': [2.0, 4.0, 5.0]})
+        delta = diff(first, second)
+        assert delta.summary()[0]['changed'] == 1, \
+            "Equal values of differing dtypes should not count as changes"
+        assert list(delta.changes('beds').index) == [3], "Beds changes wrong"
+        assert list(delta.changes('accommodates').index) == [3], \
+            "Accommodates changes wrong"
+        pd.testing.assert_frame_equal(delta.apply(first), second)
+        delta.save(str(tmp_path))
+        restored = type(delta).load(str(tmp_path))
+        pd.testing.assert_frame_equal(restored.apply(first), second)
+
+    @mark.data
+    @mark.delta
+    def test_history(self, tmp_path):
+        snapshots = make_snapshots()
+        keys = ['2019-10-14', '2019-11-01', '2019-12-04']
+        history = History.from_snapshots(snapshots, keys)
+        for key, expected in zip(keys, snapshots):
+            pd.testing.assert_frame_equal(history.snapshot(key), expected)
+        assert list(history.summary()['changed']) == [35, 10], \
+            "History summary wrong"
+        feed = history.changes('bedrooms')
+        assert set(feed['snapshot']) == set(keys[1:]), "Change feed incomplete"
+        history.save(str(tmp_path))
+        restored = History.load(str(tmp_path))
+        pd.testing.assert_frame_equal(restored.snapshot(keys[2]), snapshots[2],
+                                      check_dtype=False)
+        # Histories can be built from stacked snapshots.
+        union = union_frames(snapshots, keys=keys)
+        history = History.from_union(union)
+        assert history.keys == keys, "Snapshots not ordered by key"
+        pd.testing.assert_frame_equal(history.snapshot(keys[1]), snapshots[1],
+                                      check_dtype=False, check_categorical=False)
+
+    @mark.data
+    @mark.delta
+    def test_dataset_history(self, get_listings_dir, tmp_path):
+        ds = DataSet(get_listings_dir, name='test-city',
+                     cache=ColumnarCache(str(tmp_path)))
+        history = ds.history(columns=['price', 'room_type'], schema='infer')
+        assert history.keys == SNAPSHOTS, "Snapshots out of order"
+        ds.load(columns=['id', 'price', 'room_type'], schema='infer')
+        expected = ds.get_data()
+        for snapshot in SNAPSHOTS:
+            df = expected[expected['snapshot'] == snapshot].drop(columns='snapshot')
+            pd.testing.assert_frame_equal(history.snapshot(snapshot),
+                                          df.reset_index(drop=True),
+                                          check_dtype=False, check_categorical=False)
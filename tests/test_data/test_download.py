@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_download.py                                                  #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 3:51:16 pm                     #
+# Last Modified : Saturday, October 17th 2026, 3:51:16 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the download engine against a local HTTP server."""
+import hashlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import os
+from socketserver import ThreadingMixIn
+import threading
+
+from pytest import fixture, mark
+from ...src.data.download import Downloader, Manifest, sha256
+# --------------------------------------------------------------------------- #
+#                           Local HTTP Server                                 #
+# --------------------------------------------------------------------------- #
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves files with Range, ETag and injected dropped connections."""
+    protocol_version = 'HTTP/1.1'
+    files = {}
+    drop_after = {}
+    log = []
+
+    def do_GET(self):
+        self.log.append((self.path, dict(self.headers)))
+        body = self.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        start = 0
+        if self.headers.get('Range'):
+            start = int(self.headers['Range'].split("=")[1].split("-")[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Range', 'bytes */%d' % len(body))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes %d-%d/%d' % (
+                start, len(body) - 1, len(body)))
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body) - start))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', 'Wed, 04 Dec 2019 00:00:00 GMT')
+        self.end_headers()
+        data = body[start:]
+        cut = self.drop_after.pop(self.path, None)
+        if cut is not None:
+            self.wfile.write(data[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+@fixture
+def get_server():
+    _Handler.files = {"/ca/sf/2019-%02d-01/data/listings.csv.gz" % m: 
+                      os.urandom(300000 + m) for m in range(1, 4)}
+    _Handler.drop_after = {}
+    _Handler.log = []
+    server = _Server(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+# --------------------------------------------------------------------------- #
+#                             Test Downloader                                 #
+# --------------------------------------------------------------------------- #
+class DownloaderTests:
+    """Tests Downloader Class"""
+
+    def _jobs(self, url, directory):
+        return [(url + p, os.path.join(directory, p.strip("/").replace("/", "_")))
+                for p in sorted(_Handler.files)]
+
+    @mark.data
+    @mark.download
+    def test_download_all(self, get_server, tmp_path):
+        manifest = Manifest(os.path.join(str(tmp_path), "manifest.json"))
+        downloader = Downloader(manifest, n_workers=3, chunk_size=65536)
+        jobs = self._jobs(get_server, str(tmp_path))
+        results = downloader.download_all(jobs)
+        assert [r['status'] for r in results] == ['downloaded'] * 3, \
+            "Files not downloaded"
+        for (url, path), body in zip(jobs, [_Handler.files[p] for p in 
+                                            sorted(_Handler.files)]):
+            with open(path, 'rb') as f:
+                assert f.read() == body, "Downloaded content differs"
+            assert manifest.verify(path), "Manifest checksum not recorded"
+        # Unchanged files are skipped with conditional requests.
+        results = Downloader(manifest.path).download_all(jobs)
+        assert [r['status'] for r in results] == ['not-modified'] * 3, \
+            "Conditional request not honored"
+        assert 'If-None-Match' in _Handler.log[-1][1], "No conditional request"
+
+    @mark.data
+    @mark.download
+    def test_download_resume(self, get_server, tmp_path):
+        manifest = Manifest(os.path.join(str(tmp_path), "manifest.json"))
+        downloader = Downloader(manifest, chunk_size=4096, backoff=0)
+        url, path = self._jobs(get_server, str(tmp_path))[0]
+        _Handler.drop_after[url[len(get_server):]] = 100000
+        result = downloader.download(url, path)
+        assert result['status'] == 'resumed', "Dropped download not resumed"
+        offset = int(_Handler.log[-1][1]['Range'][6:-1])
+        assert 0 < offset <= 100000, "Range request not issued"
+        assert result['bytes'] == len(_Handler.files[url[len(get_server):]]), \
+            "Bytes were transferred twice"
+        assert manifest.verify(path), "Resumed file corrupt"
+        assert not os.path.exists(path + ".part"), "Partial file left behind"
+
+    @mark.data
+    @mark.download
+    def test_download_truncated_and_missing(self, get_server, tmp_path):
+        manifest = Manifest(os.path.join(str(tmp_path), "manifest.json"))
+        downloader = Downloader(manifest, retries=1, backoff=0)
+        url, path = self._jobs(get_server, str(tmp_path))[1]
+        body = _Handler.files[url[len(get_server):]]
+        with open(path, 'wb') as f:
+            f.write(body[:1000])
+        result = downloader.download(url, path)
+        assert result['status'] == 'resumed', "Truncated file treated as done"
+        assert sha256(path) == hashlib.sha256(body).hexdigest(), \
+            "Truncated file not completed"
+        results = downloader.download_all([(get_server + "/missing.csv.gz",
+                                            os.path.join(str(tmp_path), "m.gz"))])
+        assert results[0]['status'] == 'failed', "Missing file not reported"
+        assert results[0]['error'] is not None, "Error not reported"
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_ingest.py                                                    #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 5:36:20 pm                     #
+# Last Modified : Saturday, October 17th 2026, 5:36:20 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the streaming ingestion pipeline."""
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+import os
+import threading
+
+import pyarrow.parquet as pq
+from pytest import fixture, mark
+from ...src.data.cache import ColumnarCache
+from ...src.data.download import Downloader
+from ...src.data.ingest import IngestPipeline, convert
+from ...src.data.listings import DataSet
+from ...src.data.schema import infer_schema, read_header
+
+class _Handler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+@fixture
+def get_file_server(get_listings_dir):
+    handler = partial(_Handler, directory=get_listings_dir)
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d/" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+# --------------------------------------------------------------------------- #
+#                             Test Ingestion                                  #
+# --------------------------------------------------------------------------- #
+class IngestTests:
+    """Tests convert and the IngestPipeline."""
+
+    @mark.data
+    @mark.ingest
+    def test_convert(self, get_listings_file, tmp_path):
+        cache = ColumnarCache(str(tmp_path))
+        result = convert(get_listings_file, cache, chunksize=64)
+        assert result['rows'] == 500, "Rows not written"
+        assert pq.ParquetFile(result['target']).num_row_groups == 8, \
+            "Chunks not written as row groups"
+        assert convert(get_listings_file, cache)['cached'], "Fresh file converted"
+        # DataSet reads the typed copy rather than parsing the csv.
+        schema = infer_schema(read_header(get_listings_file))
+        ds = DataSet(get_listings_file, name='test', cache=cache)
+        ds.load(schema='infer')
+        df = ds.get_data()
+        expected = schema.read_csv(get_listings_file)
+        assert df.shape == expected.shape, "Ingested shape differs"
+        assert df['price'].dtype == 'float32', "Price not typed"
+        assert df['room_type'].dtype.name == 'category', "Category not typed"
+        assert (df['price'] - expected['price']).abs().max() < 0.01, \
+            "Prices differ from parsed csv"
+
+    @mark.data
+    @mark.ingest
+    def test_ingest_pipeline(self, get_file_server, get_listings_dir, tmp_path):
+        filenames = sorted(os.listdir(get_listings_dir))
+        jobs = [(get_file_server + f, os.path.join(str(tmp_path), "raw", f))
+                for f in filenames]
+        downloader = Downloader(os.path.join(str(tmp_path), "raw", "manifest.json"),
+                                n_workers=2)
+        cache = ColumnarCache(os.path.join(str(tmp_path), "interim"))
+        pipeline = IngestPipeline(downloader, cache, chunksize=128,
+                                  n_converters=2, queue_size=1)
+        results = pipeline.run(jobs)
+        assert [r['status'] for r in results] == ['downloaded'] * len(jobs), \
+            "Files not downloaded"
+        assert all(r['error'] is None for r in results), "Conversion failed"
+        assert all(r['rows'] == 500 for r in results), "Rows not ingested"
+        for url, path in jobs:
+            schema = infer_schema(read_header(path))
+            assert cache.isfresh(path, schema.key), "Parquet copy not landed"
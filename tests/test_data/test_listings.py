@@ -24,7 +24,13 @@ import os
 import shutil
 import pandas as pd
 from pytest import mark, raises
+from ...conftest import SNAPSHOTS, make_listings
+from ...src.analysis.univariate import DescribeQuant
+from ...src.data.cache import CACHE_ENV, ColumnarCache
 from ...src.data.listings import DataSet, DataGroup 
+from ...src.data.sampling import SampleIndexCache
+from ...src.data.writers import write
+from ...src.utils.memo import Memo
 # --------------------------------------------------------------------------- #
 #                             Test DataSet                                    #
 # --------------------------------------------------------------------------- #
@@ -50,9 +56,9 @@ class DataSetTests:
 
     @mark.data
     @mark.dataset    
-    def test_dataset_load(self):
+    def test_dataset_load(self, tmp_path):
         path = "./data/raw/san-francisco/2019/ca_san-francisco_2019-12-04_data_listings.csv.gz"
-        ds = DataSet(path)
+        ds = DataSet(path, cache=ColumnarCache(str(tmp_path)))
         ds.load()
         df = ds.get_data()
         assert df.shape[0] > 500, "DataSet load test - invalid shape[0]"
@@ -170,11 +176,11 @@ class DataGroupTests:
 
     @mark.data
     @mark.datagroup    
-    def test_datagroup_add_dataset_from_path(self): 
+    def test_datagroup_add_dataset_from_path(self, tmp_path): 
         # Load single dataset from path
         path = "./data/raw/san-francisco/2019/ca_san-francisco_2019-12-04_data_listings.csv.gz"
         name = 'san-francisco_2019-12-04'
-        dg = DataGroup(name=name) 
+        dg = DataGroup(name=name, cache=ColumnarCache(str(tmp_path))) 
         dg.add_dataset_from_path(path)
         # Get specified single dataset
         dict_of_datasets = dg.get_data(names=['2019-12-04'])
@@ -283,4 +289,420 @@ class DataGroupTests:
         summary = dg.summarize(verbose=True)        
         assert isinstance(summary, dict), "DataGroup summary failed to return a dataframe."
         assert isinstance(summary['stats'], pd.DataFrame), "Summary stats not dataframe object."
-        assert isinstance(summary['data'], pd.DataFrame), "Summary data not dataframe object."
\ No newline at end of file
+        assert isinstance(summary['data'], pd.DataFrame), "Summary data not dataframe object."
+# --------------------------------------------------------------------------- #
+#                          Test DataSet Streaming                             #
+# --------------------------------------------------------------------------- #
+class DataSetStreamingTests:
+    """Tests DataSet chunked streaming mode."""
+
+    @mark.data
+    @mark.dataset
+    @mark.streaming
+    def test_dataset_iter_chunks(self, get_listings_file):
+        ds = DataSet(get_listings_file, cache=False, chunksize=120)
+        chunks = list(ds.iter_chunks())
+        assert all(c.shape[0] <= 120 for c in chunks), "Chunk exceeds chunksize"
+        assert sum(c.shape[0] for c in chunks) == 500, "Rows lost in chunks"
+        chunks = list(ds.iter_chunks(columns=['id', 'price'], schema=2))
+        assert chunks[0]['price'].dtype == 'float32', "Schema not applied to chunks"
+
+    @mark.data
+    @mark.dataset
+    @mark.streaming
+    @mark.summary
+    def test_dataset_streaming_summarize(self, get_listings_file):
+        ds = DataSet(get_listings_file, cache=False)
+        ds.load()
+        expected = ds.summarize()
+        streamed = DataSet(get_listings_file, cache=False, chunksize=70).summarize()
+        for k, v in expected.items():
+            if k != 'Size (MB)':
+                assert streamed[k] == v, "Streaming summary differs on " + k
+
+    @mark.data
+    @mark.dataset
+    @mark.streaming
+    @mark.dataset_describe
+    def test_dataset_streaming_describe(self, get_listings_file):
+        ds = DataSet(get_listings_file, cache=False)
+        ds.load()
+        expected = ds.describe()
+        streamed = DataSet(get_listings_file, cache=False, chunksize=70).describe()
+        quant = streamed['quant']
+        pd.testing.assert_frame_equal(quant, expected['quant'][quant.columns],
+                                      check_dtype=False)
+        qual = streamed['qual']
+        assert (qual[['count', 'unique']] == \
+            expected['qual'][['count', 'unique']]).all().all(), \
+            "Streaming qualitative counts differ"
+
+# --------------------------------------------------------------------------- #
+#                          Test DataGroup Parallel                            #
+# --------------------------------------------------------------------------- #
+class DataGroupParallelTests:
+    """Tests parallel loading of DataGroup objects."""
+
+    @mark.data
+    @mark.datagroup
+    @mark.parallel
+    def test_datagroup_parallel_add_dataset_from_path(self, get_listings_dir, tmp_path):
+        serial = DataGroup('serial', cache=False)
+        serial.add_dataset_from_path(get_listings_dir)
+        cache = ColumnarCache(str(tmp_path))
+        dg = DataGroup('parallel', cache=cache)
+        dg.add_dataset_from_path(get_listings_dir, n_jobs=2)
+        assert list(dg.get_data().keys()) == sorted(dg.get_data().keys()), \
+            "DataSets not added in deterministic order"
+        assert list(dg.get_data().keys()) == list(serial.get_data().keys()), \
+            "Parallel and serial loads differ"
+        for name, ds in dg.get_data().items():
+            pd.testing.assert_frame_equal(ds.get_data(), 
+                                          serial.get_data()[name].get_data())
+        assert not os.listdir(str(tmp_path)) == [], "Cache not populated"
+        assert not [f for f in os.listdir(str(tmp_path)) if f.startswith('tmp')], \
+            "Temporary files left behind"
+
+    @mark.data
+    @mark.datagroup
+    @mark.parallel
+    def test_datagroup_parallel_load_errors(self, get_listings_dir, tmp_path):
+        bad = os.path.join(str(tmp_path), "ca_test-city_2019-09-01_data_listings.csv.gz")
+        with open(bad, 'wb') as f:
+            f.write(b'not a gzip file')
+        cache = ColumnarCache(str(tmp_path))
+        dg = DataGroup('parallel', cache=cache)
+        for filename in sorted(os.listdir(get_listings_dir)):
+            dg.add_dataset(DataSet(os.path.join(get_listings_dir, filename),
+                                   cache=cache))
+        dg.add_dataset(DataSet(bad, name='2019-09-01'))
+        dg.load(columns=['id', 'price'], schema=2, n_jobs=2)
+        assert list(dg.errors.keys()) == ['2019-09-01'], "Error not reported per file"
+        loaded = [n for n, ds in dg.get_data().items() if n != '2019-09-01']
+        for name in loaded:
+            df = dg.get_data()[name].get_data()
+            assert list(df.columns) == ['id', 'price'], "Columns not projected"
+
+    @mark.data
+    @mark.datagroup
+    @mark.parallel
+    @mark.summary
+    def test_datagroup_parallel_summarize(self, get_listings_dir, tmp_path):
+        memo = Memo()
+        cache = ColumnarCache(str(tmp_path))
+        serial = DataGroup('serial', cache=cache)
+        parallel = DataGroup('parallel', cache=cache)
+        for filename in sorted(os.listdir(get_listings_dir)):
+            path = os.path.join(get_listings_dir, filename)
+            serial.add_dataset(DataSet(path, cache=cache, memo=False))
+            parallel.add_dataset(DataSet(path, cache=cache, memo=memo))
+        serial.load()
+        parallel.load()
+        expected = serial.summarize()
+        summary = parallel.summarize(n_jobs=2)
+        pd.testing.assert_frame_equal(summary['data'], expected['data'])
+        pd.testing.assert_frame_equal(summary['stats'], expected['stats'])
+        assert list(summary['timing']['Name']) == list(parallel.get_data().keys()), \
+            "Timing not reported per DataSet"
+        assert len(memo) == 3, "Worker summaries not memoized"
+        again = parallel.summarize(n_jobs=2)
+        pd.testing.assert_frame_equal(again['data'], expected['data'])
+        assert memo.hits == 3, "Memoized summaries were recomputed"
+
+# --------------------------------------------------------------------------- #
+#                            Test DataGroup Lazy                              #
+# --------------------------------------------------------------------------- #
+class DataGroupLazyTests:
+    """Tests lazy DataGroup objects with memory budgeted residency."""
+
+    @mark.data
+    @mark.datagroup
+    @mark.lazy
+    def test_datagroup_lazy_registration(self, get_listings_dir, tmp_path):
+        dg = DataGroup('lazy', cache=ColumnarCache(str(tmp_path)), lazy=True)
+        dg.add_dataset_from_path(get_listings_dir)
+        datasets = dg.get_data()
+        assert len(datasets) == 3, "DataSets not registered"
+        assert not any(ds.isloaded for ds in datasets.values()), \
+            "Lazy DataGroup loaded DataSets eagerly"
+        df = datasets['2019-11-01'].get_data()
+        assert df.shape == (500, 23), "DataSet not materialized on first use"
+        assert dg.residency.resident == ['2019-11-01'], "Residency not tracked"
+
+    @mark.data
+    @mark.datagroup
+    @mark.lazy
+    def test_datagroup_lazy_eviction(self, get_listings_dir, tmp_path):
+        probe = DataSet(os.path.join(get_listings_dir, os.listdir(get_listings_dir)[0]),
+                        cache=False)
+        probe.load(columns=['id', 'price', 'city'])
+        budget = int(probe.memory_usage() * 2.5)
+        dg = DataGroup('lazy', cache=ColumnarCache(str(tmp_path)), lazy=True, 
+                       memory_budget=budget)
+        dg.add_dataset_from_path(get_listings_dir, columns=['id', 'price', 'city'])
+        datasets = dg.get_data()
+        expected = {}
+        for name, ds in datasets.items():
+            expected[name] = ds.get_data().copy()
+            assert dg.residency.nbytes <= budget, "Memory budget exceeded"
+        assert dg.residency.resident == ['2019-11-01', '2019-12-04'], \
+            "Least recently used DataSet not evicted"
+        assert not datasets['2019-10-14'].isloaded, "Evicted DataSet still loaded"
+        # Evicted DataSets reload with the same content.
+        pd.testing.assert_frame_equal(datasets['2019-10-14'].get_data(), 
+                                      expected['2019-10-14'])
+        assert dg.residency.resident == ['2019-12-04', '2019-10-14'], \
+            "Residency not updated on reload"
+        summary = dg.summarize()
+        assert summary['data'].shape[0] == 3, "Lazy DataGroup summary incomplete"
+
+    @mark.data
+    @mark.datagroup
+    @mark.lazy
+    def test_datagroup_lazy_pin(self, get_listings_dir, tmp_path):
+        dg = DataGroup('lazy', cache=ColumnarCache(os.path.join(str(tmp_path), "cache")),
+                       lazy=True, memory_budget=1)
+        dg.add_dataset_from_path(get_listings_dir, columns=['id', 'price', 'city'])
+        datasets = dg.get_data()
+        with dg.residency.pin(datasets['2019-10-14']):
+            for name in ['2019-11-01', '2019-12-04']:
+                datasets[name].get_data()
+            assert datasets['2019-10-14'].isloaded, "Pinned DataSet evicted"
+        assert dg.residency.resident == ['2019-12-04'], "Released DataSet not evicted"
+        # Members are pinned while threads save them under a tiny budget.
+        dg.save(os.path.join(str(tmp_path), "saved"), format='parquet', n_jobs=3)
+        for name, ds in datasets.items():
+            assert pd.read_parquet(ds.target).shape == (500, 3), \
+                "Lazy DataSet not saved"
+        assert len(dg.residency.resident) == 1, "Memory budget not restored"
+
+# --------------------------------------------------------------------------- #
+#                         Test DataSet Directory                              #
+# --------------------------------------------------------------------------- #
+class DataSetDirectoryTests:
+    """Tests DataSet objects loaded from a directory of snapshots."""
+
+    @mark.data
+    @mark.dataset
+    @mark.union
+    def test_dataset_directory_union(self, get_listings_dir, tmp_path):
+        directory = os.path.join(str(tmp_path), "market")
+        os.makedirs(directory)
+        for i, filename in enumerate(sorted(os.listdir(get_listings_dir))):
+            df = pd.read_csv(os.path.join(get_listings_dir, filename))
+            if i == 0:
+                # An older vintage without some columns.
+                df = df.drop(columns=['reviews_per_month', 'room_type'])
+            df.to_csv(os.path.join(directory, filename), index=False)
+        with open(os.path.join(directory, "notes.txt"), 'w') as f:
+            f.write("not a snapshot")
+        ds = DataSet(directory, name='market', cache=False)
+        ds.load(schema=1)
+        df = ds.get_data()
+        assert df.shape[0] == 1500, "Rows not stacked"
+        assert df.shape[1] == 24, "Columns not aligned on their union"
+        assert list(df['snapshot'].cat.categories) == \
+            ['2019-10-14', '2019-11-01', '2019-12-04'], "Snapshot keys incorrect"
+        first = df[df['snapshot'] == '2019-10-14']
+        assert first['room_type'].isna().all(), "Absent column not missing"
+        assert df['room_type'].dtype.name == 'category', "Category not retained"
+        assert df['reviews_per_month'].dtype == 'float32', "Absent column not typed"
+        parallel = DataSet(directory, name='market', cache=False)
+        parallel.load(schema=1, n_jobs=2)
+        pd.testing.assert_frame_equal(parallel.get_data(), df, check_dtype=False)
+        chunks = list(DataSet(directory, name='market', cache=False).iter_chunks())
+        assert chunks[0]['snapshot'].iloc[0] == '2019-10-14', "Chunks not keyed"
+
+    @mark.data
+    @mark.dataset
+    @mark.union
+    def test_dataset_directory_versions(self, tmp_path):
+        directory = os.path.join(str(tmp_path), "market")
+        os.makedirs(directory)
+        old = make_listings(n=200)
+        new = make_listings(n=300, seed=1)
+        new['number_of_reviews_ltm'] = new['number_of_reviews'] // 2
+        new['minimum_minimum_nights'] = new['minimum_nights']
+        old.to_csv(os.path.join(directory, "sf_ca_2018-10-14_listings.csv"),
+                   index=False)
+        new.to_csv(os.path.join(directory, "sf_ca_2019-10-14_listings.csv"),
+                   index=False)
+        ds = DataSet(directory, name='market', cache=False)
+        ds.load(schema='infer')
+        df = ds.get_data()
+        assert str(df['number_of_reviews_ltm'].dtype) == 'Int32', \
+            "Column of the later layout not typed"
+        assert df['number_of_reviews_ltm'].iloc[:200].isna().all(), \
+            "Absent column not missing"
+        assert 'number_of_reviews_ltm' in DescribeQuant().describe(df).index, \
+            "Column of the later layout not described"
+# --------------------------------------------------------------------------- #
+#                           Test DataSet Sampling                             #
+# --------------------------------------------------------------------------- #
+class DataSetSamplingTests:
+    """Tests sampling from disk without loading."""
+
+    @mark.data
+    @mark.sampling
+    def test_sample_from_disk(self, get_listings_file, tmp_path):
+        ds = DataSet(get_listings_file, name='test', chunksize=64,
+                     cache=ColumnarCache(str(tmp_path)))
+        columns = ['id', 'price', 'room_type']
+        df = ds.get_data(columns=columns, sample='head', n=10)
+        assert list(df['id']) == list(range(1000, 1010)), "Head not read"
+        df = ds.get_data(columns=columns, sample='tail', n=100)
+        assert list(df['id']) == list(range(1400, 1500)), "Tail not read"
+        assert list(df.index) == list(range(400, 500)), "Tail positions lost"
+        sample = ds.get_data(columns=columns, sample='random', n=50, seed=7)
+        assert sample.shape == (50, 3), "Random sample wrong shape"
+        assert not ds.isloaded, "Sampling should not load the DataSet"
+        # The sample does not depend on the chunksize, the cache or loading.
+        other = DataSet(get_listings_file, name='test', chunksize=37,
+                        cache=ColumnarCache(str(tmp_path)))
+        pd.testing.assert_frame_equal(other.get_data(columns=columns,
+                                                     sample='random', n=50,
+                                                     seed=7), sample)
+        ds.load()
+        pd.testing.assert_frame_equal(ds.get_data(columns=columns, sample='random',
+                                                  n=50, seed=7), sample,
+                                      check_dtype=False, check_categorical=False)
+        other.unload()
+        df = other.get_data(sample='random', pct=10, seed=3)
+        assert df.shape[0] == 50, "Percentage sample wrong size"
+        pd.testing.assert_frame_equal(df, ds.get_data(sample='random', pct=10,
+                                                      seed=3), check_dtype=False)
+
+    @mark.data
+    @mark.sampling
+    def test_sample_directory_from_disk(self, get_listings_dir, tmp_path):
+        ds = DataSet(get_listings_dir, name='test-city',
+                     cache=ColumnarCache(str(tmp_path)))
+        df = ds.get_data(columns=['snapshot', 'id'], sample='tail', n=600)
+        assert df.shape[0] == 600, "Tail did not span files"
+        assert list(df['snapshot'].unique()) == SNAPSHOTS[1:], \
+            "Tail rows from wrong snapshots"
+        assert df.index[0] == 900, "Tail positions wrong"
+
+    @mark.data
+    @mark.sampling
+    def test_stratified_sample(self, get_listings_dir, tmp_path):
+        ds = DataSet(get_listings_dir, name='test-city',
+                     cache=ColumnarCache(str(tmp_path)))
+        ds.load(schema='infer')
+        df = ds.get_data()
+        sample = ds.sample(n=150, strata='room_type', seed=1)
+        assert sample.shape[0] == 150, "Proportional sample wrong size"
+        expected = df['room_type'].value_counts(normalize=True) * 150
+        observed = sample['room_type'].value_counts()
+        assert ((observed - expected).abs() < 1).all(), "Allocation not proportional"
+        sample = ds.sample(n=20, strata=['snapshot', 'room_type'],
+                           allocation='fixed', seed=1)
+        counts = sample.groupby(['snapshot', 'room_type'], observed=True).size()
+        assert (counts <= 20).all() and counts.max() == 20, "Fixed allocation wrong"
+        with raises(ValueError):
+            ds.sample(frac=.1, strata='room_type', allocation='fixed')
+
+    @mark.data
+    @mark.sampling
+    def test_group_sample(self, get_listings_dir, tmp_path):
+        ds = DataSet(get_listings_dir, name='test-city',
+                     cache=ColumnarCache(str(tmp_path)))
+        ds.load(columns=['id', 'price'])
+        sample = ds.sample(n=40, groups='id', seed=5)
+        assert sample['id'].nunique() == 40, "Wrong number of groups"
+        ids = sample.groupby('snapshot', observed=True)['id'].apply(frozenset)
+        assert len(set(ids)) == 1, "Groups differ across snapshots"
+        # The same groups are selected in every DataSet.
+        group = DataGroup('markets', cache=ColumnarCache(str(tmp_path)))
+        for name in ['a', 'b']:
+            group.add_dataset(DataSet.from_dataframe(ds.get_data(), name))
+        samples = group.sample(frac=.2, groups='id', seed=5)
+        assert samples['a'].equals(samples['b']), "Groups differ across DataSets"
+
+    @mark.data
+    @mark.sampling
+    def test_sample_index_cache(self, get_listings_file, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_ENV, str(tmp_path))
+        assert SampleIndexCache().directory == \
+            os.path.join(str(tmp_path), "samples"), \
+            "Sample positions should default to the user cache"
+        cache = SampleIndexCache(os.path.join(str(tmp_path), "samples"))
+        ds = DataSet(get_listings_file, name='test',
+                     cache=ColumnarCache(str(tmp_path)))
+        ds.load()
+        first = ds.sample(frac=.1, strata='neighbourhood_cleansed', seed=3,
+                          cache=cache)
+        key = cache.key(ds.fingerprint(), {'n': None, 'frac': .1,
+                        'strata': 'neighbourhood_cleansed', 'groups': None,
+                        'allocation': 'proportional'}, 3)
+        assert os.path.exists(os.path.join(cache.directory, key + ".npy")), \
+            "Sample positions not persisted"
+        other = DataSet(get_listings_file, name='test',
+                        cache=ColumnarCache(str(tmp_path)))
+        other.load()
+        assert other.fingerprint() == ds.fingerprint(), "Fingerprint unstable"
+        second = other.sample(frac=.1, strata='neighbourhood_cleansed', seed=3,
+                              cache=SampleIndexCache(cache.directory))
+        pd.testing.assert_frame_equal(first, second)
+        other.load(columns=['id', 'neighbourhood_cleansed'])
+        assert other.fingerprint() != ds.fingerprint(), \
+            "Fingerprint ignores load arguments"
+# --------------------------------------------------------------------------- #
+#                             Test Writers                                    #
+# --------------------------------------------------------------------------- #
+class DataSetWriterTests:
+    """Tests multi-format, atomic saving."""
+
+    @mark.data
+    @mark.writers
+    def test_dataset_save_formats(self, get_listings_file, tmp_path):
+        ds = DataSet(get_listings_file, name='test',
+                     cache=ColumnarCache(str(tmp_path)))
+        ds.load(schema='infer')
+        df = ds.get_data()
+        sizes = {}
+        for fmt in ['csv', 'csv.gz', 'parquet', 'feather']:
+            ds.save(str(tmp_path), format=fmt, level=9 if fmt == 'csv.gz' else None)
+            assert ds.target.endswith("_data_listings." + fmt), \
+                "Extension not replaced by format"
+            sizes[fmt] = os.path.getsize(ds.target)
+        assert sizes['parquet'] < sizes['csv'] / 2, "Parquet not compressed"
+        assert sizes['csv.gz'] < sizes['csv'] / 2, "csv.gz not compressed"
+        pd.testing.assert_frame_equal(pd.read_parquet(ds.target[:-8] + ".parquet"),
+                                      df, check_dtype=False)
+        assert not [f for f in os.listdir(str(tmp_path)) if f.endswith(".tmp")], \
+            "Temporary files left behind"
+        with raises(Exception):
+            ds.save(os.path.dirname(get_listings_file), format='csv.gz')
+
+    @mark.data
+    @mark.writers
+    def test_write_index(self, tmp_path):
+        df = make_listings(n=50)[['id', 'price', 'accommodates']]
+        indexed = df.set_index('id')
+        for fmt in ['parquet', 'feather']:
+            path = write(indexed, os.path.join(str(tmp_path), "indexed"), fmt=fmt)
+            restored = pd.read_parquet(path) if fmt == 'parquet' else \
+                pd.read_feather(path).set_index('id')
+            pd.testing.assert_frame_equal(restored, indexed)
+            path = write(df, os.path.join(str(tmp_path), "default"), fmt=fmt)
+            restored = pd.read_parquet(path) if fmt == 'parquet' else \
+                pd.read_feather(path)
+            assert list(restored.columns) == list(df.columns), \
+                "A default index should not be written"
+
+    @mark.data
+    @mark.writers
+    def test_datagroup_save_parallel(self, get_listings_dir, tmp_path):
+        group = DataGroup('snapshots', cache=ColumnarCache(
+            os.path.join(str(tmp_path), "cache")))
+        group.add_dataset_from_path(get_listings_dir)
+        group.save(str(tmp_path), format='parquet', n_jobs=3)
+        for name, dataset in group.get_data().items():
+            assert dataset.target.startswith(str(tmp_path)), "Target not updated"
+            assert pd.read_parquet(dataset.target).shape == (500, 23), \
+                "DataSet not saved"
+        names = list(group.get_data().keys())[:1]
+        group.save(os.path.join(str(tmp_path), "one"), names=names, format='feather')
+        assert len(os.listdir(os.path.join(str(tmp_path), "one"))) == 1, \
+            "Names not honored"
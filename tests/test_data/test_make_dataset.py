@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_make_dataset.py                                              #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 4:12:40 am                       #
+# Last Modified : Sunday, October 18th 2026, 4:12:40 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the make_dataset command line entry point."""
+import os
+import subprocess
+import sys
+
+from click.testing import CliRunner
+from pytest import mark, raises
+from ...src.data import make_dataset
+from ...src.data.catalog import Catalog, parse_catalog
+from .test_catalog import make_page
+# --------------------------------------------------------------------------- #
+#                            Test make_dataset                                #
+# --------------------------------------------------------------------------- #
+class MakeDatasetTests:
+    """Tests the click entry point of make_dataset."""
+
+    @mark.data
+    @mark.download
+    def test_main(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(make_dataset, 'get_data', 
+                            lambda *args, **kwargs: calls.append((args, kwargs)))
+        result = CliRunner().invoke(make_dataset.main, 
+            ['san-francisco', '2019', '--workers', '2', '--ingest'])
+        assert result.exit_code == 0, result.output
+        (project_dir, year, market), kwargs = calls[0]
+        assert str(project_dir) == str(make_dataset.PROJECT_DIR), \
+            "Project directory incorrect"
+        assert (year, market) == ('2019', 'san-francisco'), "Arguments swapped"
+        assert kwargs == {'n_workers': 2, 'refresh': False, 'ingest': True}, \
+            "Options not passed"
+
+    @mark.data
+    @mark.download
+    def test_main_as_script(self):
+        # The Makefile runs the module as a script rather than a package.
+        result = subprocess.run([sys.executable, 
+                                 os.path.join("src", "data", "make_dataset.py"),
+                                 "--help"], cwd=str(make_dataset.PROJECT_DIR),
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert "MARKET YEAR" in result.stdout, "Usage not printed"
+
+    @mark.data
+    @mark.download
+    def test_get_data_markets(self, monkeypatch, tmp_path):
+        catalog = Catalog(os.path.join(str(tmp_path), "data", "external",
+                                       "catalog.json"))
+        catalog.update(parse_catalog(make_page()))
+        catalog.save()
+        planned = []
+
+        class Downloader:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def download_all(self, jobs):
+                planned.extend(jobs)
+                return []
+
+        monkeypatch.setattr(make_dataset, 'Downloader', Downloader)
+        make_dataset.get_data(str(tmp_path), '2019', 'united-states')
+        cities = {path.split("/")[-3] for _, path in planned}
+        assert cities == {'san-francisco', 'new-york-city'}, \
+            "Country did not select its cities"
+        with raises(ValueError):
+            make_dataset.get_data(str(tmp_path), '2019', 'atlantis')
+
+        class IngestPipeline:
+            def __init__(self, downloader, cache=None):
+                planned.append(cache)
+
+            def run(self, jobs):
+                return []
+
+        monkeypatch.setattr(make_dataset, 'IngestPipeline', IngestPipeline)
+        make_dataset.get_data(str(tmp_path), '2019', 'san-francisco', ingest=True)
+        cache = planned[-1]
+        assert cache.directory == os.path.join(str(tmp_path), "data", "interim"), \
+            "Ingested files not kept under data/interim"
+        assert cache.evict() == 0, "Ingested files may be evicted"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_parsers.py                                                   #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 2:47:20 am                       #
+# Last Modified : Sunday, October 18th 2026, 2:47:20 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the parsing of currency and percent columns."""
+import os
+
+import numpy as np
+import pandas as pd
+from pytest import mark
+from ...conftest import make_listings
+from ...src.data.cache import ColumnarCache
+from ...src.data.ingest import convert
+from ...src.data.parsers import NumberParser, parse_number
+# --------------------------------------------------------------------------- #
+#                            Test NumberParser                                #
+# --------------------------------------------------------------------------- #
+class NumberParserTests:
+    """Tests parse_number and NumberParser."""
+
+    @mark.data
+    @mark.parsers
+    def test_parse_number(self):
+        s = pd.Series(['$1,234.00', '$95.50', None, '95%', ' $7 ', 'n/a', '$95.50'])
+        values = parse_number(s)
+        assert values.dtype == 'float32', "Not parsed as float32"
+        expected = [1234, 95.5, np.nan, 95, 7, np.nan, 95.5]
+        assert np.allclose(values, expected, equal_nan=True), "Values misparsed"
+        cents = parse_number(s, 'cents')
+        assert str(cents.dtype) == 'Int64', "Cents not nullable integers"
+        assert cents.iloc[0] == 123400 and cents.isna().sum() == 2, \
+            "Cents misparsed"
+        numeric = parse_number(pd.Series([1.5, np.nan]))
+        assert np.allclose(numeric, [1.5, np.nan], equal_nan=True), \
+            "Numeric series not cast"
+
+    @mark.data
+    @mark.parsers
+    def test_number_parser_chunks(self):
+        df = pd.DataFrame({'price': ['$1,000.00', 'call', '$50.00', None],
+                           'cleaning_fee': ['$10.00', '$10.00', 'free', 'free'],
+                           'name': ['a', 'b', 'c', 'd']})
+        parser = NumberParser()
+        chunks = list(parser.parse_chunks([df.iloc[:2].copy(), df.iloc[2:].copy()]))
+        parsed = pd.concat(chunks)
+        assert np.allclose(parsed['price'], [1000, np.nan, 50, np.nan],
+                           equal_nan=True), "Chunks misparsed"
+        assert list(parsed['name']) == ['a', 'b', 'c', 'd'], "Other columns altered"
+        report = parser.report()
+        assert parser.invalid == 3, "Invalid tokens not counted"
+        assert report.loc['price', 'Values'] == 3, "Values not counted"
+        assert report.loc['cleaning_fee', 'Invalid'] == 2, "Invalid not counted"
+        assert report.loc['cleaning_fee', 'Examples'] == 'free', "No examples"
+        assert report.loc['weekly_price', 'Values'] == 0, "Absent column counted"
+
+    @mark.data
+    @mark.parsers
+    def test_convert(self, tmp_path):
+        df = make_listings(n=300)
+        df.loc[:4, 'price'] = 'call'
+        df.loc[10:11, 'host_response_rate'] = 'pending'
+        path = os.path.join(str(tmp_path), "sf_ca_2019-10-14_listings.csv")
+        df.to_csv(path, index=False)
+        parser = NumberParser([])
+        result = convert(path, ColumnarCache(os.path.join(str(tmp_path), "cache")),
+                         chunksize=100, parser=parser)
+        assert result['invalid'] == 7, "Invalid tokens not reported by convert"
+        report = parser.report()
+        assert report.loc['price', 'Invalid'] == 5, "Invalid prices not counted"
+        assert report.loc['price', 'Examples'] == 'call', "No examples"
+        assert report.loc['host_response_rate', 'Invalid'] == 2, \
+            "Invalid percents not counted"
+        prices = pd.read_parquet(result['target'], columns=['price'])['price']
+        assert prices.iloc[:5].isna().all(), "Invalid prices not missing"
+        assert np.allclose(prices.iloc[5:], parse_number(df['price'].iloc[5:])), \
+            "Prices misparsed"
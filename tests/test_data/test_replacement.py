@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_replacement.py                                               #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 3:29:37 am                       #
+# Last Modified : Sunday, October 18th 2026, 3:29:37 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the batched string replacement engine."""
+import numpy as np
+import pandas as pd
+from pytest import mark, raises
+from ...conftest import make_listings
+from ...src.data.replacement import ReplacementEngine
+# --------------------------------------------------------------------------- #
+#                          Test ReplacementEngine                             #
+# --------------------------------------------------------------------------- #
+class ReplacementEngineTests:
+    """Tests ReplacementEngine against DataFrame.replace."""
+
+    @mark.data
+    @mark.replacement
+    def test_replacement_engine(self):
+        df = make_listings(n=800)
+        rules = [(r'\$', ''), (r',', '', ['price']), (r'room', 'Room'),
+                 (r'^Entire', 'Whole', 'room_type')]
+        expected = df.copy()
+        text = ReplacementEngine.text_columns(df)
+        for pattern, replace, *columns in rules:
+            targets = columns[0] if columns else text
+            targets = [targets] if isinstance(targets, str) else targets
+            for column in targets:
+                expected[column] = expected[column].astype(object).replace(
+                    {pattern: replace}, regex=True)
+        engine = ReplacementEngine(rules)
+        result = engine.transform(df)
+        for column in df.columns:
+            assert result[column].dtype == df[column].dtype, \
+                "{c} changed type".format(c=column)
+            assert result[column].astype(object).equals(
+                expected[column].astype(object)), "{c} differs".format(c=column)
+        assert engine.counts['price'] == df['price'].notna().sum(), \
+            "Changes not counted"
+        assert (df['room_type'].astype(str).str.startswith('Entire')).any(), \
+            "Input frame altered"
+        numeric = df.select_dtypes([np.number]).columns
+        assert not set(numeric) & set(engine.counts.index), "Numeric columns scanned"
+
+    @mark.data
+    @mark.replacement
+    def test_replacement_engine_literal_parallel(self):
+        df = pd.DataFrame({'a': ['t', 'f', None, 't'], 'b': ['x', 't', 'y', 'tt'],
+                           'n': [1, 2, 3, 4]})
+        rules = [('t', 'true'), ('f', 'false', 'a')]
+        result = ReplacementEngine(rules, regex=False, n_jobs=2).transform(df)
+        expected = df.replace({'t': 'true'}).replace({'a': {'f': 'false'}})
+        pd.testing.assert_frame_equal(result, expected)
+
+    @mark.data
+    @mark.replacement
+    def test_replacement_engine_missing(self):
+        df = pd.DataFrame({'a': ['t', None, 'n/a', np.nan], 'n': [1, 2, 3, 4]})
+        engine = ReplacementEngine([('n/a', np.nan), (None, 'unknown', 'a')],
+                                   regex=False)
+        result = engine.transform(df)
+        expected = df.replace({'n/a': np.nan}).replace({'a': {np.nan: 'unknown'}})
+        pd.testing.assert_frame_equal(result, expected)
+        assert engine.counts['a'] == 3, "Changes to missing values not counted"
+        # Rules apply in order to the results of earlier rules.
+        result = ReplacementEngine([(r'^n/a$', 'x'), (r'x', 'y')]).transform(df)
+        assert list(result['a'].iloc[[0, 2]]) == ['t', 'y'], "Rules not chained"
+        assert result['a'].iloc[[1, 3]].isna().all(), "Missing values altered"
+        with raises(ValueError):
+            ReplacementEngine([(np.nan, 'unknown')], regex=True)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_schema.py                                                    #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 10:48:02 am                    #
+# Last Modified : Saturday, October 17th 2026, 10:48:02 am                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the schema registry and typed loading."""
+import pandas as pd
+from pytest import mark, raises
+from ...src.data.cache import ColumnarCache
+from ...src.data.listings import DataSet
+from ...src.data.schema import get_schema, infer_schema
+# --------------------------------------------------------------------------- #
+#                             Test Schema                                     #
+# --------------------------------------------------------------------------- #
+class SchemaTests:
+    """Tests Schema registry and DataSet typed loading."""
+
+    @mark.data
+    @mark.schema
+    def test_schema_registry(self):
+        latest = get_schema('listings')
+        legacy = get_schema('listings', 1)
+        assert latest.version == 2, "Latest listings schema not returned"
+        assert len(latest.columns) == 106, "Listings v2 should have 106 columns"
+        assert 'number_of_reviews_ltm' not in legacy, "v1 has v2 columns"
+        assert infer_schema(legacy.columns) is legacy, "Failed to infer v1"
+        assert infer_schema(latest.columns) is latest, "Failed to infer v2"
+        with raises(KeyError):
+            get_schema('listings', 99)
+
+    @mark.data
+    @mark.schema
+    def test_dataset_load_typed_columns(self, get_listings_file, tmp_path):
+        columns = ['id', 'price', 'host_is_superhost', 'room_type',
+                   'host_since', 'host_response_rate', 'number_of_reviews_ltm']
+        ds = DataSet(get_listings_file, cache=ColumnarCache(str(tmp_path)))
+        ds.load(columns=columns, schema=2)
+        df = ds.get_data()
+        assert list(df.columns) == columns, "Columns not projected in order"
+        assert df['price'].dtype == 'float32', "Price not parsed as float32"
+        assert str(df['host_is_superhost'].dtype) == 'boolean', "Bool not parsed"
+        assert df['room_type'].dtype.name == 'category', "Category not parsed"
+        assert list(df['room_type'].cat.categories[:3]) == \
+            ['Entire home/apt', 'Private room', 'Shared room'], "Vocabulary lost"
+        assert pd.api.types.is_datetime64_any_dtype(df['host_since']), \
+            "Date not parsed"
+        assert df['host_response_rate'].max() <= 100, "Percent not parsed"
+        raw = pd.read_csv(get_listings_file)
+        expected = raw['price'].str.replace(r'[$,]', '', regex=True).astype(float)
+        assert (df['price'] - expected).abs().max() < 0.01, "Prices misparsed"
+        # Columns absent from the file are returned as missing values.
+        assert df['number_of_reviews_ltm'].isna().all(), "Absent column not empty"
+
+    @mark.data
+    @mark.schema
+    def test_dataset_load_schema_cache(self, get_listings_file, tmp_path):
+        cache = ColumnarCache(str(tmp_path))
+        ds = DataSet(get_listings_file, cache=cache)
+        ds.load(schema='infer')
+        schema = infer_schema(ds.get_data().columns)
+        assert cache.isfresh(get_listings_file, schema.key), "Typed load not cached"
+        ds.load(columns=['price', 'city'], schema=schema)
+        df = ds.get_data()
+        assert df['price'].dtype == 'float32', "Typed columns not read from cache"
+        assert df.shape[1] == 2, "Projection on cached copy failed"
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_store.py                                                     #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 7:22:40 pm                     #
+# Last Modified : Saturday, October 17th 2026, 7:22:40 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the partitioned store of processed listings."""
+import os
+
+import pyarrow.parquet as pq
+from pytest import fixture, mark
+from ...conftest import SNAPSHOTS, make_listings
+from ...src.data.cache import ColumnarCache
+from ...src.data.listings import DataGroup, DataSet
+from ...src.data.store import Store
+
+@fixture
+def get_store(get_listings_dir, tmp_path):
+    store = Store(os.path.join(str(tmp_path), "store"), row_group_size=50)
+    group = DataGroup('markets')
+    for market in ['san-francisco', 'oakland']:
+        ds = DataSet(get_listings_dir, name=market,
+                     cache=ColumnarCache(str(tmp_path)))
+        ds.load(schema='infer')
+        group.add_dataset(ds)
+    group.to_store(store, sort_by='price')
+    return store
+# --------------------------------------------------------------------------- #
+#                               Test Store                                    #
+# --------------------------------------------------------------------------- #
+class StoreTests:
+    """Tests Store and DataGroup.from_store."""
+
+    @mark.data
+    @mark.store
+    def test_store_layout(self, get_store):
+        assert get_store.markets() == ['oakland', 'san-francisco'], \
+            "Markets not partitioned"
+        path = os.path.join(get_store.partition('oakland', SNAPSHOTS[0]),
+                            "part-0.parquet")
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == 10, "Row groups not sized"
+        statistics = metadata.row_group(0).column(0).statistics
+        assert statistics is not None and statistics.has_min_max, \
+            "Row group statistics not written"
+
+    @mark.data
+    @mark.store
+    def test_store_pushdown(self, get_store):
+        filters = [('market', '==', 'san-francisco'), ('year', '==', 2019),
+                   ('price', '<', 150)]
+        plan = get_store.plan(filters)
+        assert len(plan) == 3, "Partitions of other markets not pruned"
+        assert all('market=san-francisco' in path for path, _ in plan), \
+            "Wrong partitions planned"
+        assert all(len(groups) < 10 for _, groups in plan), \
+            "Row groups not skipped on statistics"
+        df = get_store.read(filters, columns=['id', 'price', 'snapshot'])
+        everything = get_store.read(columns=['market', 'id', 'price', 'snapshot'])
+        expected = everything[(everything['market'] == 'san-francisco') &
+                              (everything['price'] < 150)]
+        assert df.shape == (expected.shape[0], 3), "Filtered rows differ"
+        assert df['price'].max() < 150, "Row filter not applied"
+        assert get_store.plan([('snapshot', '==', '2020-01-01')]) == [], \
+            "Missing snapshot should plan nothing"
+
+    @mark.data
+    @mark.store
+    def test_store_versions(self, tmp_path):
+        store = Store(str(tmp_path), row_group_size=50)
+        first = make_listings(n=100)[['id', 'price', 'accommodates']]
+        second = make_listings(n=100, seed=1)[['id', 'price', 'accommodates']]
+        second['accommodates'] = second['accommodates'].astype('float64')
+        second['number_of_reviews_ltm'] = range(100)
+        store.write(first, 'oakland', SNAPSHOTS[0])
+        store.write(second, 'oakland', SNAPSHOTS[1])
+        df = store.read(columns=['snapshot', 'accommodates',
+                                 'number_of_reviews_ltm'])
+        assert df.shape == (200, 3), "Snapshots not read"
+        assert df.loc[df['snapshot'] == SNAPSHOTS[0],
+                      'number_of_reviews_ltm'].isna().all(), \
+            "Column of a later vintage should read as missing"
+        df = store.read([('number_of_reviews_ltm', '<', 10)], columns=['id'])
+        assert df.shape[0] == 10, "Filter on a later vintage column failed"
+
+    @mark.data
+    @mark.store
+    def test_datagroup_from_store(self, get_store):
+        group = DataGroup.from_store(filters=[('price', '<', 150),
+                                              ('snapshot', 'in', SNAPSHOTS[1:])],
+                                     columns=['id', 'price'], store=get_store)
+        datasets = group.get_data()
+        assert set(datasets.keys()) == {'oakland', 'san-francisco'}, \
+            "DataSets not created per market"
+        df = datasets['oakland'].get_data()
+        assert list(df.columns) == ['snapshot', 'id', 'price'], \
+            "Columns not projected"
+        assert set(df['snapshot'].astype(str)) == set(SNAPSHOTS[1:]), \
+            "Snapshot filter not applied"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_union.py                                                     #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Sunday, October 18th 2026, 1:58:44 am                       #
+# Last Modified : Sunday, October 18th 2026, 1:58:44 am                       #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests the lazy union of DataFrames."""
+import pandas as pd
+from pytest import mark
+from ...conftest import make_listings
+from ...src.data.union import UnionView, union_frames
+# --------------------------------------------------------------------------- #
+#                             Test UnionView                                  #
+# --------------------------------------------------------------------------- #
+class UnionViewTests:
+    """Tests UnionView projection, filtering, chunking and flattening."""
+
+    @mark.data
+    @mark.union
+    def test_union_view(self):
+        df = make_listings(n=900)
+        a = df.iloc[:300]
+        b = df.iloc[300:600].drop(columns=['price'])
+        c = df.iloc[600:]
+        columns = list(a.columns)
+        view = UnionView([UnionView([a, b]), c])
+        assert len(view._parts) == 3, "Nested view not flattened"
+        assert view.columns == columns, "Columns not aligned on their union"
+        assert len(view) == 900, "Rows not counted"
+        assert list(b.columns) == [x for x in columns if x != 'price'], \
+            "Frame altered by the view"
+        expected = union_frames([a, b, c])
+        pd.testing.assert_frame_equal(view.to_frame(), expected)
+        assert view.to_frame() is view.to_frame(), "View materialized twice"
+        pd.testing.assert_series_equal(view.dtypes, expected.dtypes)
+
+        selected = view.select(['price', 'room_type']).where(
+            lambda d: d['room_type'] == 'Private room')
+        rows = expected[expected['room_type'] == 'Private room']
+        frame = selected.to_frame()
+        assert list(frame.columns) == ['price', 'room_type'], "Not projected"
+        assert len(selected) == len(rows) == frame.shape[0], "Not filtered"
+        assert frame['price'].isna().sum() == \
+            rows['price'].isna().sum(), "Absent column not filled"
+
+        chunks = list(view.where('accommodates > 2').iter_chunks(chunksize=50))
+        assert max(chunk.shape[0] for chunk in chunks) <= 50, "Chunks too large"
+        assert sum(chunk.shape[0] for chunk in chunks) == \
+            (expected['accommodates'] > 2).sum(), "Chunks miss rows"
+        assert all(list(chunk.columns) == columns for chunk in chunks), \
+            "Chunk columns not aligned"
+
+    @mark.data
+    @mark.union
+    def test_union_view_dtypes(self):
+        df = make_listings(n=600)
+        a = df.iloc[:200].astype({'room_type': 'category'})
+        b = df.iloc[200:400].drop(columns=['room_type'])
+        c = df.iloc[400:].astype({'room_type': 'category',
+                                  'accommodates': 'float64'})
+        c['room_type'] = c['room_type'].cat.add_categories(['Hotel room'])
+        views = [UnionView([a, b, c]), UnionView([a, c]), UnionView([b, c]),
+                 UnionView([a, df.iloc[400:]]),
+                 UnionView([a, b]).where('accommodates > 2').select(
+                     ['room_type', 'accommodates', 'price'])]
+        for view in views:
+            pd.testing.assert_series_equal(view.dtypes, view.to_frame().dtypes,
+                                           check_names=False)
+
+    @mark.data
+    @mark.union
+    def test_union_frames_inputs(self):
+        a = pd.DataFrame({'id': [1, 2], 'beds': [1, 2]})
+        b = pd.DataFrame({'id': [3], 'baths': [1]})
+        df = union_frames([a, b])
+        assert list(a.columns) == ['id', 'beds'] and list(b.columns) == \
+            ['id', 'baths'], "Input frames altered"
+        expected = pd.concat([a, b], ignore_index=True)
+        pd.testing.assert_frame_equal(df, expected)
+        assert df['beds'].dtype == 'float64', "Absent column not upcast"
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_memo.py                                                      #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 10:48:19 pm                    #
+# Last Modified : Saturday, October 17th 2026, 10:48:19 pm                    #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests memoization of summaries and descriptions."""
+import os
+
+from pytest import mark
+from ...conftest import make_listings
+from ...src.data.cache import ColumnarCache
+from ...src.data.listings import DataGroup, DataSet
+from ...src.utils.memo import Memo
+# --------------------------------------------------------------------------- #
+#                                Test Memo                                    #
+# --------------------------------------------------------------------------- #
+class MemoTests:
+    """Tests Memo class"""
+
+    @mark.utils
+    @mark.memo
+    def test_lru(self):
+        memo = Memo(maxsize=2)
+        for key in ('a', 'b', 'c'):
+            memo.put(key, {'value': key})
+        assert len(memo) == 2, "LRU exceeds its size"
+        assert memo.get('a') is None, "Least recently used result was kept"
+        result = memo.get('b')
+        result['value'] = 'changed'
+        assert memo.get('b') == {'value': 'b'}, "Stored result was mutated"
+
+    @mark.utils
+    @mark.memo
+    def test_disk(self, tmp_path):
+        calls = []
+        compute = lambda: calls.append(1) or {'rows': 10}
+        memo = Memo(directory=str(tmp_path))
+        assert memo(compute, 'fingerprint', 'summarize') == {'rows': 10}
+        other = Memo(directory=str(tmp_path))
+        assert other(compute, 'fingerprint', 'summarize') == {'rows': 10}, \
+            "Result was not read from disk"
+        assert len(calls) == 1, "Result was recomputed in a new session"
+        other.clear(disk=True)
+        assert Memo(directory=str(tmp_path)).get(
+            other.key('fingerprint', 'summarize')) is None, "Disk was not cleared"
+
+    @mark.utils
+    @mark.memo
+    def test_dataset(self):
+        memo = Memo()
+        df = make_listings(n=200)
+        ds = DataSet.from_dataframe(df, 'memo', source='sf_ca_2019-10-14_l.csv',
+                                    memo=memo)
+        first = ds.summarize()
+        assert ds.summarize() == first, "Memoized summary differs"
+        assert memo.hits == 1 and memo.misses == 1, "Summary was recomputed"
+        ds.describe(columns=['price', 'accommodates'])
+        ds.describe(columns=['accommodates'])
+        assert memo.misses == 3, "Descriptions of other columns were reused"
+        changed = df.copy()
+        changed.loc[0, 'bedrooms'] = None
+        other = DataSet.from_dataframe(changed, 'memo', memo=memo,
+                                       source='sf_ca_2019-10-14_l.csv')
+        other.summarize()
+        assert memo.misses == 4, "Summary of changed data was reused"
+        uncached = DataSet.from_dataframe(df, 'memo', memo=False,
+                                          source='sf_ca_2019-10-14_l.csv')
+        assert uncached.summarize() == first, "Summaries differ"
+
+    @mark.utils
+    @mark.memo
+    def test_dataset_mutated(self, tmp_path):
+        memo = Memo()
+        path = os.path.join(str(tmp_path), "sf_ca_2019-10-14_listings.csv")
+        make_listings(n=200).to_csv(path, index=False)
+        ds = DataSet(path, cache=ColumnarCache(os.path.join(str(tmp_path), "cache")),
+                     memo=memo)
+        ds.load()
+        first = ds.summarize()
+        ds.get_data()['host_id'] = None
+        second = ds.summarize()
+        assert memo.hits == 0, "Summary of mutated data was reused"
+        assert second['% Columns with more than 50% Missing Values'] > \
+            first['% Columns with more than 50% Missing Values'], \
+            "Summary reports the data before mutation"
+        assert ds.summarize() == second and memo.hits == 1, \
+            "Summary of unchanged data was recomputed"
+        df = make_listings(n=200)
+        detached = DataSet.from_dataframe(df, 'memo', memo=memo,
+                                          source='sf_ca_2019-10-14_l.csv')
+        first = detached.summarize()
+        df['host_id'] = None
+        assert detached.summarize() != first, \
+            "Summary of mutated DataFrame was reused"
+
+    @mark.utils
+    @mark.memo
+    def test_datagroup(self):
+        memo = Memo()
+        group = DataGroup(name='memo')
+        for i, name in enumerate(['2019-10-14', '2019-11-01']):
+            group.add_dataset(DataSet.from_dataframe(
+                make_listings(n=100, seed=i), name, memo=memo,
+                source='sf_ca_{name}_listings.csv'.format(name=name)))
+        first = group.summarize()
+        second = group.summarize()
+        assert first['data'].equals(second['data']), "Summaries differ"
+        assert memo.hits == 2, "Members were summarized again"
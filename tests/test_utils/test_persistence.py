@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# =========================================================================== #
+# Project : Airbnb                                                            #
+# Version : 0.1.0                                                             #
+# File    : test_persistence.py                                               #
+# Python  : 3.8.1                                                             #
+# --------------------------------------------------------------------------- #
+# Author  : John James                                                        #
+# Company : DecisionScients                                                   #
+# Email   : jjames@decisionscients.com                                        #
+# URL     : https://github.com/decisionscients/airbnb                         #
+# --------------------------------------------------------------------------- #
+# Created       : Saturday, October 17th 2026, 9:41:55 pm                     #
+# Last Modified : Saturday, October 17th 2026, 9:41:55 pm                     #
+# Modified By   : John James (jjames@decisionscients.com>)                    #
+# --------------------------------------------------------------------------- #
+# License : BSD                                                               #
+# Copyright (c) 2020 DecisionScients                                          #
+# =========================================================================== #
+"""Tests object persistence."""
+import bz2
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+from pytest import mark, raises
+from ...conftest import make_listings
+from ...src.data.listings import DataGroup, DataSet
+from ...src.utils.persistence import Persistence, available_codecs, benchmark
+# --------------------------------------------------------------------------- #
+#                           Test Persistence                                  #
+# --------------------------------------------------------------------------- #
+class PersistenceTests:
+    """Tests Persistence class"""
+
+    @mark.utils
+    @mark.persistence
+    def test_round_trip(self, tmp_path):
+        df = make_listings()
+        instance = {'frame': df, 'array': np.arange(300000, dtype=np.float64),
+                    'label': 'listings'}
+        for codec in available_codecs():
+            filename = os.path.join(str(tmp_path), codec + ".pkl")
+            Persistence(codec).serialize(instance, filename)
+            restored = Persistence().deserialize(filename)
+            pd.testing.assert_frame_equal(restored['frame'], df)
+            assert np.array_equal(restored['array'], instance['array']), \
+                "Array not restored by " + codec
+            assert restored['array'].flags.writeable, "Buffer not writeable"
+        with raises(ValueError):
+            Persistence('snappy-ish')
+
+    @mark.utils
+    @mark.persistence
+    def test_legacy_and_datagroup(self, tmp_path):
+        # Files written by earlier versions remain readable.
+        filename = os.path.join(str(tmp_path), "legacy.pkl")
+        with bz2.BZ2File(filename, 'w') as f:
+            pickle.dump({'a': 1}, f)
+        assert Persistence().deserialize(filename) == {'a': 1}, \
+            "Legacy bz2 file not read"
+        group = DataGroup('group')
+        group.add_dataset(DataSet.from_dataframe(make_listings(), 'test'))
+        filename = os.path.join(str(tmp_path), "group.pkl")
+        Persistence().serialize(group, filename)
+        restored = Persistence().deserialize(filename)
+        pd.testing.assert_frame_equal(restored.get_data()['test'].get_data(),
+                                      group.get_data()['test'].get_data())
+
+    @mark.utils
+    @mark.persistence
+    def test_benchmark(self, tmp_path):
+        results = benchmark(np.zeros(100000), codecs=['none', 'gzip'],
+                            directory=str(tmp_path))
+        assert list(results.index) == ['none', 'gzip'], "Codecs not benchmarked"
+        assert results.loc['gzip', 'Size'] < results.loc['none', 'Size'], \
+            "Sizes not measured"